@@ -49,6 +49,7 @@ class Settings:
     enable_15m: bool
     min_payout_15m: float
     min_payout_5m: float
+    ingest_worker: bool = False
 
 
 def load_settings() -> Settings:
@@ -67,4 +68,5 @@ def load_settings() -> Settings:
         enable_15m=_env_bool("ENABLE_15M", True),
         min_payout_15m=_env_float("MIN_PAYOUT_MULT", 1.72, min_value=1.0),
         min_payout_5m=_env_float("MIN_PAYOUT_MULT_5M", 1.75, min_value=1.0),
+        ingest_worker=_env_bool("INGEST_WORKER_ENABLED", False),
     )
@@ -1,4 +1,15 @@
 from .snapshot_store import SnapshotStore
 from .http_service import HttpService
+from .price_ring import PriceRing
+from .kline_series import KlineSeries
+from .depth import DepthSide, depth_imbalance
+from .ofi_window import OfiWindow
+from .clob_book import ClobBook
+from .feed_decoder import FeedDecoder
+from .seqlock import SeqlockTable
+from .tick_filter import TickFilter
+from .score_cache import ScoreCache
+from .resolved_index import ResolvedSampleIndex, SampleAgg
+from .clob_rest import AsyncClobClient
 
-__all__ = ["SnapshotStore", "HttpService"]
+__all__ = ["SnapshotStore", "HttpService", "PriceRing", "KlineSeries", "DepthSide", "depth_imbalance", "OfiWindow", "ClobBook", "FeedDecoder", "SeqlockTable", "TickFilter", "ScoreCache", "ResolvedSampleIndex", "SampleAgg", "AsyncClobClient"]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+
+
+def _level(lv) -> tuple[float, float]:
+    try:
+        if isinstance(lv, dict):
+            p = float(lv.get("price", lv.get("p", 0.0)) or 0.0)
+            s = float(lv.get("size", lv.get("s", lv.get("quantity", 0.0))) or 0.0)
+        elif isinstance(lv, (list, tuple)) and len(lv) >= 2:
+            p = float(lv[0] or 0.0)
+            s = float(lv[1] or 0.0)
+        else:
+            return 0.0, 0.0
+    except (TypeError, ValueError):
+        return 0.0, 0.0
+    return p, s
+
+
+class ClobBook:
+    """Per-token Polymarket book kept as sorted price-level arrays.
+
+    ``book`` snapshots replace the levels; ``price_change`` deltas are applied
+    in place with a bisect insert/update/delete. Both sides are stored in
+    ascending price order (best ask first, best bid last). Until the first
+    snapshot arrives the levels are partial, so best prices fall back to the
+    ``best_*_hint`` fields carried on WS events. ``asks_top`` returns
+    an immutable tuple that is cached until the next ask-side mutation, so
+    repeated readers share one object instead of copying.
+    """
+
+    __slots__ = (
+        "ask_px", "ask_sz", "bid_px", "bid_sz",
+        "ts_ms", "tick", "best_bid_hint", "best_ask_hint", "version", "seeded", "_asks_top",
+    )
+
+    TOP_LEVELS = 20
+
+    def __init__(self, tick: float = 0.01):
+        self.ask_px = array("d")
+        self.ask_sz = array("d")
+        self.bid_px = array("d")
+        self.bid_sz = array("d")
+        self.ts_ms = 0.0
+        self.tick = float(tick or 0.01)
+        self.best_bid_hint = 0.0
+        self.best_ask_hint = 0.0
+        self.version = 0
+        self.seeded = False
+        self._asks_top: tuple[tuple[float, float], ...] | None = None
+
+    @staticmethod
+    def _load_side(px: array, sz: array, levels) -> None:
+        del px[:]
+        del sz[:]
+        for lv in levels:
+            p, s = _level(lv)
+            if p <= 0 or s <= 0:
+                continue
+            i = bisect_left(px, p)
+            if i < len(px) and px[i] == p:
+                sz[i] = s
+            else:
+                px.insert(i, p)
+                sz.insert(i, s)
+
+    def load(self, asks, bids) -> None:
+        """Replace one or both sides from a full snapshot (``None`` keeps a side)."""
+        if asks is not None:
+            self._load_side(self.ask_px, self.ask_sz, asks)
+            self._asks_top = None
+            self.seeded = True
+        if bids is not None:
+            self._load_side(self.bid_px, self.bid_sz, bids)
+        self.version += 1
+
+    def apply(self, is_bid: bool, price: float, size: float) -> None:
+        """Set the aggregate size at one price level; size 0 removes the level."""
+        if price <= 0:
+            return
+        px, sz = (self.bid_px, self.bid_sz) if is_bid else (self.ask_px, self.ask_sz)
+        i = bisect_left(px, price)
+        hit = i < len(px) and px[i] == price
+        if size > 0:
+            if hit:
+                sz[i] = size
+            else:
+                px.insert(i, price)
+                sz.insert(i, size)
+        elif hit:
+            del px[i]
+            del sz[i]
+        if not is_bid:
+            self._asks_top = None
+        self.version += 1
+
+    @property
+    def best_ask(self) -> float:
+        return self.ask_px[0] if (self.seeded and self.ask_px) else self.best_ask_hint
+
+    @property
+    def best_bid(self) -> float:
+        return self.bid_px[-1] if (self.seeded and self.bid_px) else self.best_bid_hint
+
+    def asks_top(self) -> tuple[tuple[float, float], ...]:
+        if not self.seeded:
+            return ()
+        top = self._asks_top
+        if top is None:
+            px, sz = self.ask_px, self.ask_sz
+            top = tuple((px[i], sz[i]) for i in range(min(self.TOP_LEVELS, len(px))))
+            self._asks_top = top
+        return top
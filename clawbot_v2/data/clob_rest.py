@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+import aiohttp
+
+from .http_service import HttpService
+
+
+class BookLevel(NamedTuple):
+    price: str
+    size: str
+
+
+@dataclass
+class BookSummary:
+    """Order book in the shape of py-clob-client's ``OrderBookSummary`` (string prices)."""
+
+    asset_id: str = ""
+    timestamp: str = ""
+    bids: list[BookLevel] = field(default_factory=list)
+    asks: list[BookLevel] = field(default_factory=list)
+    tick_size: str | None = None
+    min_order_size: str | None = None
+
+
+def l2_signature(secret: str, timestamp: int, method: str, path: str, body: str = "") -> str:
+    """HMAC-SHA256 over ``timestamp + method + path + body`` with the url-safe base64 API secret."""
+    key = base64.urlsafe_b64decode(secret)
+    msg = f"{timestamp}{method}{path}{body}".encode()
+    return base64.urlsafe_b64encode(hmac.new(key, msg, hashlib.sha256).digest()).decode()
+
+
+class AsyncClobClient:
+    """Async CLOB REST calls on the shared ``HttpService`` session.
+
+    Covers the calls the trader makes on its hot paths, with the same names
+    and return shapes as py-clob-client so the two are interchangeable.
+    Orders are still built and signed by py-clob-client; only the L2
+    request headers are signed here. Nothing is retried: a repeated
+    ``post_order`` could double-fill. HTTP errors raise ``RuntimeError``
+    carrying the response body, so callers can match exchange messages
+    such as FOK kills.
+    """
+
+    def __init__(
+        self,
+        http: HttpService,
+        *,
+        host: str,
+        address: str,
+        api_key: str,
+        api_secret: str,
+        api_passphrase: str,
+        signature_type: int = 0,
+        timeout: float = 5.0,
+    ):
+        self._http = http
+        self.host = host.rstrip("/")
+        self.address = address
+        self.api_key = api_key
+        self._secret = api_secret
+        self._passphrase = api_passphrase
+        self.signature_type = int(signature_type)
+        self._timeout = aiohttp.ClientTimeout(total=float(timeout))
+
+    def l2_headers(self, method: str, path: str, body: str = "") -> dict[str, str]:
+        ts = int(time.time())
+        return {
+            "POLY_ADDRESS": self.address,
+            "POLY_SIGNATURE": l2_signature(self._secret, ts, method, path, body),
+            "POLY_TIMESTAMP": str(ts),
+            "POLY_API_KEY": self.api_key,
+            "POLY_PASSPHRASE": self._passphrase,
+        }
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None = None,
+        payload: Any = None,
+        auth: bool = True,
+    ) -> Any:
+        # The body is serialized once so the bytes sent are the bytes signed.
+        body = json.dumps(payload) if payload is not None else ""
+        headers = self.l2_headers(method, path, body) if auth else {}
+        if body:
+            headers["Content-Type"] = "application/json"
+        session = await self._http.session()
+        async with session.request(
+            method,
+            self.host + path,
+            params=params,
+            data=body or None,
+            headers=headers,
+            timeout=self._timeout,
+        ) as r:
+            text = await r.text()
+            if r.status >= 400:
+                raise RuntimeError(f"clob {r.status} {method} {path}: {text}")
+            if not text:
+                return None
+            try:
+                return json.loads(text)
+            except ValueError:
+                return text
+
+    async def get_order_book(self, token_id: str) -> BookSummary:
+        raw = await self._request("GET", "/book", params={"token_id": token_id}, auth=False) or {}
+        return BookSummary(
+            asset_id=str(raw.get("asset_id", token_id)),
+            timestamp=str(raw.get("timestamp", "")),
+            bids=[BookLevel(str(lv["price"]), str(lv["size"])) for lv in raw.get("bids") or []],
+            asks=[BookLevel(str(lv["price"]), str(lv["size"])) for lv in raw.get("asks") or []],
+            tick_size=raw.get("tick_size"),
+            min_order_size=raw.get("min_order_size"),
+        )
+
+    async def post_order(self, signed_order: Any, order_type: Any = "GTC") -> dict:
+        order = signed_order.dict() if hasattr(signed_order, "dict") else dict(signed_order)
+        payload = {
+            "order": order,
+            "owner": self.api_key,
+            "orderType": str(getattr(order_type, "value", order_type)),
+        }
+        return await self._request("POST", "/order", payload=payload)
+
+    async def get_order(self, order_id: str) -> dict:
+        return await self._request("GET", f"/data/order/{order_id}")
+
+    async def cancel(self, order_id: str) -> dict:
+        return await self._request("DELETE", "/order", payload={"orderID": order_id})
+
+    async def post_heartbeat(self, heartbeat_id: str = "") -> dict:
+        return await self._request("POST", "/v1/heartbeats", payload={"heartbeat_id": heartbeat_id or ""})
+
+    async def get_notifications(self) -> Any:
+        return await self._request("GET", "/notifications", params={"signature_type": self.signature_type})
+
+    async def drop_notifications(self, ids: list[str] | None = None) -> Any:
+        return await self._request("DELETE", "/notifications", params={"ids": ",".join(ids or [])})
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from array import array
+
+
+class DepthSide:
+    """One side of a Binance partial-depth snapshot, parsed once at ingest.
+
+    Levels live in preallocated ``array('d')`` columns; the top-10 quantity
+    sum and the 1/rank-weighted quantity sum used by the imbalance readers are
+    computed while parsing, so readers never touch the raw string levels.
+    """
+
+    __slots__ = ("levels", "price", "qty", "n", "top10_qty", "rank_w_qty")
+
+    def __init__(self, levels: int = 20):
+        self.levels = max(1, int(levels))
+        self.price = array("d", bytes(8 * self.levels))
+        self.qty = array("d", bytes(8 * self.levels))
+        self.n = 0
+        self.top10_qty = 0.0
+        self.rank_w_qty = 0.0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def load(self, rows) -> None:
+        """Overwrite with ``[[price, qty], ...]`` string/number rows (best level first)."""
+        n = 0
+        top10 = 0.0
+        rank_w = 0.0
+        price, qty = self.price, self.qty
+        for row in rows or ():
+            if n >= self.levels:
+                break
+            try:
+                p = float(row[0])
+                q = float(row[1])
+            except (TypeError, ValueError, IndexError):
+                continue
+            price[n] = p
+            qty[n] = q
+            n += 1
+            if n <= 10:
+                top10 += q
+            rank_w += q / n
+        self.n = n
+        self.top10_qty = top10
+        self.rank_w_qty = rank_w
+
+
+def depth_imbalance(bid: float, ask: float) -> float:
+    total = bid + ask
+    if total == 0:
+        return 0.0
+    return (bid - ask) / total
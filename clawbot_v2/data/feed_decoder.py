@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson as _orjson
+
+    _loads = _orjson.loads
+except ImportError:  # pragma: no cover - orjson is in the runtime image
+    import json as _json
+
+    _loads = _json.loads
+
+
+def buffered_frames(ws) -> int:
+    """Frames already received by the websocket but not yet consumed by ``recv``."""
+    frames = getattr(getattr(ws, "recv_messages", None), "frames", None)  # websockets asyncio API
+    if frames is None:
+        frames = getattr(ws, "messages", None)  # websockets legacy protocol
+    try:
+        return len(frames) if frames is not None else 0
+    except TypeError:
+        return 0
+
+
+class FeedDecoder:
+    """Batch receive, decode and per-topic dispatch for one websocket feed.
+
+    ``pump`` awaits one frame, then drains every frame the socket has already
+    buffered (those ``recv`` calls complete without suspending), decodes each
+    with orjson and routes every event dict to the handler chosen by
+    ``route(event)``; ``None``/unknown keys go to the default handler.
+    Handlers are plain callables run inline.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        route: Callable[[dict], str | None] | None = None,
+        *,
+        max_batch: int = 256,
+    ):
+        self.name = name
+        self._route = route
+        self._handlers: dict[str | None, Callable[[dict], Any]] = {}
+        self.max_batch = max(1, int(max_batch))
+        self.frames = 0
+        self.batches = 0
+        self.events = 0
+        self.decode_errors = 0
+        self.max_batch_seen = 0
+
+    def on(self, topic: str | None, fn: Callable[[dict], Any]) -> FeedDecoder:
+        self._handlers[topic] = fn
+        return self
+
+    def feed(self, raw) -> None:
+        """Decode one frame and dispatch its events."""
+        self.frames += 1
+        try:
+            msg = _loads(raw)
+        except Exception:
+            self.decode_errors += 1  # e.g. plain-text PONG heartbeats
+            return
+        handlers = self._handlers
+        default = handlers.get(None)
+        route = self._route
+        for ev in (msg if isinstance(msg, list) else (msg,)):
+            if not isinstance(ev, dict):
+                continue
+            fn = handlers.get(route(ev), default) if route is not None else default
+            if fn is not None:
+                self.events += 1
+                fn(ev)
+
+    async def pump(self, ws, timeout: float | None = None) -> int:
+        """Receive and dispatch one batch; returns the number of frames handled.
+
+        ``asyncio.TimeoutError`` propagates when no frame arrives within ``timeout``.
+        """
+        if timeout is None:
+            raw = await ws.recv()
+        else:
+            raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        n = 1
+        self.feed(raw)
+        while n < self.max_batch and buffered_frames(ws) > 0:
+            self.feed(await ws.recv())
+            n += 1
+        self.batches += 1
+        if n > self.max_batch_seen:
+            self.max_batch_seen = n
+        return n
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "batches": self.batches,
+            "events": self.events,
+            "decode_errors": self.decode_errors,
+            "max_batch": self.max_batch_seen,
+        }
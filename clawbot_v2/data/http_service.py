@@ -53,6 +53,12 @@ class HttpService:
         if self._session is not None and not self._session.closed:
             await self._session.close()
 
+    async def session(self) -> aiohttp.ClientSession:
+        """The shared keep-alive session, for clients that build their own requests."""
+        await self._ensure_session()
+        assert self._session is not None
+        return self._session
+
     async def _ensure_session(self) -> None:
         if self._session is not None and not self._session.closed:
             return
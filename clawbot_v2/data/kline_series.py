@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+
+_MIN_PER_YEAR = 252 * 24 * 60
+
+
+class KlineSeries:
+    """Parsed 1m kline window with indicators refreshed once per kline message.
+
+    The Binance stream (and the REST seed) push raw kline rows through
+    ``update``/``load``; strings are parsed to float columns once, and every
+    indicator the scorer reads (RSI, Williams %R, variance ratio, autocorr,
+    taker flow, Parkinson vol, VWAP prefix sums) is recomputed in a single pass
+    so readers are plain attribute lookups. ``vwap_dev`` reads one
+    prefix-sum tuple swapped in whole, so it stays consistent while another
+    thread is updating the series.
+    """
+
+    def __init__(self, maxlen: int = 33, *, rsi_period: int = 14, wr_period: int = 14):
+        self.maxlen = max(4, int(maxlen))
+        self.rsi_period = max(1, int(rsi_period))
+        self.wr_period = max(1, int(wr_period))
+        self.open_ms = array("d")
+        self.high = array("d")
+        self.low = array("d")
+        self.close = array("d")
+        self.volume = array("d")
+        self.taker_volume = array("d")
+        self.version = 0
+        self._vwap: tuple[array, array, array, float] = (array("d"), array("d", [0.0]), array("d", [0.0]), 0.0)
+        self._reset_stats()
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def _reset_stats(self) -> None:
+        self.rsi = 50.0
+        self.williams_r = -50.0
+        self.variance_ratio = 1.0
+        self.autocorr = 0.0
+        self.taker_ratio = 0.5
+        self.taker_vol_ratio = 1.0
+        self.vol_mult = 1.0
+        self.parkinson_vol = 0.0
+
+    @staticmethod
+    def _row(k) -> tuple[float, float, float, float, float, float] | None:
+        try:
+            row = (
+                float(k[0] or 0),
+                float(k[2] or 0),
+                float(k[3] or 0),
+                float(k[4] or 0),
+                float(k[5] or 0),
+                float(k[9] or 0),
+            )
+        except (TypeError, ValueError, IndexError):
+            return None
+        return row if row[3] > 0 else None
+
+    def _put(self, row: tuple[float, float, float, float, float, float]) -> None:
+        cols = (self.open_ms, self.high, self.low, self.close, self.volume, self.taker_volume)
+        if self.open_ms and self.open_ms[-1] == row[0]:
+            for col, v in zip(cols, row):
+                col[-1] = v
+            return
+        for col, v in zip(cols, row):
+            col.append(v)
+        if len(self.open_ms) > self.maxlen:
+            for col in cols:
+                del col[0]
+
+    def load(self, rows) -> None:
+        """Replace the window with REST-style kline rows (oldest first)."""
+        for col in (self.open_ms, self.high, self.low, self.close, self.volume, self.taker_volume):
+            del col[:]
+        for k in rows or []:
+            row = self._row(k)
+            if row is not None:
+                self._put(row)
+        self._recompute()
+
+    def update(self, k) -> None:
+        """Apply one kline row: replaces the live bar or appends a new one."""
+        row = self._row(k)
+        if row is None:
+            return
+        self._put(row)
+        self._recompute()
+
+    def trend_ret(self, bars: int = 20) -> float:
+        """Close-to-close return over the last ``bars`` bars (fewer when short)."""
+        c = self.close
+        if len(c) < 2:
+            return 0.0
+        n = min(int(bars), len(c) - 1)
+        c0 = c[-n - 1]
+        return (c[-1] - c0) / c0 if c0 > 0 else 0.0
+
+    def vwap_dev(self, start_ms: float) -> float:
+        """Last close vs VWAP of bars opened at/after ``start_ms`` (last 3 bars if none)."""
+        open_ms, cum_tv, cum_v, last = self._vwap
+        n = len(open_ms)
+        if n < 3:
+            return 0.0
+        i = bisect_left(open_ms, start_ms)
+        if i >= n:
+            i = n - 3
+        sum_v = cum_v[n] - cum_v[i]
+        vwap = (cum_tv[n] - cum_tv[i]) / sum_v if sum_v > 0 else last
+        return (last - vwap) / vwap if vwap > 0 else 0.0
+
+    def _recompute(self) -> None:
+        self.version += 1
+        self._reset_stats()
+        c, h, lo, v, tv = self.close, self.high, self.low, self.volume, self.taker_volume
+        n = len(c)
+        cum_tv = array("d", [0.0])
+        cum_v = array("d", [0.0])
+        for i in range(n):
+            cum_tv.append(cum_tv[-1] + (h[i] + lo[i] + c[i]) / 3.0 * v[i])
+            cum_v.append(cum_v[-1] + v[i])
+        self._vwap = (array("d", self.open_ms), cum_tv, cum_v, c[-1] if n else 0.0)
+        if n == 0:
+            return
+
+        abs_ch = 0.0
+        log_r = []
+        for i in range(1, n):
+            abs_ch += abs(c[i] / c[i - 1] - 1.0)
+            log_r.append(math.log(c[i] / c[i - 1]))
+        if n > 1:
+            ann = abs_ch / (n - 1) * _MIN_PER_YEAR ** 0.5
+            if ann < 0.40:
+                self.vol_mult = 0.7
+            elif ann < 0.80:
+                self.vol_mult = 1.0
+            elif ann < 1.50:
+                self.vol_mult = 1.2
+            else:
+                self.vol_mult = 1.4
+
+        if n >= 4:
+            rec_vol = v[-1] + v[-2] + v[-3]
+            rec_taker = tv[-1] + tv[-2] + tv[-3]
+            hist_avg = (cum_v[n - 3] / (n - 3)) if n > 3 else rec_vol
+            self.taker_ratio = rec_taker / rec_vol if rec_vol > 0 else 0.5
+            self.taker_vol_ratio = (rec_vol / 3) / hist_avg if hist_avg > 0 else 1.0
+
+        p = self.rsi_period
+        if n >= p + 1:
+            start = max(1, n - (p + 1))
+            ag = al = 0.0
+            for i in range(start, n):
+                d = c[i] - c[i - 1]
+                if d > 0:
+                    ag += d
+                else:
+                    al -= d
+            k = n - start
+            ag /= k
+            al /= k
+            if al == 0:
+                self.rsi = 100.0 if ag > 0 else 50.0
+            else:
+                self.rsi = 100.0 - (100.0 / (1.0 + ag / al))
+
+        w = self.wr_period
+        if n >= w:
+            highs = [x for x in h[-w:] if x > 0]
+            lows = [x for x in lo[-w:] if x > 0]
+            if highs and lows:
+                hh = max(highs)
+                ll = min(lows)
+                if hh > ll:
+                    self.williams_r = -100.0 * (hh - c[-1]) / (hh - ll)
+
+        self.autocorr = self._autocorr(c[-32:])
+        self.variance_ratio = self._variance_ratio(c, log_r)
+
+        hl_sq = [math.log(h[i] / lo[i]) ** 2 for i in range(max(0, n - 30), n) if lo[i] > 0 and h[i] > lo[i]]
+        if n >= 5 and hl_sq:
+            park_var = sum(hl_sq) / (4.0 * math.log(2) * len(hl_sq))
+            self.parkinson_vol = math.sqrt(park_var * _MIN_PER_YEAR)
+
+    @staticmethod
+    def _autocorr(closes) -> float:
+        if len(closes) < 5:
+            return 0.0
+        rets = [closes[i] / closes[i - 1] - 1 for i in range(1, len(closes))]
+        mu = sum(rets) / len(rets)
+        dev = [r - mu for r in rets]
+        num = sum(dev[i] * dev[i - 1] for i in range(1, len(dev)))
+        den = sum(d * d for d in dev)
+        return num / den if den > 0 else 0.0
+
+    @staticmethod
+    def _variance_ratio(closes, log_r, q: int = 5) -> float:
+        n = len(closes)
+        if n < q * 4 + 2:
+            return 1.0
+        mu = sum(log_r) / len(log_r)
+        var1 = sum((r - mu) ** 2 for r in log_r) / (len(log_r) - 1)
+        if var1 == 0:
+            return 1.0
+        q_rets = [math.log(closes[i] / closes[i - q]) for i in range(q, n)]
+        varq = sum((r - q * mu) ** 2 for r in q_rets) / ((len(q_rets) - 1) * q)
+        return varq / var1
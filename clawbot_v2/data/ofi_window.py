@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import math
+import time
+from array import array
+
+
+class OfiWindow:
+    """Time-bucketed taker buy/sell accumulator for aggTrade order-flow imbalance.
+
+    Trades are folded into fixed-width buckets holding cumulative buy/sell
+    totals, so the volume inside any trailing window is one prefix-sum
+    difference regardless of trade rate. History is bounded by ``horizon_sec``
+    (not by trade count); ``window`` reports when a request reaches past it.
+    One thread calls ``add``; ``window`` may run on any thread without a
+    lock. ``add`` holds a seqlock counter odd while it rewrites buckets and
+    ``window`` retries until its read saw the same even counter throughout,
+    the same protocol as ``SeqlockTable``.
+    """
+
+    __slots__ = ("bucket_s", "size", "_cum_buy", "_cum_sell", "_buy", "_sell", "_cur", "_first", "_seq", "retries")
+
+    SPIN = 64
+
+    def __init__(self, bucket_ms: float = 100.0, horizon_sec: float = 300.0):
+        self.bucket_s = max(0.001, float(bucket_ms) / 1000.0)
+        self.size = int(math.ceil(max(1.0, float(horizon_sec)) / self.bucket_s)) + 1
+        self._cum_buy = array("d", bytes(8 * self.size))
+        self._cum_sell = array("d", bytes(8 * self.size))
+        self._buy = 0.0
+        self._sell = 0.0
+        self._cur = -1    # bucket index of the newest trade
+        self._first = -1  # bucket index of the oldest trade ever seen
+        self._seq = 0     # odd while add() is writing
+        self.retries = 0
+
+    def __bool__(self) -> bool:
+        return self._cur >= 0
+
+    def _bucket(self, ts: float) -> int:
+        return int(ts // self.bucket_s)
+
+    def add(self, ts: float, is_buy: bool, qty: float) -> None:
+        self._seq += 1
+        try:
+            self._add(ts, is_buy, qty)
+        finally:
+            self._seq += 1
+
+    def _add(self, ts: float, is_buy: bool, qty: float) -> None:
+        b = self._bucket(ts)
+        if self._cur < 0:
+            self._first = self._cur = b
+        elif b > self._cur:
+            # Carry totals through the idle buckets still inside the ring.
+            for x in range(max(self._cur + 1, b - self.size + 1), b):
+                i = x % self.size
+                self._cum_buy[i] = self._buy
+                self._cum_sell[i] = self._sell
+            self._cur = b
+        # Late trades (b < cur) are attributed to the newest bucket.
+        if is_buy:
+            self._buy += qty
+        else:
+            self._sell += qty
+        i = self._cur % self.size
+        self._cum_buy[i] = self._buy
+        self._cum_sell[i] = self._sell
+
+    def window(self, window_sec: float, now: float) -> tuple[float, float, bool]:
+        """(buy_qty, sell_qty, covered) over the trailing ``window_sec`` ending at ``now``.
+
+        ``covered`` is False when the window starts before retained history
+        (ring horizon exceeded, or the stream started inside the window); the
+        sums then cover only what is retained.
+        """
+        spins = 0
+        while True:
+            s = self._seq
+            if not s & 1:
+                out = self._window(window_sec, now)
+                if self._seq == s:
+                    return out
+            self.retries += 1
+            spins += 1
+            if spins % self.SPIN == 0:
+                time.sleep(0)  # let a preempted writer finish
+
+    def _window(self, window_sec: float, now: float) -> tuple[float, float, bool]:
+        if self._cur < 0:
+            return 0.0, 0.0, False
+        x = self._bucket(now - window_sec) - 1  # last bucket before the window
+        if x >= self._cur:
+            return 0.0, 0.0, True
+        oldest = max(self._first, self._cur - self.size + 1)
+        if x >= oldest:
+            i = x % self.size
+            return self._buy - self._cum_buy[i], self._sell - self._cum_sell[i], True
+        if oldest == self._first:
+            # Nothing evicted yet: the window only reaches back past stream start.
+            return self._buy, self._sell, x >= self._first - 1
+        i = oldest % self.size
+        return self._buy - self._cum_buy[i], self._sell - self._cum_sell[i], False
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+
+class PriceRing:
+    """Fixed-capacity (ts, price) ring with O(log n) time-window lookups.
+
+    Samples are written twice (slot ``i`` and ``i + cap``) so the live window is
+    always one contiguous slice of the backing arrays; ``bisect`` then runs on the
+    raw ``array('d')`` columns without copying. A running sum of squared
+    tick-to-tick returns is stored alongside, so window tick-vol is O(1).
+    """
+
+    __slots__ = ("maxlen", "_ts", "_px", "_r2", "_head", "_n")
+
+    def __init__(self, maxlen: int = 300):
+        self.maxlen = max(2, int(maxlen))
+        size = 2 * self.maxlen
+        self._ts = array("d", bytes(8 * size))
+        self._px = array("d", bytes(8 * size))
+        self._r2 = array("d", bytes(8 * size))  # cumulative sum of squared returns
+        self._head = 0  # next write slot in [0, maxlen)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def _span(self) -> tuple[int, int]:
+        hi = self._head + self.maxlen
+        return hi - self._n, hi
+
+    def append(self, ts: float, price: float) -> None:
+        ts = float(ts)
+        price = float(price)
+        if self._n:
+            last = self._head + self.maxlen - 1
+            prev_ts = self._ts[last]
+            prev_px = self._px[last]
+            if ts < prev_ts:
+                ts = prev_ts  # keep the ts column sorted under clock jitter
+            r = (price / prev_px - 1.0) if prev_px > 0 else 0.0
+            cum = self._r2[last] + r * r
+        else:
+            cum = 0.0
+        i = self._head
+        j = i + self.maxlen
+        self._ts[i] = self._ts[j] = ts
+        self._px[i] = self._px[j] = price
+        self._r2[i] = self._r2[j] = cum
+        self._head = (i + 1) % self.maxlen
+        if self._n < self.maxlen:
+            self._n += 1
+
+    def clear(self) -> None:
+        self._head = 0
+        self._n = 0
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        lo, hi = self._span()
+        ts, px = self._ts, self._px
+        for i in range(lo, hi):
+            yield ts[i], px[i]
+
+    def __getitem__(self, idx: int) -> tuple[float, float]:
+        if idx < 0:
+            idx += self._n
+        if idx < 0 or idx >= self._n:
+            raise IndexError("PriceRing index out of range")
+        i = self._span()[0] + idx
+        return self._ts[i], self._px[i]
+
+    def last_ts(self) -> float:
+        if not self._n:
+            return 0.0
+        return self._ts[self._head + self.maxlen - 1]
+
+    def tail(self, n: int) -> list[tuple[float, float]]:
+        lo, hi = self._span()
+        lo = max(lo, hi - max(0, int(n)))
+        return [(self._ts[i], self._px[i]) for i in range(lo, hi)]
+
+    def since(self, t0: float) -> Iterator[tuple[float, float]]:
+        lo, hi = self._span()
+        ts, px = self._ts, self._px
+        for i in range(bisect_left(ts, t0, lo, hi), hi):
+            yield ts[i], px[i]
+
+    def bounds(self, t0: float, t1: float, *, closed: bool = True) -> tuple[int, int]:
+        """Raw slot range ``[lo, hi)`` of samples with ``t0 <= ts <= t1`` (``< t1`` if not closed)."""
+        lo, hi = self._span()
+        a = bisect_left(self._ts, t0, lo, hi)
+        b = (bisect_right if closed else bisect_left)(self._ts, t1, a, hi)
+        return a, b
+
+    def price_at(self, slot: int) -> float:
+        return self._px[slot]
+
+    def first_in(self, t0: float, t1: float) -> float:
+        """Price of the oldest sample in ``[t0, t1]``; 0.0 if the window is empty."""
+        a, b = self.bounds(t0, t1)
+        return self._px[a] if b > a else 0.0
+
+    def last_in(self, t0: float, t1: float) -> float:
+        """Price of the newest sample in ``[t0, t1]``; 0.0 if the window is empty."""
+        a, b = self.bounds(t0, t1)
+        return self._px[b - 1] if b > a else 0.0
+
+    def tick_rms(self, a: int, b: int) -> tuple[float, int]:
+        """RMS of tick-to-tick returns between consecutive samples inside slot range ``[a, b)``."""
+        n = b - a - 1
+        if n <= 0:
+            return 0.0, 0
+        ss = self._r2[b - 1] - self._r2[a]
+        return (max(0.0, ss) / n) ** 0.5, n
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from typing import NamedTuple
+
+# (asset, duration, side, entry_band, source_ok)
+SampleKey = tuple[str, int, str, str, bool]
+
+_N, _WINS, _PNL, _GW, _GL, _NW, _NL = range(7)
+
+
+class SampleAgg(NamedTuple):
+    n: int = 0
+    wins: int = 0
+    pnl: float = 0.0
+    gross_win: float = 0.0
+    gross_loss: float = 0.0
+
+    @property
+    def exp(self) -> float:
+        return self.pnl / max(1, self.n)
+
+    @property
+    def pf(self) -> float:
+        if self.gross_loss > 0:
+            return self.gross_win / self.gross_loss
+        return 2.0 if self.gross_win > 0 else 1.0
+
+
+_EMPTY = SampleAgg()
+_ALL = object()
+
+
+class _Window:
+    __slots__ = ("name", "groups", "last_n", "max_age_s", "per_group", "agg", "members")
+
+    def __init__(self, name, groups, last_n, max_age_s, per_group):
+        self.name = name
+        self.groups = groups
+        self.last_n = last_n
+        self.max_age_s = max_age_s
+        self.per_group = per_group
+        self.agg: dict[Hashable, list] = {}
+        # Sequence numbers in the window: one deque per group key when the
+        # count limit is per group, else a single deque for the whole window.
+        self.members: dict[Hashable, deque] | deque = {} if per_group else deque()
+
+
+class ResolvedSampleIndex:
+    """Settled outcomes in columnar ring arrays with windowed aggregates.
+
+    Every sample carries a ``SampleKey``. A window maps that key through one
+    or more group functions and keeps count, wins, pnl and gross win/loss per
+    group, updated as samples enter and leave it, so a prior lookup is a dict
+    read instead of a filter over the raw samples. ``last_n`` bounds a window
+    to the newest samples overall, or per group with ``per_group=True``,
+    and never past what the ring still holds;
+    ``max_age_s`` drops samples older than that at lookup time. Windows
+    added after samples were recorded are filled from the ring.
+    """
+
+    def __init__(self, maxlen: int = 2000):
+        self.maxlen = max(1, int(maxlen))
+        self.ts = array("d", bytes(8 * self.maxlen))
+        self.pnl = array("d", bytes(8 * self.maxlen))
+        self.won = bytearray(self.maxlen)
+        self.key_id = array("l", bytes(array("l").itemsize * self.maxlen))
+        self._keys: list[SampleKey] = []
+        self._key_ids: dict[SampleKey, int] = {}
+        self._windows: dict[str, _Window] = {}
+        self.head = 0  # sequence number of the next sample
+
+    def __len__(self) -> int:
+        return min(self.head, self.maxlen)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._windows
+
+    def add_window(
+        self,
+        name: str,
+        groups: Iterable[Callable[[SampleKey], Hashable]],
+        *,
+        last_n: int = 0,
+        max_age_s: float = 0.0,
+        per_group: bool = False,
+    ) -> None:
+        n = int(last_n)
+        w = _Window(name, tuple(groups), min(n, self.maxlen) if n > 0 else self.maxlen, float(max_age_s), per_group)
+        self._windows[name] = w
+        for seq in range(max(0, self.head - self.maxlen), self.head):
+            self._admit(w, seq)
+
+    def add(self, key: SampleKey, ts: float, pnl: float, won: bool) -> None:
+        kid = self._key_ids.get(key)
+        if kid is None:
+            kid = self._key_ids[key] = len(self._keys)
+            self._keys.append(key)
+        seq = self.head
+        i = seq % self.maxlen
+        if seq >= self.maxlen:
+            self._evict(seq - self.maxlen)
+        self.ts[i] = ts
+        self.pnl[i] = pnl
+        self.won[i] = 1 if won else 0
+        self.key_id[i] = kid
+        self.head = seq + 1
+        for w in self._windows.values():
+            self._admit(w, seq)
+
+    def get(self, window: str, group: Hashable, now: float | None = None) -> SampleAgg:
+        w = self._windows[window]
+        if now is not None and w.max_age_s > 0:
+            cutoff = now - w.max_age_s
+            if w.per_group:
+                self._expire(w, w.members.get(group), cutoff, group)
+            else:
+                self._expire(w, w.members, cutoff)
+        a = w.agg.get(group)
+        if a is None or a[_N] <= 0:
+            return _EMPTY
+        return SampleAgg(a[_N], a[_WINS], a[_PNL], a[_GW], a[_GL])
+
+    def _evict(self, seq: int) -> None:
+        # The sample in this slot is about to be overwritten. Windows with a
+        # global count limit have already dropped it, but a per-group window
+        # keeps quiet groups' samples past maxlen, so drop it there too.
+        key = self._keys[self.key_id[seq % self.maxlen]]
+        for w in self._windows.values():
+            if w.per_group:
+                for g in w.groups:
+                    gk = g(key)
+                    dq = w.members.get(gk)
+                    if dq and dq[0] == seq:
+                        self._apply(w, dq.popleft(), -1, gk)
+            else:
+                dq = w.members
+                if dq and dq[0] == seq:
+                    self._apply(w, dq.popleft(), -1)
+
+    def _admit(self, w: _Window, seq: int) -> None:
+        i = seq % self.maxlen
+        key = self._keys[self.key_id[i]]
+        cutoff = self.ts[i] - w.max_age_s if w.max_age_s > 0 else None
+        if w.per_group:
+            for g in w.groups:
+                gk = g(key)
+                dq = w.members.get(gk)
+                if dq is None:
+                    dq = w.members[gk] = deque()
+                while len(dq) >= w.last_n:
+                    self._apply(w, dq.popleft(), -1, gk)
+                if cutoff is not None:
+                    self._expire(w, dq, cutoff, gk)
+                dq.append(seq)
+                self._apply(w, seq, 1, gk)
+        else:
+            dq = w.members
+            while len(dq) >= w.last_n:
+                self._apply(w, dq.popleft(), -1)
+            if cutoff is not None:
+                self._expire(w, dq, cutoff)
+            dq.append(seq)
+            self._apply(w, seq, 1)
+
+    def _expire(self, w: _Window, dq: deque | None, cutoff: float, gk: Hashable = _ALL) -> None:
+        if not dq:
+            return
+        ts = self.ts
+        m = self.maxlen
+        while dq and ts[dq[0] % m] < cutoff:
+            self._apply(w, dq.popleft(), -1, gk)
+
+    def _apply(self, w: _Window, seq: int, sign: int, gk: Hashable = _ALL) -> None:
+        i = seq % self.maxlen
+        pnl = self.pnl[i]
+        won = self.won[i]
+        if gk is _ALL:
+            key = self._keys[self.key_id[i]]
+            gks = [g(key) for g in w.groups]
+        else:
+            gks = (gk,)
+        for k in gks:
+            a = w.agg.get(k)
+            if a is None:
+                a = w.agg[k] = [0, 0, 0.0, 0.0, 0.0, 0, 0]
+            a[_N] += sign
+            a[_WINS] += sign * won
+            a[_PNL] += sign * pnl
+            if pnl > 0:
+                a[_GW] += sign * pnl
+                a[_NW] += sign
+            elif pnl < 0:
+                a[_GL] -= sign * pnl
+                a[_NL] += sign
+            # Reset sums exactly once their last contributor leaves, so
+            # float drift can't turn an empty side into a tiny denominator.
+            if a[_N] == 0:
+                a[_PNL] = 0.0
+            if a[_NW] == 0:
+                a[_GW] = 0.0
+            if a[_NL] == 0:
+                a[_GL] = 0.0
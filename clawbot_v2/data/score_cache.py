@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISS = object()
+
+
+class ScoreCache:
+    """Bounded LRU of scoring results keyed by the versions of their inputs.
+
+    Callers build the key from every input the result depends on (book
+    versions, feature version, copyflow/priors versions, market fields), so
+    any change produces a new key and a stale entry is simply never hit again;
+    it ages out through LRU eviction. ``ttl`` still bounds how long one entry
+    may be served. ``get`` returns the ``MISS`` sentinel when the key is absent
+    or expired, since ``None`` is a valid cached result.
+    """
+
+    MISS = _MISS
+
+    def __init__(self, maxsize: int = 5000, ttl: float = 0.9):
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = float(ttl)
+        self._items: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable, now: float) -> Any:
+        item = self._items.get(key)
+        if item is None or now - item[0] >= self.ttl:
+            self.misses += 1
+            return _MISS
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def put(self, key: Hashable, value: Any, now: float) -> None:
+        items = self._items
+        items[key] = (now, value)
+        items.move_to_end(key)
+        while len(items) > self.maxsize:
+            items.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._items),
+            "evictions": self.evictions,
+        }
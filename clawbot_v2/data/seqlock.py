@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+from array import array
+from collections import namedtuple
+from collections.abc import Iterable, Mapping, Sequence
+from multiprocessing import shared_memory
+
+_HEADER = 8  # uint64 sequence counter
+
+
+class SeqlockTable:
+    """Single-writer table of float64 records published under a seqlock.
+
+    One writer (e.g. the ingest worker thread) calls ``publish``; any number
+    of readers call ``read`` without taking a lock: the sequence counter is
+    odd while a write is in flight, and a reader retries until it copies a
+    record with the same even counter before and after. With ``shm_name``
+    the table lives in ``multiprocessing.shared_memory`` so another process
+    can attach to it (``create=False``) with the same fields and keys.
+    """
+
+    SPIN = 64
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        keys: Iterable[str],
+        *,
+        defaults: Mapping[str, float] | None = None,
+        shm_name: str | None = None,
+        create: bool = True,
+    ):
+        self.fields = tuple(fields)
+        self.keys = tuple(keys)
+        self.Record = namedtuple("Record", self.fields)
+        self._width = len(self.fields)
+        self._row = {k: i * self._width for i, k in enumerate(self.keys)}
+        size = _HEADER + 8 * self._width * len(self.keys)
+        self._shm = None
+        if shm_name is not None:
+            self._shm = shared_memory.SharedMemory(name=shm_name, create=create, size=size if create else 0)
+            buf = self._shm.buf
+        else:
+            buf = bytearray(size)
+        mv = memoryview(buf)
+        self._seq = mv[:_HEADER].cast("Q")
+        self._data = mv[_HEADER:size].cast("d")
+        d = defaults or {}
+        self.default = self.Record(*(float(d.get(f, 0.0)) for f in self.fields))
+        self.retries = 0
+        if create:
+            self._seq[0] = 0
+            for k in self.keys:
+                self.publish(k, self.default)
+
+    @property
+    def seq(self) -> int:
+        return self._seq[0]
+
+    def publish(self, key: str, values: Sequence[float]) -> None:
+        """Write a full record; ``values`` follow ``fields`` order."""
+        o = self._row[key]
+        row = array("d", values)
+        seq = self._seq
+        seq[0] += 1
+        self._data[o:o + self._width] = row
+        seq[0] += 1
+
+    def read(self, key: str):
+        """Consistent copy of one record; unknown keys return ``default``."""
+        o = self._row.get(key)
+        if o is None:
+            return self.default
+        seq, data, end = self._seq, self._data, o + self._width
+        spins = 0
+        while True:
+            s = seq[0]
+            if not s & 1:
+                vals = data[o:end].tolist()
+                if seq[0] == s:
+                    return self.Record(*vals)
+            self.retries += 1
+            spins += 1
+            if spins % self.SPIN == 0:
+                time.sleep(0)  # let a preempted writer finish
+
+    def close(self, unlink: bool = False) -> None:
+        if self._shm is None:
+            return
+        self._seq.release()
+        self._data.release()
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+        self._shm = None
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+
+_SEC_PER_YEAR_SQRT = math.sqrt(252 * 24 * 3600)
+_exp = math.exp
+
+
+class TickFilter:
+    """Time-decayed EMAs and a constant-velocity Kalman filter for every asset.
+
+    State lives in flat ``array('d')`` columns indexed by asset slot: EMAs are
+    ``[asset * n_half_lives + j]``, the Kalman terms (position, velocity and
+    the p00/p01/p11 covariance entries) one column each. Half-life reciprocals
+    are precomputed, so a tick is one pass over the slot with no dict lookups.
+    ``update_batch`` applies a burst of ticks for one asset with the same
+    result as calling ``update`` for each.
+    """
+
+    def __init__(self, assets: Iterable[str], half_lives: Sequence[float] = (5, 15, 30, 60, 120)):
+        self.assets = tuple(assets)
+        self.index = {a: i for i, a in enumerate(self.assets)}
+        self.half_lives = tuple(half_lives)
+        self._inv_hl = tuple(1.0 / float(hl) for hl in self.half_lives)
+        self._hl_slot = {hl: j for j, hl in enumerate(self.half_lives)}
+        n, h = len(self.assets), len(self.half_lives)
+        self.ema = array("d", bytes(8 * n * h))
+        self.ts = array("d", bytes(8 * n))
+        self.pos = array("d", bytes(8 * n))
+        self.vel = array("d", bytes(8 * n))
+        self.p00 = array("d", [1.0] * n)
+        self.p01 = array("d", bytes(8 * n))
+        self.p11 = array("d", [1.0] * n)
+        self.ready = bytearray(n)
+
+    def nearest_half_life(self, seconds: float) -> float:
+        return min(self.half_lives, key=lambda hl: abs(hl - seconds))
+
+    def ema_of(self, asset: str, half_life: float, default: float = 0.0) -> float:
+        i = self.index.get(asset)
+        if i is None:
+            return default
+        return self.ema[i * len(self.half_lives) + self._hl_slot[half_life]]
+
+    def last_ts(self, asset: str) -> float:
+        i = self.index.get(asset)
+        return self.ts[i] if i is not None else 0.0
+
+    def kalman_state(self, asset: str) -> tuple[float, float] | None:
+        """(position, velocity per second) once the filter has seen a tick, else None."""
+        i = self.index.get(asset)
+        if i is None or not self.ready[i]:
+            return None
+        return self.pos[i], self.vel[i]
+
+    def update(self, i: int, price: float, ts: float, vol: float) -> None:
+        """Apply one tick for asset slot ``i``; ``vol`` is the asset's annualised vol."""
+        dt = ts - self.ts[i]
+        self.ts[i] = ts
+        ema = self.ema
+        h = len(self._inv_hl)
+        base = i * h
+        if ema[base] == 0.0:
+            for j in range(base, base + h):
+                ema[j] = price  # seed on first tick
+        elif dt > 0:
+            for j, inv in enumerate(self._inv_hl, base):
+                prev = ema[j]
+                ema[j] = prev + (1.0 - _exp(-dt * inv)) * (price - prev)
+        self._kalman(i, price, dt, vol)
+
+    def update_batch(self, i: int, ticks: Iterable[tuple[float, float]], vol: float) -> None:
+        """Apply ``(ts, price)`` ticks for asset slot ``i`` in order."""
+        ema = self.ema
+        inv_hl = self._inv_hl
+        h = len(inv_hl)
+        base = i * h
+        end = base + h
+        last = self.ts[i]
+        for ts, price in ticks:
+            dt = ts - last
+            last = ts
+            if ema[base] == 0.0:
+                for j in range(base, end):
+                    ema[j] = price
+            elif dt > 0:
+                for j, inv in enumerate(inv_hl, base):
+                    prev = ema[j]
+                    ema[j] = prev + (1.0 - _exp(-dt * inv)) * (price - prev)
+            self._kalman(i, price, dt, vol)
+        self.ts[i] = last
+
+    def _kalman(self, i: int, price: float, dt: float, vol: float) -> None:
+        if not self.ready[i]:
+            self.pos[i] = price
+            self.vel[i] = 0.0
+            self.p00[i] = 1.0
+            self.p01[i] = 0.0
+            self.p11[i] = 0.01
+            self.ready[i] = 1
+            return
+        # Process noise tuned to asset volatility
+        q_pos = (vol * price / _SEC_PER_YEAR_SQRT) ** 2
+        q_vel = q_pos * 0.01
+        r_obs = (vol * price * 0.001) ** 2
+        p00, p01, p11 = self.p00[i], self.p01[i], self.p11[i]
+        # Predict
+        pos_p = self.pos[i] + self.vel[i] * dt
+        vel_p = self.vel[i]
+        p00_p = p00 + dt * p01 + dt * dt * p11 + q_pos
+        p01_p = p01 + dt * p11
+        p11_p = p11 + q_vel
+        # Update
+        innov = price - pos_p
+        s_inv = 1.0 / (p00_p + r_obs)
+        k0 = p00_p * s_inv
+        k1 = p01_p * s_inv
+        self.pos[i] = pos_p + k0 * innov
+        self.vel[i] = vel_p + k1 * innov
+        self.p00[i] = (1.0 - k0) * p00_p
+        self.p01[i] = (1.0 - k0) * p01_p
+        self.p11[i] = p11_p - k1 * p01_p
@@ -35,15 +35,39 @@ import threading
 import random
 import traceback
 import time as _time
-from collections import deque, defaultdict
+from types import MappingProxyType
+from collections import OrderedDict, deque, defaultdict
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from scipy.stats import norm
 from dotenv import load_dotenv
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 from eth_account import Account
-from clawbot_v2.data import HttpService
+from clawbot_v2.data import (
+    ClobBook,
+    DepthSide,
+    FeedDecoder,
+    HttpService,
+    AsyncClobClient,
+    KlineSeries,
+    OfiWindow,
+    PriceRing,
+    ResolvedSampleIndex,
+    ScoreCache,
+    SeqlockTable,
+    TickFilter,
+    depth_imbalance,
+)
+from clawbot_v2.strategy.features import AssetFeatures, FeatureSnapshot, asset_versions, scoring_signature
+from clawbot_v2.strategy.kernel import ScoringConfig, ScoringInputs, ScoringKernel
+from clawbot_v2.strategy.numerics import ncdf
+from clawbot_v2.infra.latency import LatencyHistogram
+from clawbot_v2.infra.skip_counters import SkipCounters
+from clawbot_v2.execution.order_tracker import OrderTracker, stream_user_channel
+from clawbot_v2.execution.presign import PresignCache
+from clawbot_v2.runtime.eval_queue import EvalQueue
+from clawbot_v2.runtime.eval_scheduler import EvalScheduler
+from clawbot_v2.runtime.executors import ExecutorLanes
 try:
     from prediction_agent import PredictionAgent
 except ModuleNotFoundError:
@@ -408,7 +432,18 @@ CHAINLINK_ABI = [
 CL_ANSWER_UPDATED_TOPIC = "0x0559884fd3a460db3073b7fc896cc77986f16e378210ded43186175bf646fc5f"
 SCAN_INTERVAL  = float(os.environ.get("SCAN_INTERVAL", "0.5"))
 SCORE_DEBOUNCE_SEC = float(os.environ.get("SCORE_DEBOUNCE_SEC", "0.9"))
-RTDS_EVAL_MIN_INTERVAL_SEC = float(os.environ.get("RTDS_EVAL_MIN_INTERVAL_SEC", "1.0"))
+SCORE_CACHE_MAX = int(os.environ.get("SCORE_CACHE_MAX", "5000"))
+# Event-driven scoring: scan passes wake on market-change events (see EvalScheduler);
+# SCAN_INTERVAL remains the cadence of REST-backed upkeep (resolve, open prices, copyflow file).
+EVAL_PRICE_MOVE_BPS = float(os.environ.get("EVAL_PRICE_MOVE_BPS", "2.0"))  # RTDS move that re-scores an asset's markets
+EVAL_COALESCE_SEC = float(os.environ.get("EVAL_COALESCE_SEC", "0.05"))  # burst window before a woken pass runs
+EVAL_MAX_BATCH = int(os.environ.get("EVAL_MAX_BATCH", "32"))  # most urgent requests scored per pass; the rest wait
+EVAL_SWEEP_SEC = float(os.environ.get("EVAL_SWEEP_SEC", "5.0"))  # re-score markets without events at least this often
+EVAL_MAX_INFLIGHT = int(os.environ.get("EVAL_MAX_INFLIGHT", "8"))  # concurrent _score_market runs (book/REST pressure)
+EVAL_MAX_KEYS = int(os.environ.get("EVAL_MAX_KEYS", "256"))  # distinct markets queued or running before new ones are dropped
+EVAL_CLOSE_MILESTONES_MIN = tuple(
+    float(s) for s in os.environ.get("EVAL_CLOSE_MILESTONES_MIN", "5,3,2,1.5").split(",") if s.strip()
+)
 MARKET_REFRESH_SEC = float(os.environ.get("MARKET_REFRESH_SEC", "30.0"))  # how often to re-fetch Gamma API (was every 0.5s = 600 req/min!)
 PING_INTERVAL  = int(os.environ.get("PING_INTERVAL", "5"))
 RTDS_RECV_TIMEOUT_SEC = float(os.environ.get("RTDS_RECV_TIMEOUT_SEC", "20.0"))
@@ -486,6 +521,7 @@ LOG_EDGE_EVERY_SEC = int(os.environ.get("LOG_EDGE_EVERY_SEC", "60"))
 LOG_EXEC_EVERY_SEC = int(os.environ.get("LOG_EXEC_EVERY_SEC", "60"))
 SKIP_STATS_WINDOW_SEC = int(os.environ.get("SKIP_STATS_WINDOW_SEC", "900"))
 SKIP_STATS_TOP_N = int(os.environ.get("SKIP_STATS_TOP_N", "6"))
+SKIP_STATS_BUCKET_SEC = float(os.environ.get("SKIP_STATS_BUCKET_SEC", "10"))
 WS_HEALTH_REQUIRED = os.environ.get("WS_HEALTH_REQUIRED", "true").lower() == "true"
 WS_HEALTH_MIN_FRESH_RATIO = float(os.environ.get("WS_HEALTH_MIN_FRESH_RATIO", "0.50"))
 WS_HEALTH_MAX_MED_AGE_MS = float(os.environ.get("WS_HEALTH_MAX_MED_AGE_MS", "7000"))
@@ -517,8 +553,14 @@ BOOK_CACHE_MAX = int(os.environ.get("BOOK_CACHE_MAX", "256"))
 BOOK_FETCH_CONCURRENCY = int(os.environ.get("BOOK_FETCH_CONCURRENCY", "16"))
 CLOB_HEARTBEAT_SEC = float(os.environ.get("CLOB_HEARTBEAT_SEC", "6"))
 USER_EVENTS_ENABLED = os.environ.get("USER_EVENTS_ENABLED", "true").lower() == "true"
+# Book/order/status/heartbeat/notification calls over the shared aiohttp session instead of
+# py-clob-client's blocking requests in a thread; signing stays in py-clob-client.
+# Off until its L2 headers and order payloads are validated against the exchange.
+CLOB_ASYNC_REST_ENABLED = os.environ.get("CLOB_ASYNC_REST_ENABLED", "false").lower() == "true"
 USER_EVENTS_POLL_SEC = float(os.environ.get("USER_EVENTS_POLL_SEC", "0.8"))
 USER_EVENTS_CACHE_TTL_SEC = float(os.environ.get("USER_EVENTS_CACHE_TTL_SEC", "180"))
+# Authenticated user WS channel: pushes order/trade events; notification polling only runs while it is down.
+CLOB_USER_WS_ENABLED = os.environ.get("CLOB_USER_WS_ENABLED", "true").lower() == "true"
 CLOB_MARKET_WS_ENABLED = os.environ.get("CLOB_MARKET_WS_ENABLED", "true").lower() == "true"
 CLOB_MARKET_WS_SYNC_SEC = float(os.environ.get("CLOB_MARKET_WS_SYNC_SEC", "2.0"))
 CLOB_MARKET_WS_MAX_AGE_MS = float(os.environ.get("CLOB_MARKET_WS_MAX_AGE_MS", "8000"))
@@ -658,6 +700,11 @@ FAST_TAKER_EDGE_DIFF_MAX = float(os.environ.get("FAST_TAKER_EDGE_DIFF_MAX", "0.0
 FAST_TAKER_EARLY_WINDOW_SEC_5M = float(os.environ.get("FAST_TAKER_EARLY_WINDOW_SEC_5M", "45"))
 FAST_TAKER_EARLY_WINDOW_SEC_15M = float(os.environ.get("FAST_TAKER_EARLY_WINDOW_SEC_15M", "75"))
 FAST_FOK_MIN_DEPTH_RATIO = float(os.environ.get("FAST_FOK_MIN_DEPTH_RATIO", "1.00"))
+# Depth-aware split: when top-of-book cannot take the whole FOK, fire child FOKs sized from the
+# ask levels under the slippage cap instead of kill -> refetch -> maker fallback.
+SPLIT_FOK_ENABLED = os.environ.get("SPLIT_FOK_ENABLED", "true").lower() == "true"
+SPLIT_FOK_MAX_CHILDREN = int(os.environ.get("SPLIT_FOK_MAX_CHILDREN", "4"))
+SPLIT_FOK_MIN_FILL_RATIO = float(os.environ.get("SPLIT_FOK_MIN_FILL_RATIO", "0.60"))  # min planned/size to split
 EXEC_SPEED_PRIORITY_ENABLED = os.environ.get("EXEC_SPEED_PRIORITY_ENABLED", "true").lower() == "true"
 FAST_TAKER_SPEED_SCORE_5M = int(os.environ.get("FAST_TAKER_SPEED_SCORE_5M", "9"))
 FAST_TAKER_SPEED_SCORE_15M = int(os.environ.get("FAST_TAKER_SPEED_SCORE_15M", "10"))
@@ -665,6 +712,17 @@ FAST_PATH_MAX_BOOK_AGE_MS = float(os.environ.get("FAST_PATH_MAX_BOOK_AGE_MS", "1
 MAX_MAKER_HOLD_5M_SEC = float(os.environ.get("MAX_MAKER_HOLD_5M_SEC", "0.28"))
 MAX_MAKER_HOLD_15M_SEC = float(os.environ.get("MAX_MAKER_HOLD_15M_SEC", "0.42"))
 ORDER_LATENCY_LOG_ENABLED = os.environ.get("ORDER_LATENCY_LOG_ENABLED", "true").lower() == "true"
+# Pre-signed FOK templates: armed signals sign a small price ladder ahead of the fire path.
+PRESIGN_ENABLED = os.environ.get("PRESIGN_ENABLED", "true").lower() == "true"
+PRESIGN_TTL_SEC = float(os.environ.get("PRESIGN_TTL_SEC", "20"))
+PRESIGN_LADDER_TICKS = int(os.environ.get("PRESIGN_LADDER_TICKS", "1"))  # ticks either side of best ask
+# Blocking client calls run on per-latency-class thread pools (see ExecutorLanes).
+EXEC_ORDER_WORKERS = int(os.environ.get("EXEC_ORDER_WORKERS", "4"))  # started at boot: no thread spin-up on first fill
+EXEC_PRESIGN_WORKERS = int(os.environ.get("EXEC_PRESIGN_WORKERS", "2"))
+EXEC_BOOK_WORKERS = int(os.environ.get("EXEC_BOOK_WORKERS", "8"))
+EXEC_CHAIN_WORKERS = int(os.environ.get("EXEC_CHAIN_WORKERS", "4"))
+EXEC_BACKGROUND_WORKERS = int(os.environ.get("EXEC_BACKGROUND_WORKERS", "4"))
+EXEC_DEFAULT_WORKERS = int(os.environ.get("EXEC_DEFAULT_WORKERS", "4"))  # loop default: DNS, to_thread
 MAX_TAKER_SLIP_BPS_5M = float(os.environ.get("MAX_TAKER_SLIP_BPS_5M", "80"))
 MAX_TAKER_SLIP_BPS_15M = float(os.environ.get("MAX_TAKER_SLIP_BPS_15M", "70"))
 MAX_BOOK_SPREAD_5M = float(os.environ.get("MAX_BOOK_SPREAD_5M", "0.060"))
@@ -1059,6 +1117,8 @@ CORR_KELLY_ENABLED       = os.environ.get("CORR_KELLY_ENABLED", "1") not in ("0"
 # Real-time OFI: rolling window for aggTrade stream (seconds)
 AGG_OFI_WINDOW_SEC       = float(os.environ.get("AGG_OFI_WINDOW_SEC", "30.0"))
 AGG_OFI_BLEND_W          = float(os.environ.get("AGG_OFI_BLEND_W", "0.60"))  # weight of aggOFI vs kline taker
+AGG_OFI_BUCKET_MS        = float(os.environ.get("AGG_OFI_BUCKET_MS", "100"))    # aggTrade OFI bucket width
+AGG_OFI_HORIZON_SEC      = float(os.environ.get("AGG_OFI_HORIZON_SEC", "300"))  # retained OFI history per asset
 # Window-open OFI surge: when round just started and OFI is extreme → bonus score + prob boost
 OFI_SURGE_ENABLED        = os.environ.get("OFI_SURGE_ENABLED", "true").lower() == "true"
 OFI_SURGE_PCT_MIN        = float(os.environ.get("OFI_SURGE_PCT_MIN", "0.78"))    # ≥78% window remaining (first ~3.5 min of 15m)
@@ -1147,10 +1207,21 @@ if ENABLE_5M:
 GAMMA = "https://gamma-api.polymarket.com"
 RTDS  = "wss://ws-live-data.polymarket.com"
 CLOB_MARKET_WSS = os.environ.get("CLOB_MARKET_WSS", "wss://ws-subscriptions-clob.polymarket.com/ws/market")
+CLOB_USER_WSS = os.environ.get("CLOB_USER_WSS", "wss://ws-subscriptions-clob.polymarket.com/ws/user")
 
 # Binance symbols per asset (spot + futures share same symbol)
 BNB_SYM = {info["asset"]: info["asset"].lower() + "usdt" for info in SERIES.values()}
 # e.g. {"BTC": "btcusdt", "ETH": "ethusdt", ...}
+_RTDS_SYM_MAP = {"btcusdt": "BTC", "ethusdt": "ETH", "solusdt": "SOL", "xrpusdt": "XRP"}
+# Per-asset Binance state published by the feed handlers (possibly on the ingest worker thread)
+_BNB_SNAP_FIELDS = (
+    "ts", "bids_n", "asks_n", "bid_top10", "ask_top10", "bid_rank_w", "ask_rank_w",
+    "mark", "index", "funding",
+    "klines_n", "rsi", "williams_r", "variance_ratio", "autocorr",
+    "taker_ratio", "taker_vol_ratio", "vol_mult", "parkinson_vol", "trend_ret20",
+)
+_BNB_SNAP_DEFAULTS = {"rsi": 50.0, "williams_r": -50.0, "variance_ratio": 1.0,
+                      "taker_ratio": 0.5, "taker_vol_ratio": 1.0, "vol_mult": 1.0}
 
 G="\033[92m"; R="\033[91m"; Y="\033[93m"; B="\033[94m"; W="\033[97m"; RS="\033[0m"
 
@@ -1275,11 +1346,14 @@ class LiveTrader:
         self.vols        = {"BTC": 0.65, "ETH": 0.80, "SOL": 1.20, "XRP": 0.90}
         # Binance WS cache — populated by _stream_binance_* loops, read by _binance_* helpers
         self.binance_cache = {
-            a: {"depth_bids": [], "depth_asks": [], "klines": [],
+            a: {"depth_bids": DepthSide(20), "depth_asks": DepthSide(20),
+                "klines": KlineSeries(maxlen=33, rsi_period=RSI_PERIOD, wr_period=WR_PERIOD),
                 "mark": 0.0, "index": 0.0, "funding": 0.0,
-                "agg_ofi_buf": deque(maxlen=2000)}  # (ts_float, buy_qty) for rolling OFI
+                "agg_ofi": OfiWindow(AGG_OFI_BUCKET_MS, AGG_OFI_HORIZON_SEC)}  # bucketed taker buy/sell for rolling OFI
             for a in BNB_SYM
         }
+        # Lock-free view of binance_cache for the trading side; written only via _publish_binance
+        self._bnb_snap = SeqlockTable(_BNB_SNAP_FIELDS, BNB_SYM, defaults=_BNB_SNAP_DEFAULTS)
         self.open_prices        = {}   # cid → float price
         self.open_prices_source = {}   # cid → "CL-exact" | "CL-fallback"
         self._mkt_log_ts        = {}   # cid → last [MKT] log time
@@ -1294,6 +1368,8 @@ class LiveTrader:
         self.asset_cur_open     = {}   # asset → current market open price (for inter-market continuity)
         self.asset_prev_open    = {}   # asset → previous market open price
         self.active_mkts = {}
+        self._token_mkt_index   = {}   # token_id -> (cid, is_up) for active_mkts
+        self._asset_cids        = {}   # asset -> (cid, ...) for active_mkts
         self.pending         = {}   # cid → (m, trade)
         self.pending_redeem  = {}   # cid → (side, asset)  — waiting on-chain resolution
         self.redeemed_cids   = set()  # cids already processed — prevents _redeemable_scan re-queueing
@@ -1335,7 +1411,8 @@ class LiveTrader:
         self._book_cache     = {}     # token_id -> {"ts_ms": float, "book": OrderBook}
         self._book_sem       = asyncio.Semaphore(max(1, BOOK_FETCH_CONCURRENCY))
         self._clob_market_ws = None
-        self._clob_ws_books  = {}     # token_id -> {"ts_ms": float, "best_bid": float, "best_ask": float, "tick": float, "asks": [(p,s)]}
+        self._feed_decoders  = {}     # feed name -> FeedDecoder (batch/frame counters)
+        self._clob_ws_books  = OrderedDict()  # token_id -> ClobBook (LRU order, newest last)
         self._clob_ws_assets_subscribed = set()
         # Token ids queued for immediate market-WS subscribe (e.g. newly discovered rounds).
         self._clob_ws_pending_subs = set()
@@ -1382,6 +1459,13 @@ class LiveTrader:
         self.start_time      = datetime.now(timezone.utc)
         self.rtds_ok         = False
         self.clob            = None
+        self._clob_rest      = None   # AsyncClobClient once API creds are known
+        self._clob_creds     = None
+        self._order_tracker  = OrderTracker(ttl_sec=USER_EVENTS_CACHE_TTL_SEC)
+        self._lanes = ExecutorLanes(
+            order=EXEC_ORDER_WORKERS, presign=EXEC_PRESIGN_WORKERS, book=EXEC_BOOK_WORKERS,
+            chain=EXEC_CHAIN_WORKERS, background=EXEC_BACKGROUND_WORKERS, default=EXEC_DEFAULT_WORKERS,
+        )
         self.w3              = None   # shared Polygon RPC connection
         self._rpc_url        = ""
         self._rpc_epoch      = 0
@@ -1389,18 +1473,32 @@ class LiveTrader:
         self._perf_stats     = {
             "score_ms_ema": 0.0, "score_n": 0,
             "order_ms_ema": 0.0, "order_n": 0,
+            "agg_ofi_short_n": 0,
         }
         # ── Adaptive strategy state ──────────────────────────────────────────
-        self.price_history   = {a: deque(maxlen=300) for a in ["BTC","ETH","SOL","XRP"]}
+        self.price_history   = {a: PriceRing(maxlen=300) for a in ["BTC","ETH","SOL","XRP"]}
+        self._feature_version = 0      # FeatureSnapshot.version of the last build
+        self._feature_sig = {}         # asset -> (signature, version) for FeatureSnapshot.asset_versions
+        self._scoring_kernel = ScoringKernel(ScoringConfig.from_constants(globals()))
         self._price_cache_last_persist_ts = 0.0
         self.stats           = {}    # {asset: {side: {wins, total}}} — persisted
         self.recent_trades   = deque(maxlen=30)   # rolling window for WR adaptation
         self.recent_pnl      = deque(maxlen=40)   # rolling pnl window for profit-factor/expectancy adaptation
-        self._resolved_samples = deque(maxlen=2000)  # rolling settled outcomes for 15m calibration
+        self._resolved_index = self._new_resolved_index()  # rolling settled outcomes for priors/calibration
         self._pm_pattern_stats = {}
         self.side_perf       = {}                 # "ASSET|SIDE" -> {n, gross_win, gross_loss, pnl}
-        self._last_eval_time    = {}              # cid → last RTDS-triggered evaluate() timestamp
-        self._score_cache_by_key = {}             # cid -> {"ts","fp","sig"}
+        self._last_eval_time    = {}              # cid → last time the scan loop scored it
+        self._eval_sched = EvalScheduler(coalesce_sec=EVAL_COALESCE_SEC)
+        self._eval_queue = EvalQueue(limit=EVAL_MAX_INFLIGHT, max_keys=EVAL_MAX_KEYS)
+        self._eval_edge = {}                      # cid → edge of its last signal (drain priority)
+        self._eval_px_ref = {}                    # asset → RTDS price at its last "price" request
+        self._scan_housekeep_ts = 0.0
+        self._score_cache = ScoreCache(maxsize=SCORE_CACHE_MAX, ttl=SCORE_DEBOUNCE_SEC)
+        self._copyflow_version = 0                # bumped on every copyflow map/live update
+        self._priors_version = 0                  # bumped when resolved samples / side_perf change
+        self._presign = PresignCache(ttl_sec=PRESIGN_TTL_SEC, band=0.01 * max(1, PRESIGN_LADDER_TICKS))
+        self._order_lat = {"sign": LatencyHistogram(), "post": LatencyHistogram()}
+        self._presign_tasks = set()
         self._exec_lock         = asyncio.Lock()
         self._executing_cids    = set()
         self._reserved_bankroll = 0.0             # sum of in-flight trade sizes (race guard)
@@ -1436,7 +1534,7 @@ class LiveTrader:
         self._copyflow_cid_on_demand_ts = {}
         self._ws_stale_hits = 0
         self._ws_last_heal_ts = 0.0
-        self._skip_events = deque(maxlen=8000)  # (ts, reason)
+        self._skip_counts = SkipCounters(SKIP_STATS_BUCKET_SEC, max(900, SKIP_STATS_WINDOW_SEC))
         self._cid_family_cache  = {}
         self._cid_market_cache  = {}
         self._prebid_plan       = {}
@@ -1464,12 +1562,8 @@ class LiveTrader:
             except Exception:
                 self._pred_agent = None
         # ── Mathematical signal state (EMA + Kalman) ──────────────────────────
-        _EMA_HLS = (5, 15, 30, 60, 120)
-        self.emas    = {a: {hl: 0.0 for hl in _EMA_HLS} for a in ["BTC","ETH","SOL","XRP"]}
-        self._ema_ts = {a: 0.0 for a in ["BTC","ETH","SOL","XRP"]}
-        # Kalman: constant-velocity model; state = [price, velocity]; P = 2×2 cov
-        self.kalman  = {a: {"pos":0.0,"vel":0.0,"p00":1.0,"p01":0.0,"p11":1.0,"rdy":False}
-                        for a in ["BTC","ETH","SOL","XRP"]}
+        # EMAs at 5/15/30/60/120s half-lives + constant-velocity Kalman (state = [price, velocity])
+        self._ticks = TickFilter(["BTC","ETH","SOL","XRP"], half_lives=(5, 15, 30, 60, 120))
         self._init_log()
         self._init_metrics_db()
         self._load_autopilot_policy()
@@ -1539,34 +1633,12 @@ class LiveTrader:
 
     def _skip_tick(self, reason: str):
         try:
-            self._skip_events.append((_time.time(), str(reason or "unknown")))
+            self._skip_counts.tick(str(reason or "unknown"))
         except Exception:
             pass
 
     def _skip_top(self, window_sec: int = SKIP_STATS_WINDOW_SEC, top_n: int = SKIP_STATS_TOP_N):
-        now = _time.time()
-        while self._skip_events:
-            head = self._skip_events[0]
-            if isinstance(head, (tuple, list)):
-                ts = float(head[0] or 0.0) if len(head) >= 1 else 0.0
-            elif isinstance(head, (int, float)):
-                ts = float(head)
-            else:
-                ts = 0.0
-            if (now - ts) > max(60, int(window_sec)):
-                self._skip_events.popleft()
-                continue
-            break
-        counts = defaultdict(int)
-        for ev in self._skip_events:
-            if isinstance(ev, (tuple, list)) and len(ev) >= 2:
-                reason = str(ev[1] or "unknown")
-            else:
-                reason = "unknown"
-            counts[reason] += 1
-        total = sum(counts.values())
-        top = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[: max(1, int(top_n))]
-        return total, top
+        return self._skip_counts.top(max(60, int(window_sec)), top_n)
 
     def _feed_health_snapshot(self):
         now = _time.time()
@@ -1617,7 +1689,7 @@ class LiveTrader:
 
         rtds_ages = []
         for a in ("BTC", "ETH", "SOL", "XRP"):
-            ts = float(self._ema_ts.get(a, 0.0) or 0.0)
+            ts = self._ticks.last_ts(a)
             if ts > 0:
                 rtds_ages.append(now - ts)
         rtds_med = sorted(rtds_ages)[len(rtds_ages) // 2] if rtds_ages else 9e9
@@ -1629,6 +1701,13 @@ class LiveTrader:
                 cl_ages.append(now - ts)
         cl_med = sorted(cl_ages)[len(cl_ages) // 2] if cl_ages else 9e9
 
+        bnb_ages = []
+        for a in BNB_SYM:
+            ts = self._bnb(a).ts
+            if ts > 0:
+                bnb_ages.append(now - ts)
+        bnb_med = sorted(bnb_ages)[len(bnb_ages) // 2] if bnb_ages else 9e9
+
         return {
             "active_tokens": active_tokens,
             "fresh_books": fresh_books,
@@ -1641,6 +1720,7 @@ class LiveTrader:
             "leader_med_s": leader_med,
             "rtds_med_s": rtds_med,
             "cl_med_s": cl_med,
+            "bnb_med_s": bnb_med,
         }
 
     def _ws_trade_gate_ok(self):
@@ -2129,6 +2209,22 @@ class LiveTrader:
             st = "live"
         return str(oid or ""), st, filled_size
 
+    async def _clob_call(self, name: str, *args, lane=None):
+        """CLOB REST call by py-clob-client method name: async adapter if enabled, else the sync client on ``lane``."""
+        if self._clob_rest is not None:
+            return await getattr(self._clob_rest, name)(*args)
+        fn = getattr(self.clob, name)
+        return await asyncio.get_running_loop().run_in_executor(lane or self._lanes.order, lambda: fn(*args))
+
+    def _install_executors(self) -> None:
+        """Make the small ``default`` lane the loop's default executor.
+
+        Stray run_in_executor(None, ...) calls (e.g. NonceManager) and the
+        loop's own getaddrinfo/to_thread work then land there, never on the
+        order path, behind redeem bursts, or on an unbounded default pool.
+        """
+        asyncio.get_running_loop().set_default_executor(self._lanes.default)
+
     async def _get_order_book(self, token_id: str, force_fresh: bool = False):
         """Low-latency orderbook fetch with tiny TTL cache to avoid duplicate roundtrips."""
         if not token_id:
@@ -2138,14 +2234,13 @@ class LiveTrader:
             cached = self._book_cache.get(token_id)
             if cached and (now_ms - float(cached.get("ts_ms", 0.0))) <= BOOK_CACHE_TTL_MS:
                 return cached.get("book")
-        loop = asyncio.get_running_loop()
         async with self._book_sem:
             if not force_fresh:
                 now_ms = _time.time() * 1000.0
                 cached = self._book_cache.get(token_id)
                 if cached and (now_ms - float(cached.get("ts_ms", 0.0))) <= BOOK_CACHE_TTL_MS:
                     return cached.get("book")
-            book = await loop.run_in_executor(None, lambda: self.clob.get_order_book(token_id))
+            book = await self._clob_call("get_order_book", token_id, lane=self._lanes.book)
             self._book_cache[token_id] = {"ts_ms": _time.time() * 1000.0, "book": book}
             if len(self._book_cache) > max(16, BOOK_CACHE_MAX):
                 # Evict oldest entries to cap memory/lookup overhead.
@@ -2176,6 +2271,10 @@ class LiveTrader:
             leaders = payload.get("leaders", [])
             if isinstance(market_flow, dict):
                 self._copyflow_map = market_flow
+                self._copyflow_version += 1
+                for cid in self.active_mkts:
+                    if cid in self.open_prices:
+                        self._request_eval(cid, "copyflow")
                 if isinstance(leaders, list):
                     lw = {}
                     for row in leaders:
@@ -2726,6 +2825,8 @@ class LiveTrader:
             s = up + down
             if s <= 0:
                 continue
+            self._copyflow_version += 1
+            self._request_eval(cid, "copyflow")
             self._copyflow_live[cid] = {
                 "Up": round(up / s, 4),
                 "Down": round(down / s, 4),
@@ -2923,6 +3024,8 @@ class LiveTrader:
         if s <= 0:
             self._copyflow_live_zero_streak += 1
             return 0
+        self._copyflow_version += 1
+        self._request_eval(cid, "copyflow")
         self._copyflow_live[cid] = {
             "Up": round(up / s, 4),
             "Down": round(down / s, 4),
@@ -3080,153 +3183,72 @@ class LiveTrader:
     # ── Mathematical signal helpers ───────────────────────────────────────────
 
     def _tick_update(self, asset: str, price: float, ts: float) -> None:
-        """Called on every RTDS price tick — updates time-based EMAs and Kalman filter."""
-        import math as _m
-        ema_dict = self.emas.get(asset)
-        if ema_dict is None:
-            return
-        dt = ts - self._ema_ts.get(asset, ts)
-        self._ema_ts[asset] = ts
-        for hl, prev in list(ema_dict.items()):
-            if prev == 0.0:
-                ema_dict[hl] = price   # seed on first tick
-            else:
-                alpha = 1.0 - _m.exp(-dt / hl) if dt > 0 else 0.0
-                ema_dict[hl] = prev + alpha * (price - prev)
-        # Constant-velocity Kalman filter (predict + update)
-        k = self.kalman.get(asset)
-        if k is None:
-            return
-        if not k["rdy"]:
-            k["pos"] = price; k["vel"] = 0.0
-            k["p00"] = 1.0;   k["p01"] = 0.0; k["p11"] = 0.01
-            k["rdy"] = True
-            return
-        # Process noise (tune to asset volatility)
-        q_pos = (self.vols.get(asset, 0.7) * price / _m.sqrt(252*24*3600)) ** 2
-        q_vel = q_pos * 0.01
-        r_obs = (self.vols.get(asset, 0.7) * price * 0.001) ** 2
-        # Predict
-        pos_p = k["pos"] + k["vel"] * dt
-        vel_p = k["vel"]
-        p00_p = k["p00"] + dt*(k["p01"]+k["p10"] if "p10" in k else k["p01"]) + dt*dt*k["p11"] + q_pos
-        p01_p = k["p01"] + dt * k["p11"]
-        p11_p = k["p11"] + q_vel
-        # Update
-        innov  = price - pos_p
-        s_inv  = 1.0 / (p00_p + r_obs)
-        k0     = p00_p * s_inv
-        k1     = p01_p * s_inv
-        k["pos"] = pos_p + k0 * innov
-        k["vel"] = vel_p + k1 * innov
-        k["p00"] = (1.0 - k0) * p00_p
-        k["p01"] = (1.0 - k0) * p01_p
-        k["p11"] = p11_p - k1 * p01_p
+        """Called on every RTDS/Chainlink price tick — updates time-based EMAs and Kalman filter."""
+        i = self._ticks.index.get(asset)
+        if i is not None:
+            self._ticks.update(i, price, ts, self.vols.get(asset, 0.7))
+
+    def _tick_update_batch(self, asset: str, ticks: list) -> None:
+        """Same as _tick_update for each (ts, price) in ticks, in one pass."""
+        i = self._ticks.index.get(asset)
+        if i is not None:
+            self._ticks.update_batch(i, ticks, self.vols.get(asset, 0.7))
 
     def _price_hist_last_ts(self, asset: str) -> float:
-        """Safe last timestamp from price_history across legacy/new entry formats."""
+        """Last tick timestamp from price_history; 0.0 when the asset has no ticks."""
         ph = self.price_history.get(asset)
-        if not ph:
-            return 0.0
-        last = ph[-1]
-        if isinstance(last, (tuple, list)):
-            return float(last[0] or 0.0) if len(last) >= 1 else 0.0
-        if isinstance(last, (int, float)):
-            return float(last)
-        return 0.0
+        return ph.last_ts() if ph else 0.0
 
     def _kalman_vel_prob(self, asset: str) -> float:
         """P(Up) from Kalman-estimated velocity; 0.5 if filter not yet ready."""
-        import math as _m
-        k = self.kalman.get(asset, {})
-        if not k.get("rdy") or k.get("pos", 0) == 0:
+        k = self._ticks.kalman_state(asset)
+        if k is None or k[0] == 0:
             return 0.5
-        price   = k["pos"]
-        vel     = k["vel"]
-        per_sec = max(self.vols.get(asset, 0.7) * price / _m.sqrt(252*24*3600), 1e-10)
+        price, vel = k
+        per_sec = max(self.vols.get(asset, 0.7) * price / math.sqrt(252*24*3600), 1e-10)
         z       = vel / per_sec
-        return float(norm.cdf(z * 10))
+        return ncdf(z * 10)
 
     def _ob_depth_weighted(self, asset: str) -> float:
         """Depth-weighted OB imbalance: 1/rank weighting on top-20 levels."""
-        c    = self.binance_cache.get(asset, {})
-        bids = c.get("depth_bids", [])
-        asks = c.get("depth_asks", [])
-        bid_w = sum(float(b[1]) / (i + 1) for i, b in enumerate(bids[:20]))
-        ask_w = sum(float(a[1]) / (i + 1) for i, a in enumerate(asks[:20]))
-        if bid_w + ask_w == 0:
-            return 0.0
-        return (bid_w - ask_w) / (bid_w + ask_w)
-
-    def _autocorr_regime(self, asset: str, lags: int = 1) -> float:
+        r = self._bnb(asset)
+        return depth_imbalance(r.bid_rank_w, r.ask_rank_w)
+
+    def _klines(self, asset: str):
+        """KlineSeries for asset (None for unknown assets)."""
+        return self.binance_cache.get(asset, {}).get("klines")
+
+    def _bnb(self, asset: str):
+        """Consistent snapshot record of asset's Binance state (defaults for unknown assets)."""
+        return self._bnb_snap.read(asset)
+
+    def _publish_binance(self, asset: str) -> None:
+        """Publish asset's binance_cache state; called by the feed that just mutated it."""
+        c = self.binance_cache[asset]
+        bids, asks, ks = c["depth_bids"], c["depth_asks"], c["klines"]
+        self._bnb_snap.publish(asset, (
+            _time.time(), bids.n, asks.n, bids.top10_qty, asks.top10_qty, bids.rank_w_qty, asks.rank_w_qty,
+            c["mark"], c["index"], c["funding"],
+            len(ks), ks.rsi, ks.williams_r, ks.variance_ratio, ks.autocorr,
+            ks.taker_ratio, ks.taker_vol_ratio, ks.vol_mult, ks.parkinson_vol, ks.trend_ret(20),
+        ))
+
+    def _autocorr_regime(self, asset: str) -> float:
         """Lag-1 autocorrelation of 1m returns from klines cache.
         Positive = trending; negative = mean-reverting."""
-        klines = self.binance_cache.get(asset, {}).get("klines", [])
-        closes = [float(k[4]) for k in klines[-32:] if float(k[4]) > 0]
-        if len(closes) < 5:
-            return 0.0
-        rets = [closes[i] / closes[i-1] - 1 for i in range(1, len(closes))]
-        if len(rets) < 4:
-            return 0.0
-        mu   = sum(rets) / len(rets)
-        dev  = [r - mu for r in rets]
-        num  = sum(dev[i] * dev[i - lags] for i in range(lags, len(dev)))
-        den  = sum(d * d for d in dev)
-        return num / den if den > 0 else 0.0
+        return self._bnb(asset).autocorr
 
-    def _variance_ratio(self, asset: str, q: int = 5) -> float:
+    def _variance_ratio(self, asset: str) -> float:
         """Lo-MacKinlay variance ratio test (q=5). VR>1=trending, VR<1=mean-reverting."""
-        klines = self.binance_cache.get(asset, {}).get("klines", [])
-        closes = [float(k[4]) for k in klines if float(k[4]) > 0]
-        n      = len(closes)
-        if n < q * 4 + 2:
-            return 1.0
-        log_p = [math.log(closes[i] / closes[i-1]) for i in range(1, n)]
-        mu    = sum(log_p) / len(log_p)
-        var1  = sum((r - mu) ** 2 for r in log_p) / (len(log_p) - 1)
-        if var1 == 0:
-            return 1.0
-        # q-period returns
-        q_rets = [math.log(closes[i] / closes[i-q]) for i in range(q, n)]
-        varq   = sum((r - q * mu) ** 2 for r in q_rets) / ((len(q_rets) - 1) * q)
-        return varq / var1
+        return self._bnb(asset).variance_ratio
 
     def _rsi(self, asset: str) -> float:
         """RSI from 1m klines closes. Returns neutral 50.0 if insufficient data."""
-        n = RSI_PERIOD
-        klines = self.binance_cache.get(asset, {}).get("klines", [])
-        closes = [float(k[4]) for k in klines[-(n + 2):] if float(k[4]) > 0]
-        if len(closes) < n + 1:
-            return 50.0
-        gains, losses = [], []
-        for i in range(1, len(closes)):
-            d = closes[i] - closes[i - 1]
-            gains.append(max(d, 0.0))
-            losses.append(max(-d, 0.0))
-        ag = sum(gains) / len(gains)
-        al = sum(losses) / len(losses)
-        if al == 0:
-            return 100.0 if ag > 0 else 50.0
-        rs = ag / al
-        return 100.0 - (100.0 / (1.0 + rs))
+        return self._bnb(asset).rsi
 
     def _williams_r(self, asset: str) -> float:
         """Williams %R from 1m klines. Range -100 to 0. Returns -50 if insufficient."""
-        n = WR_PERIOD
-        klines = self.binance_cache.get(asset, {}).get("klines", [])
-        if len(klines) < n:
-            return -50.0
-        recent = klines[-n:]
-        highs = [float(k[2]) for k in recent if float(k[2]) > 0]
-        lows  = [float(k[3]) for k in recent if float(k[3]) > 0]
-        close = float(klines[-1][4]) if klines else 0.0
-        if not highs or not lows or close <= 0:
-            return -50.0
-        hh = max(highs)
-        ll = min(lows)
-        if hh <= ll:
-            return -50.0
-        return -100.0 * (hh - close) / (hh - ll)
+        return self._bnb(asset).williams_r
 
     def _jump_detect(self, asset: str) -> tuple:
         """Z-score of last 10s move vs baseline tick vol.
@@ -3235,18 +3257,16 @@ class LiveTrader:
         if not hist or len(hist) < 5:
             return False, None, 0.0
         now    = _time.time()
-        recent = [(ts, p) for ts, p in hist if ts >= now - 10]
-        base   = [(ts, p) for ts, p in hist if now - 60 <= ts < now - 10]
-        if len(recent) < 2 or len(base) < 5:
+        r_lo, r_hi = hist.bounds(now - 10, float("inf"))
+        b_lo, b_hi = hist.bounds(now - 60, now - 10, closed=False)
+        if (r_hi - r_lo) < 2 or (b_hi - b_lo) < 5:
             return False, None, 0.0
-        p0, p1 = recent[0][1], recent[-1][1]
+        p0, p1 = hist.price_at(r_lo), hist.price_at(r_hi - 1)
         move_10s = (p1 - p0) / p0 if p0 > 0 else 0.0
         # baseline vol from tick-to-tick moves
-        bt = list(base)
-        tick_moves = [abs(bt[i][1]/bt[i-1][1]-1) for i in range(1, len(bt)) if bt[i-1][1] > 0]
-        if not tick_moves:
+        sigma, n_moves = hist.tick_rms(b_lo, b_hi)
+        if not n_moves:
             return False, None, 0.0
-        sigma = (sum(m*m for m in tick_moves) / len(tick_moves)) ** 0.5
         if sigma == 0:
             return False, None, 0.0
         z = move_10s / sigma
@@ -3264,11 +3284,11 @@ class LiveTrader:
             return 0.5
         now = _time.time()
         # BTC move from 60s ago to 30s ago (lagged window)
-        p60  = [(ts, p) for ts, p in hist_btc if now - 65 <= ts <= now - 55]
-        p30  = [(ts, p) for ts, p in hist_btc if now - 35 <= ts <= now - 25]
-        if not p60 or not p30:
+        p60  = hist_btc.last_in(now - 65, now - 55)
+        p30  = hist_btc.last_in(now - 35, now - 25)
+        if p60 <= 0 or p30 <= 0:
             return 0.5
-        btc_lag_move = (p30[-1][1] - p60[-1][1]) / p60[-1][1] if p60[-1][1] > 0 else 0.0
+        btc_lag_move = (p30 - p60) / p60
         vol_btc = self.vols.get("BTC", 0.65)
         vol_t   = vol_btc * math.sqrt(30 / (252 * 24 * 3600))
         if vol_t == 0:
@@ -3276,7 +3296,7 @@ class LiveTrader:
         # Per-asset empirical BTC→altcoin lag correlation (from 15m co-window analysis)
         _btc_lag_corr = {"ETH": 0.82, "SOL": 0.80, "XRP": 0.78}
         corr = _btc_lag_corr.get(asset, 0.77)
-        return float(norm.cdf(btc_lag_move / vol_t * corr))
+        return ncdf(btc_lag_move / vol_t * corr)
 
     def _init_metrics_db(self):
         try:
@@ -3430,7 +3450,7 @@ class LiveTrader:
                 "cl_updated": {k: float(v or 0.0) for k, v in (self.cl_updated or {}).items()},
                 "open_prices": {str(k): float(v or 0.0) for k, v in (self.open_prices or {}).items()},
                 "price_history": {
-                    a: [[float(ts), float(px)] for ts, px in list(ph)[-max(20, PRICE_CACHE_POINTS):] if px > 0]
+                    a: [[float(ts), float(px)] for ts, px in ph.tail(max(20, PRICE_CACHE_POINTS)) if px > 0]
                     for a, ph in (self.price_history or {}).items()
                 },
             }
@@ -3477,14 +3497,14 @@ class LiveTrader:
                         continue
                     if not isinstance(pts, list):
                         continue
-                    q = deque(maxlen=max(20, PRICE_CACHE_POINTS))
+                    q = PriceRing(maxlen=max(20, PRICE_CACHE_POINTS))
                     for p in pts[-max(20, PRICE_CACHE_POINTS):]:
                         if not isinstance(p, (list, tuple)) or len(p) < 2:
                             continue
                         ts = float(p[0] or 0.0)
                         px = float(p[1] or 0.0)
                         if ts > 0 and px > 0:
-                            q.append((ts, px))
+                            q.append(ts, px)
                     if q:
                         self.price_history[a] = q
             self._price_cache_last_persist_ts = _time.time()
@@ -3699,6 +3719,18 @@ class LiveTrader:
         except Exception as e:
             print(f"{R}[CLOB] Creds error: {e}{RS}")
             raise RuntimeError("CLOB authentication failed (invalid/missing key or API creds)") from e
+        self._clob_creds = creds
+        self._order_tracker.owner = creds.api_key
+        if CLOB_ASYNC_REST_ENABLED:
+            self._clob_rest = AsyncClobClient(
+                self._http_service,
+                host=CLOB_HOST,
+                address=self.clob.get_address() or ADDRESS,
+                api_key=creds.api_key,
+                api_secret=creds.api_secret,
+                api_passphrase=creds.api_passphrase,
+                signature_type=0,
+            )
 
         # Sync USDC (COLLATERAL) allowance with Polymarket backend
         # CONDITIONAL not needed — bot only places BUY orders (USDC→tokens)
@@ -3854,6 +3886,9 @@ class LiveTrader:
             print(
                 f"  {B}Perf:{RS} score_ema={self._perf_stats.get('score_ms_ema', 0.0):.0f}ms "
                 f"order_ema={self._perf_stats.get('order_ms_ema', 0.0):.0f}ms "
+                f"score_cache={self._score_cache.stats()['hit_rate']*100:.0f}% "
+                f"evals={self._eval_sched.drained} coalesced={self._eval_sched.coalesced} "
+                f"evq_peak={self._eval_queue.peak_inflight} evq_dropped={self._eval_queue.dropped} "
                 f"{B}RPC:{RS} {self._rpc_url} ({rpc_ms:.0f}ms)"
             )
         if show_debug and self._bucket_stats.rows:
@@ -4327,70 +4362,14 @@ class LiveTrader:
                     pinger_task = asyncio.create_task(pinger())
                     self._rtds_ping_task = pinger_task
 
+                    feed = self._feed_decoder("rtds", self._rtds_route)
+                    feed.on("market", self._rtds_on_market).on("crypto", self._rtds_on_crypto)
                     while True:
                         try:
-                            raw = await asyncio.wait_for(ws.recv(), timeout=max(5.0, RTDS_RECV_TIMEOUT_SEC))
+                            await feed.pump(ws, timeout=max(5.0, RTDS_RECV_TIMEOUT_SEC))
                         except asyncio.TimeoutError:
                             raise TimeoutError("RTDS recv timeout")
-                        if not raw: continue
                         self._rtds_last_msg_ts = _time.time()
-                        try:
-                            if isinstance(raw, (bytes, bytearray)):
-                                raw = raw.decode("utf-8", "ignore")
-                            msg = json.loads(raw)
-                        except: continue
-                        events = msg if isinstance(msg, list) else [msg]
-
-                        # ── Market token price update (instant up_price refresh) ──
-                        for ev in events:
-                            if not isinstance(ev, dict):
-                                continue
-                            if ev.get("event_type") == "price_change" or ev.get("topic") == "market":
-                                pl = ev.get("payload", {}) or ev
-                                tid   = pl.get("asset_id") or pl.get("token_id","")
-                                price = float(pl.get("price") or pl.get("mid_price") or 0)
-                                if tid and price > 0:
-                                    self.token_prices[tid] = price
-                                    # Update active_mkts up_price in real time
-                                    for cid, m in list(self.active_mkts.items()):
-                                        if m.get("token_up") == tid:
-                                            m["up_price"] = price
-                                        elif m.get("token_down") == tid:
-                                            m["up_price"] = 1 - price
-
-                            topic = str(ev.get("topic", "") or "").lower()
-                            if topic not in ("crypto_prices", "crypto_prices_update", "crypto_prices_v2"):
-                                continue
-                            payload = ev.get("payload", {}) or {}
-                            payloads = payload if isinstance(payload, list) else [payload]
-                            for p in payloads:
-                                if not isinstance(p, dict):
-                                    continue
-                                sym = str(p.get("symbol", "") or p.get("pair", "") or p.get("s", "")).lower()
-                                val = float(p.get("value") or p.get("price") or p.get("v") or 0)
-                                if val <= 0:
-                                    continue
-                                MAP = {"btcusdt":"BTC","ethusdt":"ETH","solusdt":"SOL","xrpusdt":"XRP"}
-                                asset = MAP.get(sym)
-                                if not asset:
-                                    continue
-                                self.prices[asset] = val
-                                _now_ts = _time.time()
-                                self._rtds_asset_ts[asset] = _now_ts
-                                self.price_history[asset].append((_now_ts, val))
-                                self._tick_update(asset, val, _now_ts)
-                                # Event-driven: evaluate unseen markets immediately on price tick
-                                now_t = _time.time()
-                                for cid, m in list(self.active_mkts.items()):
-                                    if m.get("asset") != asset: continue
-                                    if cid in self.seen: continue
-                                    if cid not in self.open_prices: continue
-                                    if now_t - self._last_eval_time.get(cid, 0) < RTDS_EVAL_MIN_INTERVAL_SEC: continue
-                                    mins = (m["end_ts"] - now_t) / 60
-                                    if mins < 1: continue
-                                    self._last_eval_time[cid] = now_t
-                                    m_rt = dict(m); m_rt["mins_left"] = mins
-                                    asyncio.create_task(self.evaluate(m_rt))
             except Exception as e:
                 self.rtds_ok = False
                 self._rtds_ws = None
@@ -4425,27 +4404,79 @@ class LiveTrader:
                 if self._rtds_ping_task is pinger_task:
                     self._rtds_ping_task = None
 
+    def _feed_decoder(self, name: str, route=None) -> FeedDecoder:
+        """Fresh per-connection decoder; counters carry over so feed stats survive reconnects."""
+        feed = FeedDecoder(name, route)
+        prev = self._feed_decoders.get(name)
+        if prev is not None:
+            feed.frames, feed.batches, feed.events = prev.frames, prev.batches, prev.events
+            feed.decode_errors, feed.max_batch_seen = prev.decode_errors, prev.max_batch_seen
+        self._feed_decoders[name] = feed
+        return feed
+
+    @staticmethod
+    def _rtds_route(ev: dict) -> str | None:
+        if ev.get("event_type") == "price_change" or ev.get("topic") == "market":
+            return "market"
+        topic = str(ev.get("topic", "") or "").lower()
+        if topic in ("crypto_prices", "crypto_prices_update", "crypto_prices_v2"):
+            return "crypto"
+        return None
+
+    def _rtds_on_market(self, ev: dict):
+        """Market token price update (instant up_price refresh)."""
+        pl = ev.get("payload", {}) or ev
+        tid   = pl.get("asset_id") or pl.get("token_id","")
+        price = float(pl.get("price") or pl.get("mid_price") or 0)
+        if tid and price > 0:
+            self.token_prices[tid] = price
+            # Update active_mkts up_price in real time
+            hit = self._token_mkt_index.get(tid)
+            m = self.active_mkts.get(hit[0]) if hit else None
+            if m is not None:
+                m["up_price"] = price if hit[1] else 1 - price
+
+    def _rtds_on_crypto(self, ev: dict):
+        payload = ev.get("payload", {}) or {}
+        payloads = payload if isinstance(payload, list) else [payload]
+        burst = {}   # asset -> prices in arrival order (list payloads carry several ticks)
+        for p in payloads:
+            if not isinstance(p, dict):
+                continue
+            sym = str(p.get("symbol", "") or p.get("pair", "") or p.get("s", "")).lower()
+            val = float(p.get("value") or p.get("price") or p.get("v") or 0)
+            if val <= 0:
+                continue
+            asset = _RTDS_SYM_MAP.get(sym)
+            if not asset:
+                continue
+            burst.setdefault(asset, []).append(val)
+        for asset, vals in burst.items():
+            _now_ts = _time.time()
+            self.prices[asset] = vals[-1]
+            self._rtds_asset_ts[asset] = _now_ts
+            ph = self.price_history[asset]
+            for val in vals:
+                ph.append(_now_ts, val)
+            if len(vals) == 1:
+                self._tick_update(asset, vals[0], _now_ts)
+            else:
+                self._tick_update_batch(asset, [(_now_ts, v) for v in vals])
+            # Event-driven: a move of EVAL_PRICE_MOVE_BPS since the last request re-scores the asset's markets.
+            ref = self._eval_px_ref.get(asset, 0.0)
+            if ref > 0 and abs(vals[-1] - ref) * 10000.0 < ref * EVAL_PRICE_MOVE_BPS:
+                continue
+            self._eval_px_ref[asset] = vals[-1]
+            self._request_eval_asset(asset, "price")
+
     # ── VOL LOOP ──────────────────────────────────────────────────────────────
     async def vol_loop(self):
         """Parkinson OHLC vol from WS klines cache — no HTTP, updated every 60s."""
         while True:
             for asset in list(BNB_SYM.keys()):
-                klines = self.binance_cache.get(asset, {}).get("klines", [])
-                if len(klines) < 5:
-                    continue
-                try:
-                    recent = klines[-30:]
-                    log_hl_sq = [
-                        math.log(float(k[2]) / float(k[3])) ** 2
-                        for k in recent
-                        if float(k[3]) > 0 and float(k[2]) > float(k[3])
-                    ]
-                    if log_hl_sq:
-                        park_var = sum(log_hl_sq) / (4.0 * math.log(2) * len(log_hl_sq))
-                        ann_vol  = math.sqrt(park_var * 252 * 24 * 60)
-                        self.vols[asset] = max(0.10, min(5.0, ann_vol))
-                except Exception:
-                    pass
+                ann_vol = self._bnb(asset).parkinson_vol
+                if ann_vol > 0:
+                    self.vols[asset] = max(0.10, min(5.0, ann_vol))
             await asyncio.sleep(60)
 
     # ── CHAINLINK ORACLE LOOP ─────────────────────────────────────────────────
@@ -4477,19 +4508,22 @@ class LiveTrader:
             for asset, contract in contracts.items():
                 try:
                     data = await loop.run_in_executor(
-                        None, contract.functions.latestRoundData().call
+                        self._lanes.chain, contract.functions.latestRoundData().call
                     )
                     price   = data[1] / 1e8
                     updated = data[3]
                     age     = _time.time() - updated
                     if age < 60:   # only use if fresh (<60s)
+                        new_round = updated > self.cl_updated.get(asset, 0)
                         self.cl_prices[asset]  = price
                         self.cl_updated[asset] = updated
+                        if new_round:
+                            self._request_eval_asset(asset, "chainlink")
                         # Dashboard fallback: if RTDS is stale, drive spot/chart from Chainlink.
                         now = _time.time()
                         if (now - float(self._rtds_asset_ts.get(asset, 0.0) or 0.0)) > 3.0:
                             self.prices[asset] = price
-                            self.price_history[asset].append((now, price))
+                            self.price_history[asset].append(now, price)
                             self._tick_update(asset, price, now)
                 except Exception:
                     pass
@@ -4529,10 +4563,11 @@ class LiveTrader:
                         if updated_at > prev_ts:   # only update if newer round
                             self.cl_prices[asset]  = price
                             self.cl_updated[asset] = updated_at
+                            self._request_eval_asset(asset, "chainlink")
                             # Dashboard fallback: if RTDS is stale, drive spot/chart from Chainlink.
                             if (now - float(self._rtds_asset_ts.get(asset, 0.0) or 0.0)) > 3.0:
                                 self.prices[asset] = price
-                                self.price_history[asset].append((now, price))
+                                self.price_history[asset].append(now, price)
                                 self._tick_update(asset, price, now)
                             print(f"{G}[CL-WS]{RS} {asset} {price:.4f} detect={detect_lag*1000:.0f}ms "
                                   f"via {ws_url.split('//')[1].split('/')[0]}")
@@ -4556,7 +4591,7 @@ class LiveTrader:
                         proxy = self.w3.eth.contract(
                             address=Web3.to_checksum_address(proxy_addr), abi=CHAINLINK_ABI
                         )
-                        agg_addr = await loop.run_in_executor(None, proxy.functions.aggregator().call)
+                        agg_addr = await loop.run_in_executor(self._lanes.chain, proxy.functions.aggregator().call)
                         agg_to_asset[agg_addr.lower()] = asset
                     except Exception as e:
                         print(f"{Y}[CL-WS] aggregator lookup failed {asset}: {e}{RS}")
@@ -4596,7 +4631,7 @@ class LiveTrader:
                         samples = []
                         for _ in range(max(1, RPC_PROBE_COUNT)):
                             t0 = _time.perf_counter()
-                            await loop.run_in_executor(None, lambda w=_w3: w.eth.block_number)
+                            await loop.run_in_executor(self._lanes.chain, lambda w=_w3: w.eth.block_number)
                             samples.append((_time.perf_counter() - t0) * 1000.0)
                         samples.sort()
                         ms = samples[len(samples) // 2]
@@ -4610,7 +4645,7 @@ class LiveTrader:
                 if best_rpc and best_rpc != self._rpc_url and best_ms + RPC_SWITCH_MARGIN_MS < current_ms:
                     try:
                         nw3 = self._build_w3(best_rpc, timeout=6)
-                        _ = await asyncio.get_running_loop().run_in_executor(None, lambda: nw3.eth.block_number)
+                        _ = await asyncio.get_running_loop().run_in_executor(self._lanes.chain, lambda: nw3.eth.block_number)
                         self.w3 = nw3
                         self._rpc_url = best_rpc
                         self._rpc_epoch += 1
@@ -4703,6 +4738,7 @@ class LiveTrader:
         # Only re-fetch Gamma API every MARKET_REFRESH_SEC (default 30s).
         # Previously called every SCAN_INTERVAL (0.5s) = 600 HTTP requests/minute for data that barely changes.
         # mins_left is always recalculated from end_ts so stale cache is safe.
+        refreshed = False
         if now - self._markets_cache_ts >= MARKET_REFRESH_SEC:
             results = await asyncio.gather(
                 *[self._fetch_series(slug, info, now) for slug, info in SERIES.items()]
@@ -4714,6 +4750,7 @@ class LiveTrader:
             self._markets_cache_raw = {cid: {k: v for k, v in m.items() if k != "mins_left"}
                                         for cid, m in found.items()}
             self._markets_cache_ts = now
+            refreshed = True
         # Rebuild active_mkts with fresh mins_left from end_ts
         rebuilt = {}
         for cid, m in self._markets_cache_raw.items():
@@ -4721,9 +4758,53 @@ class LiveTrader:
             if end_ts > 0 and end_ts > now:
                 rebuilt[cid] = dict(m)
                 rebuilt[cid]["mins_left"] = (end_ts - now) / 60.0
+        prev_keys = self.active_mkts.keys()
         self.active_mkts = rebuilt
+        if refreshed or rebuilt.keys() != prev_keys:
+            self._rebuild_market_index()
         return rebuilt
 
+    def _rebuild_market_index(self):
+        """Reverse lookups for RTDS handlers; rebuilt whenever the active cid set changes."""
+        tok_idx = {}
+        by_asset = defaultdict(list)
+        for cid, m in self.active_mkts.items():
+            tu = m.get("token_up", "")
+            td = m.get("token_down", "")
+            if tu:
+                tok_idx[tu] = (cid, True)
+            if td:
+                tok_idx.setdefault(td, (cid, False))
+            by_asset[m.get("asset", "")].append(cid)
+        self._token_mkt_index = tok_idx
+        self._asset_cids = {a: tuple(cids) for a, cids in by_asset.items()}
+        now = _time.time()
+        for cid, m in self.active_mkts.items():
+            end_ts = float(m.get("end_ts", 0) or 0)
+            for mins in EVAL_CLOSE_MILESTONES_MIN:
+                if end_ts - mins * 60.0 > now:
+                    self._eval_sched.at(end_ts - mins * 60.0, cid, "close")
+        for d in (self._eval_edge, self._last_eval_time):
+            for cid in [c for c in d if c not in self.active_mkts]:
+                del d[cid]
+
+    def _request_eval(self, cid: str, reason: str) -> None:
+        if cid not in self.seen:
+            self._eval_sched.notify(cid, reason)
+
+    def _request_eval_asset(self, asset: str, reason: str) -> None:
+        for cid in self._asset_cids.get(asset, ()):
+            if cid in self.open_prices:
+                self._request_eval(cid, reason)
+
+    def _eval_priority(self, cid: str) -> float:
+        """Drain order for evaluation requests: closer to close and larger last edge first."""
+        m = self.active_mkts.get(cid)
+        if m is None:
+            return 0.0
+        mins_left = (float(m.get("end_ts", 0) or 0) - _time.time()) / 60.0
+        return (1.0 + 20.0 * max(0.0, self._eval_edge.get(cid, 0.0))) / max(0.5, mins_left)
+
     def _active_token_ids(self) -> set[str]:
         toks = set()
         for m in self.active_mkts.values():
@@ -4749,28 +4830,57 @@ class LiveTrader:
                 toks.add(td)
         return toks
 
-    def _normalize_book_levels(self, levels) -> list[tuple[float, float]]:
-        out = []
-        if not isinstance(levels, list):
-            return out
-        for lv in levels:
-            p = s = 0.0
-            try:
-                if isinstance(lv, dict):
-                    p = float(lv.get("price", lv.get("p", 0.0)) or 0.0)
-                    s = float(lv.get("size", lv.get("s", lv.get("quantity", 0.0))) or 0.0)
-                elif isinstance(lv, (list, tuple)) and len(lv) >= 2:
-                    p = float(lv[0] or 0.0)
-                    s = float(lv[1] or 0.0)
-            except Exception:
-                p = s = 0.0
-            if p > 0 and s > 0:
-                out.append((p, s))
-        return out
+    def _clob_ws_book_for(self, aid: str):
+        """Get-or-create the WS book for a token and mark it most-recently-used."""
+        books = self._clob_ws_books
+        book = books.get(aid)
+        if book is None:
+            book = books[aid] = ClobBook()
+            cap = max(64, BOOK_CACHE_MAX * 2)
+            while len(books) > cap:
+                books.popitem(last=False)
+        else:
+            books.move_to_end(aid)
+        return book
+
+    @staticmethod
+    def _ws_float(row: dict, *keys: str) -> float:
+        for k in keys:
+            v = row.get(k)
+            if v not in (None, ""):
+                try:
+                    return float(v)
+                except (TypeError, ValueError):
+                    return 0.0
+        return 0.0
 
     def _ingest_clob_ws_event(self, row: dict):
         if not isinstance(row, dict):
             return
+        now_ms = _time.time() * 1000.0
+        # Current price_change format: per-token deltas nested under "price_changes".
+        changes = row.get("price_changes")
+        if isinstance(changes, list):
+            for ch in changes:
+                if not isinstance(ch, dict):
+                    continue
+                aid = str(ch.get("asset_id") or ch.get("assetId") or "").strip()
+                if not aid:
+                    continue
+                book = self._clob_ws_book_for(aid)
+                prev_ask = book.best_ask
+                book.apply(
+                    str(ch.get("side", "") or "").upper() == "BUY",
+                    self._ws_float(ch, "price"),
+                    self._ws_float(ch, "size"),
+                )
+                book.best_bid_hint = self._ws_float(ch, "best_bid", "bestBid") or book.best_bid_hint
+                book.best_ask_hint = self._ws_float(ch, "best_ask", "bestAsk") or book.best_ask_hint
+                if book.best_ask > 0:
+                    book.ts_ms = now_ms
+                if book.best_ask != prev_ask:
+                    self._request_eval_token(aid)
+            return
         aid = str(
             row.get("asset_id")
             or row.get("assetId")
@@ -4781,59 +4891,44 @@ class LiveTrader:
         ).strip()
         if not aid:
             return
-        prev = self._clob_ws_books.get(aid, {})
-        asks = self._normalize_book_levels(
-            row.get("asks", row.get("sells", row.get("sell", [])))
-        )
-        bids = self._normalize_book_levels(
-            row.get("bids", row.get("buys", row.get("buy", [])))
-        )
-        best_ask = 0.0
-        best_bid = 0.0
-        if asks:
-            asks = sorted(asks, key=lambda x: x[0])[:20]
-            best_ask = asks[0][0]
+        book = self._clob_ws_books.get(aid)
+        prev_ask = book.best_ask if book is not None else 0.0
+        asks = row.get("asks", row.get("sells", row.get("sell")))
+        bids = row.get("bids", row.get("buys", row.get("buy")))
+        asks = asks if isinstance(asks, list) and asks else None
+        bids = bids if isinstance(bids, list) and bids else None
+        changes = row.get("changes")
+        if book is None:
+            if asks is None and not self._ws_float(row, "best_ask", "bestAsk", "ask"):
+                return  # nothing to seed a new book with
+            book = self._clob_ws_book_for(aid)
         else:
-            try:
-                best_ask = float(
-                    row.get("best_ask", row.get("bestAsk", row.get("ask", 0.0))) or 0.0
-                )
-            except Exception:
-                best_ask = 0.0
-            asks = list(prev.get("asks") or [])
-        if bids:
-            bids = sorted(bids, key=lambda x: x[0], reverse=True)
-            best_bid = bids[0][0]
-        else:
-            try:
-                best_bid = float(
-                    row.get("best_bid", row.get("bestBid", row.get("bid", 0.0))) or 0.0
-                )
-            except Exception:
-                best_bid = 0.0
-            if best_bid <= 0:
-                best_bid = float(prev.get("best_bid", 0.0) or 0.0)
-        if best_ask <= 0:
-            best_ask = float(prev.get("best_ask", 0.0) or 0.0)
-        tick = float(row.get("tick_size", row.get("tick", prev.get("tick", 0.01))) or 0.01)
-        if best_ask > 0:
-            self._clob_ws_books[aid] = {
-                "ts_ms": _time.time() * 1000.0,
-                "best_bid": best_bid if best_bid > 0 else max(0.0, best_ask - tick),
-                "best_ask": best_ask,
-                "tick": tick,
-                "asks": asks,
-            }
-            if len(self._clob_ws_books) > max(64, BOOK_CACHE_MAX * 2):
-                keys = sorted(
-                    self._clob_ws_books.items(),
-                    key=lambda kv: kv[1].get("ts_ms", 0.0),
-                    reverse=True,
-                )[: max(1, BOOK_CACHE_MAX * 2)]
-                keep = {k for k, _ in keys}
-                for k in list(self._clob_ws_books.keys()):
-                    if k not in keep:
-                        self._clob_ws_books.pop(k, None)
+            self._clob_ws_books.move_to_end(aid)
+        if asks is not None or bids is not None:
+            book.load(asks, bids)
+        elif isinstance(changes, list):
+            # Legacy price_change format: token id at top level, deltas under "changes".
+            for ch in changes:
+                if isinstance(ch, dict):
+                    book.apply(
+                        str(ch.get("side", "") or "").upper() == "BUY",
+                        self._ws_float(ch, "price"),
+                        self._ws_float(ch, "size"),
+                    )
+        book.best_ask_hint = self._ws_float(row, "best_ask", "bestAsk", "ask") or book.best_ask_hint
+        book.best_bid_hint = self._ws_float(row, "best_bid", "bestBid", "bid") or book.best_bid_hint
+        book.tick = self._ws_float(row, "tick_size", "new_tick_size", "tick") or book.tick
+        if book.best_ask > 0:
+            book.ts_ms = now_ms
+        if book.best_ask != prev_ask:
+            self._request_eval_token(aid)
+
+    def _request_eval_token(self, token_id: str) -> None:
+        if self._presign.has(token_id):
+            self._presign.reprice(token_id, self._clob_ws_book_for(token_id).best_ask)
+        hit = self._token_mkt_index.get(token_id)
+        if hit is not None:
+            self._request_eval(hit[0], "book")
 
     async def _bootstrap_ws_books(self, token_ids: set):
         """Seed WS book cache from REST right after subscription.
@@ -4863,31 +4958,42 @@ class LiveTrader:
     def _get_clob_ws_book(self, token_id: str, max_age_ms: float | None = None):
         if not token_id:
             return None
-        row = self._clob_ws_books.get(token_id)
-        if not row:
+        book = self._clob_ws_books.get(token_id)
+        if book is None or book.ts_ms <= 0:
             return None
         age_cap = float(max_age_ms if max_age_ms is not None else CLOB_MARKET_WS_MAX_AGE_MS)
-        age_ms = (_time.time() * 1000.0) - float(row.get("ts_ms", 0.0) or 0.0)
+        age_ms = (_time.time() * 1000.0) - book.ts_ms
         if age_ms > age_cap:
             return None
-        best_ask = float(row.get("best_ask", 0.0) or 0.0)
+        best_ask = book.best_ask
         if best_ask <= 0:
             return None
+        best_bid = book.best_bid
         return {
-            "best_bid": float(row.get("best_bid", max(0.0, best_ask - 0.01)) or 0.0),
+            "best_bid": best_bid if best_bid > 0 else max(0.0, best_ask - book.tick),
             "best_ask": best_ask,
-            "tick": float(row.get("tick", 0.01) or 0.01),
-            "asks": list(row.get("asks") or []),
-            "ts": float(row.get("ts_ms", 0.0) or 0.0) / 1000.0,
+            "tick": book.tick,
+            "asks": book.asks_top(),   # shared immutable snapshot; no per-read copy
+            "ts": book.ts_ms / 1000.0,
             "source": "clob-ws",
         }
 
     def _clob_ws_book_age_ms(self, token_id: str) -> float:
         """Best-effort age for diagnostics; returns large number if missing."""
-        row = self._clob_ws_books.get(token_id or "")
-        if not row:
+        book = self._clob_ws_books.get(token_id or "")
+        if book is None or book.ts_ms <= 0:
             return 9e9
-        return (_time.time() * 1000.0) - float(row.get("ts_ms", 0.0) or 0.0)
+        return (_time.time() * 1000.0) - book.ts_ms
+
+    def _clob_ws_on_row(self, row: dict):
+        sub = row.get("data")
+        if isinstance(sub, list):
+            for r2 in sub:
+                self._ingest_clob_ws_event(r2)
+        elif isinstance(sub, dict):
+            self._ingest_clob_ws_event(sub)
+        else:
+            self._ingest_clob_ws_event(row)
 
     async def _stream_clob_market_book(self):
         """Realtime CLOB market channel: keep per-token best bid/ask + shallow asks in memory."""
@@ -4920,6 +5026,7 @@ class LiveTrader:
                             except Exception:
                                 break
                     hb_task = asyncio.create_task(_app_heartbeat())
+                    feed = self._feed_decoder("clob_market").on(None, self._clob_ws_on_row)
                     try:
                         while True:
                             desired = (self._trade_focus_token_ids() or self._active_token_ids()) | set(self._clob_ws_pending_subs)
@@ -4942,27 +5049,10 @@ class LiveTrader:
                             try:
                                 # Keep a short poll interval so new-token subscriptions are flushed
                                 # quickly at round rollover (prevents ws_age=9e9 gaps).
-                                raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                                # Plain-text PONG heartbeats are dropped as decode errors.
+                                await feed.pump(ws, timeout=0.5)
                             except asyncio.TimeoutError:
                                 continue
-                            try:
-                                msg = json.loads(raw)
-                            except Exception:
-                                # Server may return plain-text PONG to app heartbeat.
-                                if str(raw).strip().upper() == "PONG":
-                                    continue
-                                continue
-                            rows = msg if isinstance(msg, list) else [msg]
-                            for row in rows:
-                                if isinstance(row, dict) and isinstance(row.get("data"), (list, dict)):
-                                    sub = row.get("data")
-                                    if isinstance(sub, list):
-                                        for r2 in sub:
-                                            self._ingest_clob_ws_event(r2)
-                                    else:
-                                        self._ingest_clob_ws_event(sub)
-                                else:
-                                    self._ingest_clob_ws_event(row)
                     finally:
                         hb_task.cancel()
             except Exception as e:
@@ -5015,47 +5105,183 @@ class LiveTrader:
         except Exception:
             return None
 
-    async def _score_market(self, m: dict) -> dict | None:
-        from clawbot_v2.strategy.core import _score_market
-        cid = str(m.get("conditionId", "") or "")
-        if not cid:
-            return await _score_market(self, m)
+    def _asset_features(self, asset: str) -> AssetFeatures:
+        """Per-asset scoring signals, computed once and shared by all markets of the asset."""
+        tf = self._binance_taker_flow(asset)
+        perp = self._binance_perp_signals(asset)
+        is_jump, jump_dir, jump_z = self._jump_detect(asset)
+        return AssetFeatures(
+            asset=asset,
+            ts=_time.time(),
+            mom_5s=self._momentum_prob(asset, seconds=5),
+            mom_30s=self._momentum_prob(asset, seconds=30),
+            mom_60s=self._momentum_prob(asset, seconds=60),
+            mom_180s=self._momentum_prob(asset, seconds=180),
+            mom_kal=self._kalman_vel_prob(asset),
+            ob_imbalance=self._binance_imbalance(asset),
+            dw_ob=self._ob_depth_weighted(asset),
+            taker_ratio=tf[0],
+            vol_ratio=tf[1],
+            perp_basis=perp[0],
+            funding_rate=perp[1],
+            autocorr=self._autocorr_regime(asset),
+            vr_ratio=self._variance_ratio(asset),
+            rsi=self._rsi(asset),
+            williams_r=self._williams_r(asset),
+            is_jump=is_jump,
+            jump_dir=jump_dir,
+            jump_z=jump_z,
+            btc_lead_p=self._btc_lead_signal(asset),
+            surge_ofi=self._binance_agg_ofi(asset, window_sec=OFI_SURGE_WINDOW_SEC),
+            liq_up=self._liq_signal(asset, "Up"),
+            liq_down=self._liq_signal(asset, "Down"),
+            bnb=self._bnb(asset),
+        )
 
-        key = cid
+    def _scoring_state_sig(self, asset: str, btc_px) -> tuple:
+        """Trader-side values _scoring_inputs reads for ``asset`` that the snapshot doesn't hold."""
+        k = self._ticks.kalman_state(asset)
+        oi = self._oi.get(asset, {})
+        return (
+            self._ticks.ema_of(asset, 5),
+            self._ticks.ema_of(asset, 60),
+            k[1] if k is not None else None,
+            self.vols.get(asset),
+            self.vols.get("BTC"),
+            oi.get("prev"),
+            oi.get("cur"),
+            self._ls_ratio.get(asset),
+            self.asset_prev_open.get(asset),
+            btc_px,
+        )
+
+    def _scoring_inputs(
+        self, m: dict, snap: FeatureSnapshot, *,
+        current: float, open_price: float, cl_age_s: float | None, pct_remaining: float,
+    ) -> ScoringInputs:
+        """Capture the ScoringKernel inputs for one market (priors are filled in by the caller)."""
+        asset = m["asset"]
+        k = self._ticks.kalman_state(asset)
+        oi = self._oi.get(asset, {})
+        btc_at_open = 0.0
+        if asset != "BTC":
+            ph = self.price_history.get("BTC")
+            st = m["start_ts"]
+            btc_at_open = (ph.first_in(st - 30, st + 90) if ph else 0.0) or 0.0
+        return ScoringInputs(
+            asset=asset,
+            duration=m["duration"],
+            up_price=m["up_price"],
+            pct_remaining=pct_remaining,
+            current=current,
+            open_price=open_price,
+            prev_open=self.asset_prev_open.get(asset, 0),
+            cl_now=float(snap.cl_prices.get(asset, 0) or 0.0),
+            rtds_now=float(snap.prices.get(asset, 0) or 0.0),
+            cl_age_s=cl_age_s,
+            feats=snap.assets[asset],
+            cross_up=snap.cross(asset, "Up"),
+            cross_down=snap.cross(asset, "Down"),
+            vol=self.vols.get(asset, 0.70),
+            ema5=self._ticks.ema_of(asset, 5, current),
+            ema60=self._ticks.ema_of(asset, 60, current),
+            kalman_vel=k[1] if k is not None else None,
+            oi_prev=oi.get("prev", 0),
+            oi_cur=oi.get("cur", 0),
+            ls_long=self._ls_ratio.get(asset, 1.0),
+            btc_vol=self.vols.get("BTC", 0.65),
+            btc_cur=float(snap.cl_prices.get("BTC") or snap.prices.get("BTC") or 0),
+            btc_at_open=btc_at_open,
+        )
+
+    def _feature_snapshot(self, assets=None) -> FeatureSnapshot:
+        """Freeze prices and per-asset features (all assets by default) for one scan pass."""
+        self._feature_version += 1
         now = _time.time()
+        prices = dict(self.prices)
+        cl_prices = dict(self.cl_prices)
+        tick_ts = {a: self._price_hist_last_ts(a) for a in self.price_history}
+        cl_updated = dict(self.cl_updated)
+        directions = self._asset_directions(prices, cl_prices, tick_ts, now)
+        feats = {a: self._asset_features(a) for a in (assets or BNB_SYM)}
+        # Per-asset content version: only bumps when an exact input _score_market
+        # reads changed; a tick that moves no scored input keeps it.
+        dirs_sig = tuple(sorted(directions.items()))
+        btc_px = cl_prices.get("BTC") or prices.get("BTC")
+        sigs = {}
+        for a, f in feats.items():
+            t_tick, t_cl = tick_ts.get(a, 0.0), cl_updated.get(a, 0)
+            sigs[a] = scoring_signature(
+                f,
+                price=prices.get(a),
+                cl_price=cl_prices.get(a),
+                cl_updated=t_cl,
+                quote_fresh=bool(t_tick) and (now - t_tick) * 1000.0 <= MAX_QUOTE_STALENESS_MS,
+                cl_fresh=bool(t_cl) and now - t_cl <= CL_FRESH_PRICE_AGE_SEC,
+                directions=dirs_sig,
+                state=self._scoring_state_sig(a, btc_px),
+            )
+        versions = asset_versions(self._feature_sig, sigs, self._feature_version)
+        return FeatureSnapshot(
+            version=self._feature_version,
+            ts=now,
+            prices=MappingProxyType(prices),
+            cl_prices=MappingProxyType(cl_prices),
+            cl_updated=MappingProxyType(cl_updated),
+            tick_ts=MappingProxyType(tick_ts),
+            directions=MappingProxyType(directions),
+            assets=MappingProxyType(feats),
+            asset_versions=MappingProxyType(versions),
+        )
+
+    async def score_batch(self, markets: list[dict], snap: FeatureSnapshot | None = None) -> list[dict | None]:
+        from clawbot_v2.strategy.core import score_batch
+        return await score_batch(self, markets, snap)
+
+    def _score_cache_key(self, m: dict, snap: FeatureSnapshot) -> tuple:
+        """ScoreCache key: the versions of every input _score_market reads for ``m``."""
         asset = str(m.get("asset", "") or "")
-        up_price = float(m.get("up_price", 0.0) or 0.0)
-        mins_left = float(m.get("mins_left", 0.0) or 0.0)
-        cl_p = float(self.cl_prices.get(asset, 0.0) or 0.0) if asset else 0.0
-        rtds_p = float(self.prices.get(asset, 0.0) or 0.0) if asset else 0.0
-        fp = (
-            round(up_price, 4),
-            round(mins_left, 1),
-            round(cl_p, 4),
-            round(rtds_p, 4),
+        cid = str(m.get("conditionId", "") or "")
+        books = self._clob_ws_books
+        book_up = books.get(str(m.get("token_up", "") or ""))
+        book_dn = books.get(str(m.get("token_down", "") or ""))
+        return (
+            cid,
+            snap.asset_versions.get(asset, snap.version),
+            book_up.version if book_up is not None else -1,
+            book_dn.version if book_dn is not None else -1,
+            self._copyflow_version,
+            self._priors_version,
+            self.open_prices.get(cid),
+            self.open_prices_source.get(cid),
+            round(float(m.get("up_price", 0.0) or 0.0), 4),
+            round(float(m.get("mins_left", 0.0) or 0.0), 1),
             int(m.get("start_ts", 0) or 0),
             int(m.get("end_ts", 0) or 0),
         )
-        cached = self._score_cache_by_key.get(key)
-        if cached:
-            age = now - float(cached.get("ts", 0.0) or 0.0)
-            if age < SCORE_DEBOUNCE_SEC and cached.get("fp") == fp:
-                sig_cached = cached.get("sig")
-                return dict(sig_cached) if isinstance(sig_cached, dict) else None
-        if len(self._score_cache_by_key) > 5000:
-            cutoff = now - 180.0
-            self._score_cache_by_key = {
-                k: v for k, v in self._score_cache_by_key.items()
-                if float((v or {}).get("ts", 0.0) or 0.0) >= cutoff
-            }
 
-        sig = await _score_market(self, m)
-        self._score_cache_by_key[key] = {
-            "ts": now,
-            "fp": fp,
-            "sig": dict(sig) if isinstance(sig, dict) else None,
-        }
-        return sig
+    async def _score_market(self, m: dict, snap: FeatureSnapshot | None = None) -> dict | None:
+        from clawbot_v2.strategy.core import _score_market
+        cid = str(m.get("conditionId", "") or "")
+        if not cid:
+            return await _score_market(self, m, snap)
+
+        now = _time.time()
+        if snap is None:
+            snap = self._feature_snapshot((str(m.get("asset", "") or ""),))
+        key = self._score_cache_key(m, snap)
+        cache = self._score_cache
+        cached = cache.get(key, now)
+        if cached is not cache.MISS:
+            return dict(cached) if isinstance(cached, dict) else None
+
+        # One in-flight score per market, bounded overall; overlapping callers
+        # (scan pass, entry-wait re-scores) share the latest run.
+        sig = await self._eval_queue.run(cid, lambda: _score_market(self, m, snap))
+        if sig is EvalQueue.DROPPED:
+            return None
+        cache.put(key, dict(sig) if isinstance(sig, dict) else None, now)
+        return dict(sig) if isinstance(sig, dict) else sig
 
     def _build_forced_round_signal(self, m: dict) -> dict | None:
         """Removed — force/synth trade path eliminated.
@@ -5196,6 +5422,7 @@ class LiveTrader:
             self._copyflow_cid_on_demand_ts[sig["cid"]] = _cf_block_until
             best = sig
             improved = False
+            self._presign_fok(sig)
             while _time.time() < deadline:
                 await asyncio.sleep(max(0.05, ENTRY_WAIT_POLL_SEC))
                 rsig = await self._score_market(m)
@@ -5223,6 +5450,7 @@ class LiveTrader:
                 if e_t <= (float(best.get("entry", 1.0) or 1.0) - min_improve):
                     best = rsig
                     improved = True
+                    self._presign_fok(rsig)
                     if self._noisy_log_enabled(f"entry-wait-improve:{sig.get('asset','?')}:{sig.get('side','?')}", LOG_EDGE_EVERY_SEC):
                         print(
                             f"{B}[ENTRY-WAIT]{RS} {sig.get('asset','?')} {sig.get('side','?')} "
@@ -5236,13 +5464,22 @@ class LiveTrader:
             self._errors.tick("entry_wait", print, err=e, every=20)
             return sig
 
+    def _presign_fok(self, sig: dict) -> None:
+        """Sign FOK templates for an armed signal in the background (see PresignCache)."""
+        if not PRESIGN_ENABLED or DRY_RUN or self.clob is None:
+            return
+        from clawbot_v2.execution.core import _presign_fok
+        task = asyncio.ensure_future(_presign_fok(self, sig))
+        self._presign_tasks.add(task)
+        task.add_done_callback(self._presign_tasks.discard)
+
     async def evaluate(self, m: dict):
         from clawbot_v2.execution.core import evaluate
         return await evaluate(self, m)
 
-    async def _place_order(self, token_id, side, price, size_usdc, asset, duration, mins_left, true_prob=0.5, cl_agree=True, min_edge_req=None, force_taker=False, score=0, pm_book_data=None, use_limit=False, max_entry_allowed=None, hc15_mode=False, hc15_fallback_cap=0.36, core_position=True):
+    async def _place_order(self, token_id, side, price, size_usdc, asset, duration, mins_left, true_prob=0.5, cl_agree=True, min_edge_req=None, force_taker=False, score=0, pm_book_data=None, use_limit=False, max_entry_allowed=None, hc15_mode=False, hc15_fallback_cap=0.36, core_position=True, reservation=None):
         from clawbot_v2.execution.core import _place_order
-        return await _place_order(self, token_id, side, price, size_usdc, asset, duration, mins_left, true_prob, cl_agree, min_edge_req, force_taker, score, pm_book_data, use_limit, max_entry_allowed, hc15_mode, hc15_fallback_cap, core_position)
+        return await _place_order(self, token_id, side, price, size_usdc, asset, duration, mins_left, true_prob, cl_agree, min_edge_req, force_taker, score, pm_book_data, use_limit, max_entry_allowed, hc15_mode, hc15_fallback_cap, core_position, reservation)
 
     # ── RESOLVE ───────────────────────────────────────────────────────────────
     async def _resolve(self):
@@ -5263,7 +5500,7 @@ class LiveTrader:
                     if self._nonce_mgr is None:
                         self._nonce_mgr = NonceManager(self.w3, acct.address)
                     nonce = await self._nonce_mgr.next_nonce(loop)
-                    latest = await loop.run_in_executor(None, lambda: self.w3.eth.get_block("latest"))
+                    latest = await loop.run_in_executor(self._lanes.background, lambda: self.w3.eth.get_block("latest"))
                     base_fee = latest["baseFeePerGas"]
                     pri_fee = self.w3.to_wei(40, "gwei")
                     max_fee = base_fee * 2 + pri_fee
@@ -5278,10 +5515,10 @@ class LiveTrader:
                     })
                     signed = acct.sign_transaction(tx)
                     tx_hash = await loop.run_in_executor(
-                        None, lambda: self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                        self._lanes.background, lambda: self.w3.eth.send_raw_transaction(signed.raw_transaction)
                     )
                     receipt = await loop.run_in_executor(
-                        None, lambda h=tx_hash: self.w3.eth.wait_for_transaction_receipt(h, timeout=60)
+                        self._lanes.background, lambda h=tx_hash: self.w3.eth.wait_for_transaction_receipt(h, timeout=60)
                     )
                     if receipt.status != 1:
                         raise RuntimeError("redeem tx reverted")
@@ -5301,7 +5538,7 @@ class LiveTrader:
         """Best-effort eth_call preflight for redeem claimability."""
         try:
             await loop.run_in_executor(
-                None, lambda: ctf.functions.redeemPositions(
+                self._lanes.background, lambda: ctf.functions.redeemPositions(
                     collat, b'\x00' * 32, cid_bytes, [index_set]
                 ).call({"from": acct_addr})
             )
@@ -5557,16 +5794,15 @@ class LiveTrader:
             return 0.5
         T = max(mins_left, 0.1) / (252 * 24 * 60)
         d = math.log(current / open_price) / (vol * math.sqrt(T))
-        return float(norm.cdf(d))
+        return ncdf(d)
 
     def _momentum_prob(self, asset: str, seconds: int = 60) -> float:
         """P(Up) from time-based EMA at the closest cached half-life; O(1) from cache."""
-        ema_dict = self.emas.get(asset)
-        if not ema_dict:
+        if asset not in self._ticks.index:
             return 0.5
-        hl    = min(ema_dict.keys(), key=lambda h: abs(h - seconds))
+        hl    = self._ticks.nearest_half_life(seconds)
         price = self.prices.get(asset, 0.0)
-        ema   = ema_dict.get(hl, 0.0)
+        ema   = self._ticks.ema_of(asset, hl)
         if price == 0 or ema == 0:
             return 0.5
         move  = (price - ema) / ema
@@ -5574,31 +5810,20 @@ class LiveTrader:
         vol_t = vol * math.sqrt(hl / (252 * 24 * 3600))
         if vol_t == 0:
             return 0.5
-        return float(norm.cdf(move / vol_t))
+        return ncdf(move / vol_t)
 
     # ── Binance helpers — read from WS cache (instant, no network) ───────────
 
     def _binance_imbalance(self, asset: str) -> float:
-        c = self.binance_cache.get(asset, {})
-        bids = c.get("depth_bids", [])
-        asks = c.get("depth_asks", [])
-        bid_vol = sum(float(b[1]) for b in bids[:10])
-        ask_vol = sum(float(a[1]) for a in asks[:10])
-        if bid_vol + ask_vol == 0:
-            return 0.0
-        return (bid_vol - ask_vol) / (bid_vol + ask_vol)
+        r = self._bnb(asset)
+        return depth_imbalance(r.bid_top10, r.ask_top10)
 
     def _binance_taker_flow(self, asset: str) -> tuple:
-        klines = self.binance_cache.get(asset, {}).get("klines", [])
-        if len(klines) < 4:
+        r = self._bnb(asset)
+        if r.klines_n < 4:
             return 0.5, 1.0
-        recent = klines[-3:]
-        hist   = klines[:-3]
-        rec_vol   = sum(float(k[5]) for k in recent)
-        rec_taker = sum(float(k[9]) for k in recent)
-        hist_avg  = (sum(float(k[5]) for k in hist) / len(hist)) if hist else rec_vol
-        kline_ratio = rec_taker / rec_vol if rec_vol > 0 else 0.5
-        vol_ratio   = (rec_vol / 3) / hist_avg if hist_avg > 0 else 1.0
+        kline_ratio = r.taker_ratio
+        vol_ratio   = r.taker_vol_ratio
         # Blend with real-time aggTrade OFI when available (higher weight = more responsive)
         agg_ratio = self._binance_agg_ofi(asset)
         if agg_ratio != 0.5:
@@ -5608,36 +5833,23 @@ class LiveTrader:
         return round(taker_ratio, 3), round(vol_ratio, 2)
 
     def _binance_perp_signals(self, asset: str) -> tuple:
-        c = self.binance_cache.get(asset, {})
-        mark    = c.get("mark", 0.0)
-        index   = c.get("index", 0.0)
-        funding = c.get("funding", 0.0)
+        r = self._bnb(asset)
+        mark    = r.mark
+        index   = r.index
+        funding = r.funding
         basis   = (mark - index) / index if index > 0 else 0.0
         return round(basis, 7), round(funding, 7)
 
     def _binance_window_stats(self, asset: str, window_start_ts: float) -> tuple:
-        import statistics as _stats
-        klines = self.binance_cache.get(asset, {}).get("klines", [])
-        if not klines or len(klines) < 3:
+        # Bar count and vol_mult come from the published record and vwap_dev
+        # reads KlineSeries' immutable prefix-sum tuple, so nothing here
+        # touches columns the ingest thread may be rewriting.
+        r = self._bnb(asset)
+        ks = self._klines(asset)
+        if ks is None or r.klines_n < 3:
             return 0.0, 1.0
-        start_ms = int(window_start_ts * 1000)
-        window_k = [k for k in klines if int(k[0]) >= start_ms] or klines[-3:]
-        sum_tv = sum((float(k[2])+float(k[3])+float(k[4]))/3 * float(k[5]) for k in window_k)
-        sum_v  = sum(float(k[5]) for k in window_k)
-        vwap   = sum_tv / sum_v if sum_v > 0 else float(window_k[-1][4])
-        cur    = float(klines[-1][4])
-        vwap_dev = (cur - vwap) / vwap if vwap > 0 else 0.0
-        closes = [float(k[4]) for k in klines]
-        pct_ch = [abs(closes[i]/closes[i-1]-1) for i in range(1, len(closes)) if closes[i-1] > 0]
-        if pct_ch:
-            ann = _stats.mean(pct_ch) * (252 * 24 * 60) ** 0.5
-            if   ann < 0.40: vol_mult = 0.7
-            elif ann < 0.80: vol_mult = 1.0
-            elif ann < 1.50: vol_mult = 1.2
-            else:            vol_mult = 1.4
-        else:
-            vol_mult = 1.0
-        return round(vwap_dev, 6), vol_mult
+        vwap_dev = ks.vwap_dev(int(window_start_ts * 1000))
+        return round(vwap_dev, 6), r.vol_mult
 
     # ── Binance WebSocket streams ─────────────────────────────────────────────
 
@@ -5648,23 +5860,23 @@ class LiveTrader:
         for asset, sym in BNB_SYM.items():
             sym_api = sym.upper()
             try:
-                depth = await loop.run_in_executor(None, lambda s=sym_api: _req.get(
+                depth = await loop.run_in_executor(self._lanes.background, lambda s=sym_api: _req.get(
                     "https://api.binance.com/api/v3/depth",
                     params={"symbol": s, "limit": 20}, timeout=5).json())
-                self.binance_cache[asset]["depth_bids"] = depth.get("bids", [])
-                self.binance_cache[asset]["depth_asks"] = depth.get("asks", [])
+                self.binance_cache[asset]["depth_bids"].load(depth.get("bids"))
+                self.binance_cache[asset]["depth_asks"].load(depth.get("asks"))
             except Exception as e:
                 self._errors.tick("bnb_seed_depth", print, err=e, every=25)
             try:
-                klines = await loop.run_in_executor(None, lambda s=sym_api: _req.get(
+                klines = await loop.run_in_executor(self._lanes.background, lambda s=sym_api: _req.get(
                     "https://api.binance.com/api/v3/klines",
                     params={"symbol": s, "interval": "1m", "limit": 33}, timeout=5).json())
                 if isinstance(klines, list):
-                    self.binance_cache[asset]["klines"] = klines
+                    self.binance_cache[asset]["klines"].load(klines)
             except Exception as e:
                 self._errors.tick("bnb_seed_klines", print, err=e, every=25)
             try:
-                mark = await loop.run_in_executor(None, lambda s=sym_api: _req.get(
+                mark = await loop.run_in_executor(self._lanes.background, lambda s=sym_api: _req.get(
                     "https://fapi.binance.com/fapi/v1/premiumIndex",
                     params={"symbol": s}, timeout=5).json())
                 self.binance_cache[asset]["mark"]    = float(mark.get("markPrice", 0))
@@ -5672,44 +5884,52 @@ class LiveTrader:
                 self.binance_cache[asset]["funding"] = float(mark.get("lastFundingRate", 0))
             except Exception as e:
                 self._errors.tick("bnb_seed_perp", print, err=e, every=25)
+            self._publish_binance(asset)
         print(f"{G}[BNB-SEED] Binance cache seeded for {list(BNB_SYM)}{RS}")
 
     async def _stream_binance_spot(self):
         """Persistent WS: depth20 + kline_1m for all assets → binance_cache."""
-        import websockets as _ws, json as _j
         sym_map = {v: k for k, v in BNB_SYM.items()}  # "btcusdt" → "BTC"
         streams = [f"{s}@depth20@100ms/{s}@kline_1m" for s in BNB_SYM.values()]
         url = "wss://stream.binance.com/stream?streams=" + "/".join(streams)
+
+        def _route(msg: dict) -> str | None:
+            stream = msg.get("stream", "")
+            if "@depth20" in stream:
+                return "depth"
+            if "@kline_1m" in stream:
+                return "kline"
+            return None
+
+        def _on_depth(msg: dict):
+            asset = sym_map.get(msg.get("stream", "").split("@")[0])
+            if not asset:
+                return
+            data = msg.get("data", {})
+            c = self.binance_cache[asset]
+            c["depth_bids"].load(data.get("bids"))
+            c["depth_asks"].load(data.get("asks"))
+            self._publish_binance(asset)
+
+        def _on_kline(msg: dict):
+            asset = sym_map.get(msg.get("stream", "").split("@")[0])
+            if not asset:
+                return
+            k = msg.get("data", {}).get("k", {})
+            self.binance_cache[asset]["klines"].update([k.get("t",0), k.get("o","0"), k.get("h","0"),
+                                                        k.get("l","0"), k.get("c","0"), k.get("v","0"),
+                                                        0, 0, 0, k.get("V","0"), 0, 0])
+            self._publish_binance(asset)
+
         delay = 5
         while True:
             try:
-                async with _ws.connect(url, ping_interval=20, ping_timeout=30, compression=None) as ws:
+                async with websockets.connect(url, ping_interval=20, ping_timeout=30, compression=None) as ws:
                     print(f"{G}[BNB-SPOT] WS connected{RS}")
                     delay = 5
-                    async for raw in ws:
-                        msg    = _j.loads(raw)
-                        stream = msg.get("stream", "")
-                        data   = msg.get("data", {})
-                        sym    = stream.split("@")[0]
-                        asset  = sym_map.get(sym)
-                        if not asset:
-                            continue
-                        c = self.binance_cache[asset]
-                        if "@depth20" in stream:
-                            c["depth_bids"] = data.get("bids", [])
-                            c["depth_asks"] = data.get("asks", [])
-                        elif "@kline_1m" in stream:
-                            k = data.get("k", {})
-                            kline = [k.get("t",0), k.get("o","0"), k.get("h","0"),
-                                     k.get("l","0"), k.get("c","0"), k.get("v","0"),
-                                     0, 0, 0, k.get("V","0"), 0, 0]
-                            klines = c["klines"]
-                            if klines and klines[-1][0] == kline[0]:
-                                klines[-1] = kline
-                            else:
-                                klines.append(kline)
-                                if len(klines) > 33:
-                                    klines.pop(0)
+                    feed = self._feed_decoder("bnb_spot", _route).on("depth", _on_depth).on("kline", _on_kline)
+                    while True:
+                        await feed.pump(ws)
             except Exception as e:
                 print(f"{Y}[BNB-SPOT] {e} — reconnect in {delay}s{RS}")
                 await asyncio.sleep(delay)
@@ -5717,27 +5937,30 @@ class LiveTrader:
 
     async def _stream_binance_futures(self):
         """Persistent WS: markPrice for all assets → binance_cache mark/index/funding."""
-        import websockets as _ws, json as _j
         sym_map = {v: k for k, v in BNB_SYM.items()}
         streams = [f"{s}@markPrice" for s in BNB_SYM.values()]
         url = "wss://fstream.binance.com/stream?streams=" + "/".join(streams)
+
+        def _on_mark(msg: dict):
+            data  = msg.get("data", {})
+            asset = sym_map.get(data.get("s", "").lower())
+            if not asset:
+                return
+            c = self.binance_cache[asset]
+            c["mark"]    = float(data.get("p", 0) or 0)
+            c["index"]   = float(data.get("i", 0) or 0)
+            c["funding"] = float(data.get("r", 0) or 0)
+            self._publish_binance(asset)
+
         delay = 5
         while True:
             try:
-                async with _ws.connect(url, ping_interval=20, ping_timeout=30, compression=None) as ws:
+                async with websockets.connect(url, ping_interval=20, ping_timeout=30, compression=None) as ws:
                     print(f"{G}[BNB-PERP] WS connected{RS}")
                     delay = 5
-                    async for raw in ws:
-                        msg   = _j.loads(raw)
-                        data  = msg.get("data", {})
-                        s     = data.get("s", "").lower()
-                        asset = sym_map.get(s)
-                        if not asset:
-                            continue
-                        c = self.binance_cache[asset]
-                        c["mark"]    = float(data.get("p", 0) or 0)
-                        c["index"]   = float(data.get("i", 0) or 0)
-                        c["funding"] = float(data.get("r", 0) or 0)
+                    feed = self._feed_decoder("bnb_perp").on(None, _on_mark)
+                    while True:
+                        await feed.pump(ws)
             except Exception as e:
                 print(f"{Y}[BNB-PERP] {e} — reconnect in {delay}s{RS}")
                 await asyncio.sleep(delay)
@@ -5745,50 +5968,44 @@ class LiveTrader:
 
     async def _stream_binance_aggtrade(self):
         """Persistent WS: aggTrade stream for all assets → real-time OFI in binance_cache."""
-        import websockets as _ws, json as _j, time as _t
         sym_map = {v: k for k, v in BNB_SYM.items()}
         streams = [f"{s}@aggTrade" for s in BNB_SYM.values()]
         url = "wss://stream.binance.com/stream?streams=" + "/".join(streams)
+
+        def _on_trade(msg: dict):
+            asset = sym_map.get(msg.get("stream", "").split("@")[0])
+            if not asset:
+                return
+            data = msg.get("data", {})
+            # m=True means maker was buyer → taker is SELLER; m=False → taker is BUYER
+            is_buy = not bool(data.get("m", False))
+            qty    = float(data.get("q", 0) or 0)
+            self.binance_cache[asset]["agg_ofi"].add(_time.time(), is_buy, qty)
+
         delay = 5
         while True:
             try:
-                async with _ws.connect(url, ping_interval=20, ping_timeout=30, compression=None) as ws:
+                async with websockets.connect(url, ping_interval=20, ping_timeout=30, compression=None) as ws:
                     print(f"{G}[BNB-AGG] aggTrade OFI stream connected{RS}")
                     delay = 5
-                    async for raw in ws:
-                        msg    = _j.loads(raw)
-                        stream = msg.get("stream", "")
-                        data   = msg.get("data", {})
-                        sym    = stream.split("@")[0]
-                        asset  = sym_map.get(sym)
-                        if not asset:
-                            continue
-                        # m=True means maker was buyer → taker is SELLER; m=False → taker is BUYER
-                        is_buy = not bool(data.get("m", False))
-                        qty    = float(data.get("q", 0) or 0)
-                        ts     = _t.time()
-                        self.binance_cache[asset]["agg_ofi_buf"].append((ts, is_buy, qty))
+                    feed = self._feed_decoder("bnb_agg").on(None, _on_trade)
+                    while True:
+                        await feed.pump(ws)
             except Exception as e:
                 print(f"{Y}[BNB-AGG] {e} — reconnect in {delay}s{RS}")
                 await asyncio.sleep(delay)
                 delay = min(delay * 2, 60)
 
     def _binance_agg_ofi(self, asset: str, window_sec: float | None = None) -> float:
-        """Rolling OFI ratio from aggTrade buffer. Returns 0.5 if no data."""
-        import time as _t
+        """Rolling OFI ratio from aggTrade buckets. Returns 0.5 if no data.
+        Windows reaching past retained history are counted in agg_ofi_short_n."""
         win = window_sec if window_sec is not None else AGG_OFI_WINDOW_SEC
-        buf = self.binance_cache.get(asset, {}).get("agg_ofi_buf")
-        if not buf:
+        ofi = self.binance_cache.get(asset, {}).get("agg_ofi")
+        if not ofi:
             return 0.5
-        cutoff = _t.time() - win
-        buy_q = sell_q = 0.0
-        for (ts, is_buy, qty) in reversed(buf):   # newest-first; break on first old entry
-            if ts < cutoff:
-                break
-            if is_buy:
-                buy_q += qty
-            else:
-                sell_q += qty
+        buy_q, sell_q, covered = ofi.window(win, _time.time())
+        if not covered:
+            self._perf_stats["agg_ofi_short_n"] = int(self._perf_stats.get("agg_ofi_short_n", 0)) + 1
         total = buy_q + sell_q
         return round(buy_q / total, 4) if total > 0 else 0.5
 
@@ -5797,26 +6014,27 @@ class LiveTrader:
     async def _stream_binance_liquidations(self):
         """Subscribe to all-market forced-liquidation stream (free, no auth).
         Opposing-side liquidations confirm our direction signal."""
-        import time as _t, json as _json
         url  = "wss://fstream.binance.com/ws/!forceOrder@arr"
         SYMS = {"BTCUSDT": "BTC", "ETHUSDT": "ETH", "SOLUSDT": "SOL", "XRPUSDT": "XRP"}
+
+        def _on_liq(data: dict):
+            order = data.get("o", {})
+            asset = SYMS.get(order.get("s", ""))
+            if asset is None:
+                return
+            side  = order.get("S", "")   # "BUY"=liquidated long, "SELL"=liquidated short
+            qty   = float(order.get("q", 0) or 0)
+            price = float(order.get("p", 0) or 0)
+            self._liq_buf[asset].append((_time.time(), side, qty * price))
+
         delay = 5
         while True:
             try:
                 async with websockets.connect(url, ping_interval=20, ping_timeout=10) as ws:
                     delay = 5
-                    async for raw in ws:
-                        data  = _json.loads(raw)
-                        order = data.get("o", {})
-                        sym   = order.get("s", "")
-                        asset = SYMS.get(sym)
-                        if asset is None:
-                            continue
-                        side  = order.get("S", "")   # "BUY"=liquidated long, "SELL"=liquidated short
-                        qty   = float(order.get("q", 0) or 0)
-                        price = float(order.get("p", 0) or 0)
-                        usd   = qty * price
-                        self._liq_buf[asset].append((_t.time(), side, usd))
+                    feed = self._feed_decoder("bnb_liq").on(None, _on_liq)
+                    while True:
+                        await feed.pump(ws)
             except Exception as e:
                 print(f"{Y}[BNB-LIQ] {e} — reconnect in {delay}s{RS}")
                 await asyncio.sleep(delay)
@@ -5834,7 +6052,7 @@ class LiveTrader:
         cutoff = _t.time() - LIQ_WINDOW_SEC
         is_up  = direction == "Up"
         # Opposing-side liq = confirms our direction
-        opp_usd = sum(usd for ts, side, usd in buf
+        opp_usd = sum(usd for ts, side, usd in tuple(buf)  # snapshot: the liq feed may append concurrently
                       if ts >= cutoff and ((is_up and side == "SELL") or (not is_up and side == "BUY")))
         if   opp_usd >= LIQ_SCORE_USD_2: return 2
         elif opp_usd >= LIQ_SCORE_USD_1: return 1
@@ -5877,45 +6095,39 @@ class LiveTrader:
                     except Exception:
                         pass
 
-    def _cross_asset_direction(self, asset: str, direction: str) -> int:
-        """Count how many OTHER assets are trending in the same direction right now.
-        Uses Binance RTDS price vs window open_price as primary signal; falls back to
-        Kalman velocity when the price move is too small (<0.03%) to be directionally
-        reliable (first ~60s of a new window). Returns 0-3.
-        Each distinct asset is counted at most once (uses freshest window open_price)."""
-        is_up = (direction == "Up")
-        count = 0
-        now_ts = _time.time()
+    def _asset_directions(self, prices, cl_prices, tick_ts, now_ts: float) -> dict[str, bool]:
+        """Direction (True=Up) of each asset vs its window open, for cross-asset confirmation.
+        Uses RTDS price vs open_price as primary signal (CL when RTDS is stale > 30s); falls
+        back to Kalman velocity when the move is too small (<0.03%) to be directionally
+        reliable (first ~60s of a new window). Assets with no decided direction are omitted.
+        Each asset is judged once, from the first active market with an open price."""
+        dirs: dict[str, bool] = {}
         seen_assets: set[str] = set()
         for cid, m in self.active_mkts.items():
             a = m.get("asset", "")
-            if a == asset or a in seen_assets:
+            if a in seen_assets:
                 continue
             op  = self.open_prices.get(cid, 0)
             if op <= 0:
                 continue
             # Prefer RTDS price; skip if stale (> 30s) to avoid false consensus from stale feed
-            cur = self.prices.get(a, 0)
-            ts_cur = self._price_hist_last_ts(a)
+            cur = prices.get(a, 0)
+            ts_cur = tick_ts.get(a, 0.0)
             if cur <= 0 or (ts_cur > 0 and now_ts - ts_cur > 30.0):
-                cur = self.cl_prices.get(a, 0)
+                cur = cl_prices.get(a, 0)
             if cur <= 0:
                 continue
             seen_assets.add(a)
             move_pct = abs(cur - op) / max(op, 1e-8)
             if move_pct >= 0.0003:
                 # Price has moved enough from open → trust direct price direction
-                dir_up = (cur > op)
+                dirs[a] = (cur > op)
             else:
                 # Near window open: use Kalman velocity for instantaneous direction
                 kp = self._kalman_vel_prob(a)
                 if kp < 0.45 or kp > 0.55:
-                    dir_up = (kp > 0.50)
-                else:
-                    continue  # Kalman also undecided → skip this asset
-            if dir_up == is_up:
-                count += 1
-        return count
+                    dirs[a] = (kp > 0.50)
+        return dirs
 
     def _bucket_key(self, duration: int, score: int, entry: float) -> str:
         score_bucket = "s12+" if score >= 12 else ("s9-11" if score >= 9 else "s0-8")
@@ -5935,19 +6147,61 @@ class LiveTrader:
             return "55-65c"
         return "65c+"
 
+    @staticmethod
+    def _source_ok(open_src: str, cl_age_s) -> bool:
+        return (open_src == "PM") and (cl_age_s is not None) and (float(cl_age_s) <= 45.0)
+
+    @staticmethod
+    def _new_resolved_index() -> ResolvedSampleIndex:
+        """Settled-outcome index with one window per prior lookup.
+
+        Keys are (asset, duration, side, entry_band, source_ok); each window
+        mirrors the slice its profile used to filter out of the raw samples.
+        """
+        idx = ResolvedSampleIndex(maxlen=2000)
+        idx.add_window(
+            "side", (lambda k: k[:3],),
+            last_n=600, max_age_s=max(0.0, RECENT_SIDE_PRIOR_LOOKBACK_H * 3600.0),
+        )
+        idx.add_window("calib15", (lambda k: (k[1] >= 15, k[3], k[4]),), last_n=max(50, ROLLING_15M_CALIB_WINDOW))
+        idx.add_window(
+            "asset_entry", (lambda k: k, lambda k: k[:4]),
+            last_n=1200, max_age_s=max(0.0, ASSET_ENTRY_PRIOR_LOOKBACK_H * 3600.0),
+        )
+        idx.add_window("horizon", (lambda k: k[1],), last_n=160, per_group=True)
+        idx.add_window("pred_side", (lambda k: k[:3],), last_n=200, per_group=True)  # PredictionAgent._sample_prior
+        five_m_windows = {
+            FIVE_M_GUARD_WINDOW,
+            max(FIVE_M_GUARD_WINDOW, FIVE_M_GUARD_REENABLE_MIN_OUTCOMES),
+            max(FIVE_M_GUARD_WINDOW, FIVE_M_DYNAMIC_SCORE_MIN_OUTCOMES),
+        }
+        for w in sorted(max(1, int(w)) for w in five_m_windows):
+            idx.add_window(f"five_m:{w}", (lambda k: k[1] <= 5,), last_n=w, per_group=True)
+        return idx
+
+    def _add_resolved_sample(self, asset, side, duration: int, entry, source, cl_age_s, pnl: float, won: bool):
+        key = (
+            str(asset or ""),
+            int(duration),
+            str(side or ""),
+            self._entry_band(float(entry or 0.0)),
+            self._source_ok(str(source or "?"), cl_age_s),
+        )
+        self._resolved_index.add(key, _time.time(), float(pnl or 0.0), bool(won))
+
     def _record_resolved_sample(self, trade: dict, pnl: float, won: bool):
         try:
-            self._resolved_samples.append({
-                "ts": _time.time(),
-                "asset": str(trade.get("asset", "") or ""),
-                "side": str(trade.get("side", "") or ""),
-                "duration": int(trade.get("duration", 0) or 0),
-                "entry": float(trade.get("entry", 0.0) or 0.0),
-                "source": str(trade.get("open_price_source", "?") or "?"),
-                "cl_age_s": trade.get("chainlink_age_s", None),
-                "pnl": float(pnl),
-                "won": bool(won),
-            })
+            self._add_resolved_sample(
+                trade.get("asset", ""),
+                trade.get("side", ""),
+                int(trade.get("duration", 0) or 0),
+                trade.get("entry", 0.0),
+                trade.get("open_price_source", "?"),
+                trade.get("chainlink_age_s", None),
+                pnl,
+                won,
+            )
+            self._priors_version += 1
         except Exception:
             pass
 
@@ -5987,17 +6241,10 @@ class LiveTrader:
                         d = 5 if "-5m-" in rks else (15 if "-15m-" in rks else 0)
                     if d <= 0:
                         continue
-                    self._resolved_samples.append({
-                        "ts": _time.time(),
-                        "asset": str(asset or ""),
-                        "side": str(side or ""),
-                        "duration": d,
-                        "entry": float(entry_price or 0.0),
-                        "source": str(open_src or "?"),
-                        "cl_age_s": cl_age_s,
-                        "pnl": float(pnl or 0.0),
-                        "won": str(result or "").upper() == "WIN",
-                    })
+                    self._add_resolved_sample(
+                        asset, side, d, entry_price, open_src, cl_age_s,
+                        pnl, str(result or "").upper() == "WIN",
+                    )
                     loaded += 1
             elif os.path.exists(METRICS_FILE):
                 # Fallback path for first migration / db unavailable.
@@ -6021,19 +6268,13 @@ class LiveTrader:
                         continue
                     pnl = float(row.get("pnl", 0.0) or 0.0)
                     won = str(row.get("result", "")).upper() == "WIN"
-                    self._resolved_samples.append({
-                        "ts": _time.time(),
-                        "asset": str(row.get("asset", "") or ""),
-                        "side": str(row.get("side", "") or ""),
-                        "duration": dur,
-                        "entry": float(row.get("entry_price", 0.0) or 0.0),
-                        "source": str(row.get("open_price_source", "?") or "?"),
-                        "cl_age_s": row.get("chainlink_age_s", None),
-                        "pnl": pnl,
-                        "won": bool(won),
-                    })
+                    self._add_resolved_sample(
+                        row.get("asset", ""), row.get("side", ""), dur, row.get("entry_price", 0.0),
+                        row.get("open_price_source", "?"), row.get("chainlink_age_s", None), pnl, won,
+                    )
                     loaded += 1
             if loaded > 0:
+                self._priors_version += 1
                 print(f"{B}[BOOT]{RS} loaded {loaded} resolved samples from metrics for runtime guards")
         except Exception as e:
             print(f"{Y}[BOOT] resolved-sample bootstrap failed: {e}{RS}")
@@ -6184,29 +6425,12 @@ class LiveTrader:
         if not RECENT_SIDE_PRIOR_ENABLED:
             return {"score_adj": 0, "edge_adj": 0.0, "prob_adj": 0.0, "n": 0, "exp": 0.0, "wr_lb": 0.5}
         try:
-            now_ts = _time.time()
-            lookback_s = max(0.0, float(RECENT_SIDE_PRIOR_LOOKBACK_H) * 3600.0)
-            vals = []
-            for s in list(self._resolved_samples)[-600:]:
-                if str(s.get("asset", "") or "") != asset:
-                    continue
-                if int(s.get("duration", 0) or 0) != int(duration):
-                    continue
-                if str(s.get("side", "") or "") != side:
-                    continue
-                ts = float(s.get("ts", 0.0) or 0.0)
-                if ts <= 0:
-                    continue
-                if lookback_s > 0 and (now_ts - ts) > lookback_s:
-                    continue
-                vals.append(s)
-            n = len(vals)
+            agg = self._resolved_index.get("side", (asset, int(duration), side), _time.time())
+            n = agg.n
             if n < max(1, RECENT_SIDE_PRIOR_MIN_N):
                 return {"score_adj": 0, "edge_adj": 0.0, "prob_adj": 0.0, "n": n, "exp": 0.0, "wr_lb": 0.5}
-            wins = sum(1 for x in vals if bool(x.get("won", False)))
-            pnl = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals)
-            exp = pnl / max(1, n)
-            wr_lb = self._wilson_lower_bound(wins, n)
+            exp = agg.exp
+            wr_lb = self._wilson_lower_bound(agg.wins, n)
             score_adj = 0
             edge_adj = 0.0
             prob_adj = 0.0
@@ -6241,29 +6465,14 @@ class LiveTrader:
         if (not ROLLING_15M_CALIB_ENABLED) or duration < 15:
             return {"prob_add": 0.0, "ev_add": 0.0, "size_mult": 1.0, "n": 0, "exp": 0.0, "wr_lb": 0.5}
         band = self._entry_band(entry)
-        src_ok = (open_src == "PM") and (cl_age_s is not None) and (float(cl_age_s) <= 45.0)
-        vals = []
-        for s in list(self._resolved_samples)[-max(50, ROLLING_15M_CALIB_WINDOW):]:
-            if int(s.get("duration", 0) or 0) < 15:
-                continue
-            if self._entry_band(float(s.get("entry", 0.0) or 0.0)) != band:
-                continue
-            s_src = str(s.get("source", "?") or "?")
-            s_age = s.get("cl_age_s", None)
-            s_ok = (s_src == "PM") and (s_age is not None) and (float(s_age) <= 45.0)
-            if s_ok != src_ok:
-                continue
-            vals.append(s)
-        n = len(vals)
+        src_ok = self._source_ok(open_src, cl_age_s)
+        agg = self._resolved_index.get("calib15", (True, band, src_ok))
+        n = agg.n
         if n < ROLLING_15M_CALIB_MIN_N:
             return {"prob_add": 0.0, "ev_add": 0.0, "size_mult": 1.0, "n": n, "exp": 0.0, "wr_lb": 0.5}
-        wins = sum(1 for x in vals if bool(x.get("won", False)))
-        pnl = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals)
-        exp = pnl / max(1, n)
-        gw = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals if float(x.get("pnl", 0.0) or 0.0) > 0)
-        gl = -sum(float(x.get("pnl", 0.0) or 0.0) for x in vals if float(x.get("pnl", 0.0) or 0.0) < 0)
-        pf = (gw / gl) if gl > 0 else (2.0 if gw > 0 else 1.0)
-        wr_lb = self._wilson_lower_bound(wins, n)
+        exp = agg.exp
+        pf = agg.pf
+        wr_lb = self._wilson_lower_bound(agg.wins, n)
         prob_add = 0.0
         ev_add = 0.0
         size_mult = 1.0
@@ -6296,56 +6505,17 @@ class LiveTrader:
         try:
             band = self._entry_band(float(entry or 0.0))
             now_ts = _time.time()
-            lookback_s = max(0.0, float(ASSET_ENTRY_PRIOR_LOOKBACK_H) * 3600.0)
-            src_ok = (open_src == "PM") and (cl_age_s is not None) and (float(cl_age_s) <= 45.0)
-            vals = []
-            for s in list(self._resolved_samples)[-1200:]:
-                if str(s.get("asset", "") or "") != str(asset):
-                    continue
-                if int(s.get("duration", 0) or 0) != int(duration):
-                    continue
-                if str(s.get("side", "") or "") != str(side):
-                    continue
-                if self._entry_band(float(s.get("entry", 0.0) or 0.0)) != band:
-                    continue
-                ts = float(s.get("ts", 0.0) or 0.0)
-                if ts <= 0:
-                    continue
-                if lookback_s > 0 and (now_ts - ts) > lookback_s:
-                    continue
-                s_src = str(s.get("source", "?") or "?")
-                s_age = s.get("cl_age_s", None)
-                s_ok = (s_src == "PM") and (s_age is not None) and (float(s_age) <= 45.0)
-                # Prefer same source-quality bucket; if sparse, fall back to full bucket.
-                if s_ok == src_ok:
-                    vals.append(s)
-            if len(vals) < max(1, ASSET_ENTRY_PRIOR_MIN_N // 2):
-                vals = []
-                for s in list(self._resolved_samples)[-1200:]:
-                    if str(s.get("asset", "") or "") != str(asset):
-                        continue
-                    if int(s.get("duration", 0) or 0) != int(duration):
-                        continue
-                    if str(s.get("side", "") or "") != str(side):
-                        continue
-                    if self._entry_band(float(s.get("entry", 0.0) or 0.0)) != band:
-                        continue
-                    ts = float(s.get("ts", 0.0) or 0.0)
-                    if ts <= 0:
-                        continue
-                    if lookback_s > 0 and (now_ts - ts) > lookback_s:
-                        continue
-                    vals.append(s)
-            n = len(vals)
+            bucket = (str(asset), int(duration), str(side), band)
+            # Prefer same source-quality bucket; if sparse, fall back to full bucket.
+            agg = self._resolved_index.get("asset_entry", bucket + (self._source_ok(open_src, cl_age_s),), now_ts)
+            if agg.n < max(1, ASSET_ENTRY_PRIOR_MIN_N // 2):
+                agg = self._resolved_index.get("asset_entry", bucket, now_ts)
+            n = agg.n
             if n < max(1, ASSET_ENTRY_PRIOR_MIN_N):
                 return {"score_adj": 0, "edge_adj": 0.0, "prob_adj": 0.0, "size_mult": 1.0, "n": n, "exp": 0.0, "wr_lb": 0.5, "pf": 1.0, "band": band}
-            wins = sum(1 for x in vals if bool(x.get("won", False)))
-            pnl = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals)
-            exp = pnl / max(1, n)
-            wr_lb = self._wilson_lower_bound(wins, n)
-            gross_win = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals if float(x.get("pnl", 0.0) or 0.0) > 0)
-            gross_loss = -sum(float(x.get("pnl", 0.0) or 0.0) for x in vals if float(x.get("pnl", 0.0) or 0.0) < 0)
-            pf = (gross_win / gross_loss) if gross_loss > 0 else (2.0 if gross_win > 0 else 1.0)
+            exp = agg.exp
+            wr_lb = self._wilson_lower_bound(agg.wins, n)
+            pf = agg.pf
 
             score_adj = 0
             edge_adj = 0.0
@@ -6594,29 +6764,19 @@ class LiveTrader:
         return lock_mins, move_min
 
     def _five_m_quality_snapshot(self, window: int | None = None) -> dict:
-        """Rolling settled quality snapshot for 5m only (from on-chain resolved samples)."""
-        w = int(window or FIVE_M_GUARD_WINDOW)
-        vals = []
-        for s in reversed(self._resolved_samples):
-            if int(s.get("duration", 0) or 0) > 5:
-                continue
-            vals.append(s)
-            if len(vals) >= max(1, w):
-                break
-        vals.reverse()
-        n = len(vals)
-        wins = sum(1 for x in vals if bool(x.get("won", False)))
-        wr = (wins / n) if n > 0 else 0.0
-        pnl = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals)
-        gross_win = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals if float(x.get("pnl", 0.0) or 0.0) > 0.0)
-        gross_loss = -sum(float(x.get("pnl", 0.0) or 0.0) for x in vals if float(x.get("pnl", 0.0) or 0.0) < 0.0)
-        pf = (gross_win / gross_loss) if gross_loss > 0 else (2.0 if gross_win > 0 else 1.0)
+        """Rolling settled quality snapshot for 5m only (from on-chain resolved samples).
+
+        ``window`` must be one of the five_m windows built in _new_resolved_index.
+        """
+        w = max(1, int(window or FIVE_M_GUARD_WINDOW))
+        agg = self._resolved_index.get(f"five_m:{w}", True)
+        n = agg.n
         return {
             "n": n,
-            "wins": wins,
-            "wr": wr,
-            "pnl": pnl,
-            "pf": pf,
+            "wins": agg.wins,
+            "wr": (agg.wins / n) if n > 0 else 0.0,
+            "pnl": agg.pnl,
+            "pf": agg.pf,
         }
 
     def _update_5m_runtime_guard(self):
@@ -6915,20 +7075,12 @@ class LiveTrader:
         d = int(duration or 0)
         if d not in (5, 15):
             return 0.0
-        vals = []
-        for s in reversed(self._resolved_samples):
-            if int(s.get("duration", 0) or 0) != d:
-                continue
-            vals.append(s)
-            if len(vals) >= 160:
-                break
-        n = len(vals)
+        agg = self._resolved_index.get("horizon", d)
+        n = agg.n
         if n < 12:
             return 0.0
-        wins = sum(1 for x in vals if bool(x.get("won", False)))
-        pnl = sum(float(x.get("pnl", 0.0) or 0.0) for x in vals)
-        wr_lb = self._wilson_lower_bound(int(wins), int(n), z=1.0)
-        exp = pnl / max(1, n)
+        wr_lb = self._wilson_lower_bound(agg.wins, n, z=1.0)
+        exp = agg.exp
         b = 0.0
         if wr_lb >= 0.52:
             b += min(0.012, (wr_lb - 0.52) * 0.10)
@@ -7176,6 +7328,7 @@ class LiveTrader:
         return MOMENTUM_WEIGHT
 
     def _load_stats(self):
+        self._priors_version += 1
         if BUCKET_STATS_RESET_ON_BOOT:
             # One-time fresh start: wipe all historical stats and write empty files.
             # Subsequent restarts with same flag load the empty files → no-op.
@@ -7312,6 +7465,7 @@ class LiveTrader:
             row["gross_loss"] = float(row.get("gross_loss", 0.0)) + abs(float(pnl))
         row["pnl"] = float(row.get("pnl", 0.0)) + float(pnl)
         self.side_perf[sp_key] = row
+        self._priors_version += 1
         # Track consecutive losses for adaptive signals (no pause — trade every cycle)
         if won:
             self.consec_losses = 0
@@ -7396,7 +7550,7 @@ class LiveTrader:
                 address=Web3.to_checksum_address(CHAINLINK_FEEDS[asset]),
                 abi=CHAINLINK_ABI
             )
-            latest = await loop.run_in_executor(None, contract.functions.latestRoundData().call)
+            latest = await loop.run_in_executor(self._lanes.chain, contract.functions.latestRoundData().call)
             round_id   = latest[0]
             updated_at = latest[3]
             price      = latest[1]
@@ -7420,7 +7574,7 @@ class LiveTrader:
                 prev_id = (phase_id << 64) | prev_agg
                 try:
                     data = await loop.run_in_executor(
-                        None, lambda rid=prev_id: contract.functions.getRoundData(rid).call()
+                        self._lanes.chain, lambda rid=prev_id: contract.functions.getRoundData(rid).call()
                     )
                     prev_updated = data[3]
                     prev_price   = data[1]
@@ -7454,36 +7608,40 @@ class LiveTrader:
         await asyncio.sleep(6)
         while True:
           try:
-            self._reload_copyflow()
-            # Cleanup stale pre-bid plans.
             now_epoch = _time.time()
-            for pcid, plan in list(self._prebid_plan.items()):
-                st = float((plan or {}).get("start_ts", 0) or 0)
-                if st <= 0 or now_epoch > (st + PREBID_ARM_WINDOW_SEC + 120):
-                    self._prebid_plan.pop(pcid, None)
-            # Settlement always has priority over new entries.
-            await self._resolve()
-            self._update_5m_runtime_guard()
-            self._apply_autopilot_policy()
-            if self.pending_redeem:
-                pending_n = len(self.pending_redeem)
-                claimable_n = int(self.onchain_redeemable_count or 0)
-                oldest_q_min = 0.0
-                if self._redeem_queued_ts:
-                    try:
-                        now_q = _time.time()
-                        oldest_q = min(float(v or now_q) for v in self._redeem_queued_ts.values())
-                        oldest_q_min = max(0.0, (now_q - oldest_q) / 60.0)
-                    except Exception:
-                        oldest_q_min = 0.0
-                # Never hard-block entries on pending redeem; redeem loop runs in parallel.
-                # Keep visibility via logs only.
-                if self._should_log("settle-first-soft", LOG_SETTLE_FIRST_EVERY_SEC):
-                    print(
-                        f"{Y}[SETTLE-FIRST-SOFT]{RS} pending_redeem={pending_n} "
-                        f"(claimable={claimable_n}, oldest={oldest_q_min:.1f}m) "
-                        f"— redeem runs in parallel; continue scanning"
-                    )
+            # Feed events only request re-scores; REST-backed upkeep keeps the SCAN_INTERVAL cadence.
+            housekeep = (now_epoch - self._scan_housekeep_ts) >= SCAN_INTERVAL
+            if housekeep:
+                self._scan_housekeep_ts = now_epoch
+                self._reload_copyflow()
+                # Cleanup stale pre-bid plans.
+                for pcid, plan in list(self._prebid_plan.items()):
+                    st = float((plan or {}).get("start_ts", 0) or 0)
+                    if st <= 0 or now_epoch > (st + PREBID_ARM_WINDOW_SEC + 120):
+                        self._prebid_plan.pop(pcid, None)
+                # Settlement always has priority over new entries.
+                await self._resolve()
+                self._update_5m_runtime_guard()
+                self._apply_autopilot_policy()
+                if self.pending_redeem:
+                    pending_n = len(self.pending_redeem)
+                    claimable_n = int(self.onchain_redeemable_count or 0)
+                    oldest_q_min = 0.0
+                    if self._redeem_queued_ts:
+                        try:
+                            now_q = _time.time()
+                            oldest_q = min(float(v or now_q) for v in self._redeem_queued_ts.values())
+                            oldest_q_min = max(0.0, (now_q - oldest_q) / 60.0)
+                        except Exception:
+                            oldest_q_min = 0.0
+                    # Never hard-block entries on pending redeem; redeem loop runs in parallel.
+                    # Keep visibility via logs only.
+                    if self._should_log("settle-first-soft", LOG_SETTLE_FIRST_EVERY_SEC):
+                        print(
+                            f"{Y}[SETTLE-FIRST-SOFT]{RS} pending_redeem={pending_n} "
+                            f"(claimable={claimable_n}, oldest={oldest_q_min:.1f}m) "
+                            f"— redeem runs in parallel; continue scanning"
+                        )
             if self._pause_entries_until > _time.time():
                 if self._should_log("pause-entries", LOG_SETTLE_FIRST_EVERY_SEC):
                     rem_s = max(0.0, self._pause_entries_until - _time.time())
@@ -7501,6 +7659,7 @@ class LiveTrader:
                 int(self.onchain_redeemable_count),
             )
             state_changed = scan_state != self._scan_state_last
+            due = self._eval_sched.drain(EVAL_MAX_BATCH, key=self._eval_priority)
             if (not LOG_SCAN_ON_CHANGE_ONLY) or state_changed or self._should_log("scan-heartbeat", LOG_SCAN_EVERY_SEC):
                 print(
                     f"{B}[SCAN]{RS} Live markets: {len(markets)} | "
@@ -7557,20 +7716,21 @@ class LiveTrader:
 
             # Prefetch Polymarket open prices in parallel to avoid sequential stalls.
             pm_open_tasks = {}
-            for cid, m in markets.items():
-                if m.get("start_ts", 0) > now:
-                    continue
-                if (m.get("end_ts", 0) - now) / 60 < 1:
-                    continue
-                src_known = self.open_prices_source.get(cid, "?")
-                need_pm = (cid not in self.open_prices) or (src_known != "PM")
-                if not need_pm:
-                    continue
-                asset = m.get("asset")
-                dur = int(m.get("duration", 0) or 0)
-                start_ts = float(m.get("start_ts", now) or now)
-                end_ts_m = float(m.get("end_ts", now + max(1, dur) * 60) or (now + max(1, dur) * 60))
-                pm_open_tasks[cid] = self._get_polymarket_open_price(asset, start_ts, end_ts_m, dur)
+            if housekeep:
+                for cid, m in markets.items():
+                    if m.get("start_ts", 0) > now:
+                        continue
+                    if (m.get("end_ts", 0) - now) / 60 < 1:
+                        continue
+                    src_known = self.open_prices_source.get(cid, "?")
+                    need_pm = (cid not in self.open_prices) or (src_known != "PM")
+                    if not need_pm:
+                        continue
+                    asset = m.get("asset")
+                    dur = int(m.get("duration", 0) or 0)
+                    start_ts = float(m.get("start_ts", now) or now)
+                    end_ts_m = float(m.get("end_ts", now + max(1, dur) * 60) or (now + max(1, dur) * 60))
+                    pm_open_tasks[cid] = self._get_polymarket_open_price(asset, start_ts, end_ts_m, dur)
             pm_open_prefetch = {}
             if pm_open_tasks:
                 pm_vals = await self._gather_bounded(
@@ -7580,6 +7740,8 @@ class LiveTrader:
                 for cid, v in zip(pm_open_tasks.keys(), pm_vals):
                     pm_open_prefetch[cid] = 0.0 if isinstance(v, Exception) else float(v or 0.0)
 
+            # One consistent view of prices/features for pre-open analysis, scoring and consensus.
+            snap = self._feature_snapshot()
             # Evaluate ALL eligible markets in parallel — no more sequential blocking
             candidates = []
             eligible_started = 0
@@ -7587,7 +7749,7 @@ class LiveTrader:
             for cid, m in markets.items():
                 if m["start_ts"] > now:
                     sec_to_start = m["start_ts"] - now
-                    if NEXT_MARKET_ANALYSIS_ENABLED and sec_to_start <= max(30.0, NEXT_MARKET_ANALYSIS_WINDOW_SEC):
+                    if housekeep and NEXT_MARKET_ANALYSIS_ENABLED and sec_to_start <= max(30.0, NEXT_MARKET_ANALYSIS_WINDOW_SEC):
                         flow_pre = self._copyflow_live.get(cid) or self._copyflow_map.get(cid, {})
                         upc = dnc = 0.0
                         if isinstance(flow_pre, dict):
@@ -7597,10 +7759,11 @@ class LiveTrader:
                         flow_conf = max(upc, dnc) if (upc + dnc) > 0 else 0.0
                         asset_pre = str(m.get("asset", "") or "")
                         dur_pre = int(m.get("duration", 0) or 0)
-                        mom_up = float(self._momentum_prob(asset_pre, seconds=60))
-                        ob = float(self._binance_imbalance(asset_pre))
-                        tk_ratio, _ = self._binance_taker_flow(asset_pre)
-                        perp_basis, _ = self._binance_perp_signals(asset_pre)
+                        fa = snap.assets.get(asset_pre) or self._asset_features(asset_pre)
+                        mom_up = fa.mom_60s
+                        ob = fa.ob_imbalance
+                        tk_ratio = fa.taker_ratio
+                        perp_basis = fa.perp_basis
                         # Pre-open side prior from live feeds (non-blocking, quickly recomputed each scan).
                         up_score = (
                             (mom_up - 0.5) * 1.20
@@ -7640,6 +7803,8 @@ class LiveTrader:
                 dur      = m.get("duration", 0)
                 title_s  = m.get("question", "")[:50]
                 if cid not in self.open_prices:
+                    if not housekeep:
+                        continue  # open-price discovery runs on upkeep passes
                     start_ts = m.get("start_ts", now)
                     # Authoritative reference: Polymarket's own price API
                     ref = float(pm_open_prefetch.get(cid, 0.0) or 0.0)
@@ -7689,17 +7854,22 @@ class LiveTrader:
                             cur_fmt = f"{cur:,.6f}" if cur < 100 else f"{cur:,.2f}"
                             print(f"{B}[MKT] {asset} {dur}m | beat=${ref_fmt} [{src}] | "
                                   f"now=${cur_fmt} move={move:+.3f}% | {m['mins_left']:.1f}min left{RS}")
-                if cid not in self.seen:
-                    candidates.append(m)
-                else:
+                if cid in self.seen:
                     blocked_seen += 1
+                elif cid in due or (now - self._last_eval_time.get(cid, 0.0)) >= EVAL_SWEEP_SEC:
+                    # Only markets with a change event, or none for EVAL_SWEEP_SEC, are re-scored.
+                    candidates.append(m)
             if candidates:
-                # Score all markets in parallel.
+                # Score all markets in one batch (per-asset features computed once).
                 t_score = _time.perf_counter()
-                signals = list(await asyncio.gather(*[self._score_market(m) for m in candidates]))
+                signals = await self.score_batch(candidates, snap)
                 elapsed_ms = (_time.perf_counter() - t_score) * 1000.0
                 if candidates:
                     self._perf_update("score_ms", elapsed_ms / max(1, len(candidates)))
+                for m_c, s_c in zip(candidates, signals):
+                    cid_c = m_c.get("conditionId", "")
+                    self._last_eval_time[cid_c] = now
+                    self._eval_edge[cid_c] = float(s_c.get("edge", 0.0) or 0.0) if s_c else 0.0
                 valid   = sorted([s for s in signals if s is not None], key=lambda x: -x["score"])
                 # Force/synth fallback disabled: only real high-quality signals execute.
                 if ENABLE_5M and (not self._enable_5m_runtime) and valid and not (PROFIT_PUSH_MODE and PROFIT_PUSH_ADAPTIVE_MODE):
@@ -7788,7 +7958,7 @@ class LiveTrader:
                         _cid_c  = m.get("conditionId", "")
                         _asset_c = m.get("asset", "")
                         op = float(self.open_prices.get(_cid_c, 0.0) or 0.0)
-                        cur = float(self.prices.get(_asset_c, 0) or 0.0) or float(self.cl_prices.get(_asset_c, 0) or 0.0)
+                        cur = float(snap.prices.get(_asset_c, 0) or 0.0) or float(snap.cl_prices.get(_asset_c, 0) or 0.0)
                         if op <= 0 or cur <= 0:
                             continue
                         rel = (cur - op) / max(op, 1e-9)
@@ -7861,7 +8031,7 @@ class LiveTrader:
                 else:
                     self._no_trade_rounds += 1
 
-            await asyncio.sleep(SCAN_INTERVAL)
+            await self._eval_sched.wait(SCAN_INTERVAL - (_time.time() - self._scan_housekeep_ts))
           except Exception as e:
             print(f"{R}[SCAN] Error (continuing): {e}{RS}")
             if self._noisy_log_enabled("scan-traceback", 5.0):
@@ -7902,7 +8072,7 @@ class LiveTrader:
                 # 1) On-chain wallet USDC + Polymarket positions fetched in parallel.
                 usdc_task = (
                     loop.run_in_executor(
-                        None, lambda: usdc_contract.functions.balanceOf(addr_cs).call()
+                        self._lanes.chain, lambda: usdc_contract.functions.balanceOf(addr_cs).call()
                     )
                     if usdc_contract and addr_cs
                     else asyncio.sleep(0, result=0)
@@ -8528,11 +8698,11 @@ class LiveTrader:
                         continue
                     cid_bytes = bytes.fromhex(cid.lstrip("0x").zfill(64))
                     try:
-                        denom = await loop.run_in_executor(None, lambda b=cid_bytes: ctf.functions.payoutDenominator(b).call())
+                        denom = await loop.run_in_executor(self._lanes.background, lambda b=cid_bytes: ctf.functions.payoutDenominator(b).call())
                         if denom == 0:
                             continue
-                        n0 = await loop.run_in_executor(None, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 0).call())
-                        n1 = await loop.run_in_executor(None, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 1).call())
+                        n0 = await loop.run_in_executor(self._lanes.background, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 0).call())
+                        n1 = await loop.run_in_executor(self._lanes.background, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 1).call())
                     except Exception:
                         continue
                     if n0 > 0 and n1 == 0:
@@ -8583,7 +8753,7 @@ class LiveTrader:
             try:
                 import requests as _req
                 loop = asyncio.get_running_loop()
-                positions = await loop.run_in_executor(None, lambda: _req.get(
+                positions = await loop.run_in_executor(self._lanes.background, lambda: _req.get(
                     "https://data-api.polymarket.com/positions",
                     params={"user": ADDRESS, "sizeThreshold": "0.01", "redeemable": "false"}, timeout=10
                 ).json())
@@ -8687,7 +8857,7 @@ class LiveTrader:
                                 address=Web3.to_checksum_address(get_contract_config(CHAIN_ID, neg_risk=False).conditional_tokens),
                                 abi=_BABI)
                             _onchain_bal = await loop.run_in_executor(
-                                None, lambda ti=int(_token_id_str): _ctf_v.functions.balanceOf(
+                                self._lanes.background, lambda ti=int(_token_id_str): _ctf_v.functions.balanceOf(
                                     Web3.to_checksum_address(ADDRESS), ti).call())
                         except Exception:
                             _onchain_bal = -1  # unknown — allow, _verify will catch it
@@ -8722,11 +8892,7 @@ class LiveTrader:
             return
         while True:
             try:
-                loop = asyncio.get_running_loop()
-                hb_resp = await loop.run_in_executor(
-                    None,
-                    lambda: self.clob.post_heartbeat(self._heartbeat_id),
-                )
+                hb_resp = await self._clob_call("post_heartbeat", self._heartbeat_id, lane=self._lanes.order)
                 if isinstance(hb_resp, dict):
                     next_id = (hb_resp.get("heartbeat_id") or "").strip()
                     if next_id:
@@ -8749,9 +8915,15 @@ class LiveTrader:
         if DRY_RUN or (not USER_EVENTS_ENABLED):
             return
         while True:
+            if self._order_tracker.connected:
+                # The user WS channel is feeding the cache; no REST polling needed.
+                if len(self._order_event_cache) > 2000:
+                    self._prune_order_event_cache()
+                self._order_tracker.prune()
+                await asyncio.sleep(max(0.25, USER_EVENTS_POLL_SEC))
+                continue
             try:
-                loop = asyncio.get_running_loop()
-                rows = await loop.run_in_executor(None, self.clob.get_notifications)
+                rows = await self._clob_call("get_notifications", lane=self._lanes.background)
                 if isinstance(rows, dict):
                     # Different wrappers sometimes return {"data":[...]}
                     rows = rows.get("data", []) or rows.get("notifications", [])
@@ -8762,15 +8934,40 @@ class LiveTrader:
                             self._cache_order_event(oid, st, fs)
                     # Acknowledge consumed notifications to keep payload light.
                     try:
-                        await loop.run_in_executor(None, self.clob.drop_notifications)
+                        await self._clob_call("drop_notifications", lane=self._lanes.background)
                     except Exception:
                         pass
                 if len(self._order_event_cache) > 2000:
                     self._prune_order_event_cache()
+                    self._order_tracker.prune()
             except Exception as e:
                 self._errors.tick("user_events_loop", print, err=e, every=20)
             await asyncio.sleep(max(0.25, USER_EVENTS_POLL_SEC))
 
+    def _on_order_state(self, st) -> None:
+        self._cache_order_event(st.order_id, st.status, st.size_matched)
+
+    async def _stream_clob_user(self):
+        """Authenticated CLOB user channel: push order/trade state into the OrderTracker."""
+        if DRY_RUN or (not CLOB_USER_WS_ENABLED) or self._clob_creds is None:
+            return
+        creds = self._clob_creds
+        auth = {"apiKey": creds.api_key, "secret": creds.api_secret, "passphrase": creds.api_passphrase}
+        delay = 2
+        while True:
+            t0 = _time.time()
+            try:
+                print(f"{G}[CLOB-USER-WS] connecting{RS}")
+                await stream_user_channel(CLOB_USER_WSS, auth, self._order_tracker, on_state=self._on_order_state)
+            except Exception as e:
+                self._errors.tick("clob_user_ws", print, err=e, every=8)
+                print(f"{Y}[CLOB-USER-WS] {e} — reconnect in {delay}s{RS}")
+            self._order_tracker.prune()
+            if _time.time() - t0 >= 30:
+                delay = 2
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+
     async def _health_check(self):
         now = _time.time()
 
@@ -8972,6 +9169,7 @@ class LiveTrader:
     def _dashboard_data(self) -> dict:
         """Collect current bot state as a JSON-serialisable dict for the web dashboard."""
         import time as _t
+        from clawbot_v2.strategy.core import SCORE_GRAPHS
         now_ts = _t.time()
         el = datetime.now(timezone.utc) - self.start_time
         h, m = int(el.total_seconds() // 3600), int(el.total_seconds() % 3600 // 60)
@@ -9008,7 +9206,7 @@ class LiveTrader:
         for asset, ph in self.price_history.items():
             cutoff = now_ts - 1200
             pts = [{"t": round(ts, 1), "p": round(px, 6)}
-                   for ts, px in ph if ts >= cutoff and px > 0]
+                   for ts, px in ph.since(cutoff) if px > 0]
             if pts:
                 charts[asset] = pts
 
@@ -9350,6 +9548,14 @@ class LiveTrader:
             "charts": charts,
             "positions": positions,
             "skip_top": skip_top,
+            "score_cache": self._score_cache.stats(),
+            "eval_sched": self._eval_sched.stats(),
+            "eval_queue": self._eval_queue.stats(),
+            "presign": self._presign.stats(),
+            "order_latency": {k: h.snapshot() for k, h in self._order_lat.items()},
+            "executors": self._lanes.stats(),
+            "order_tracker": self._order_tracker.stats(),
+            "gate_graph": {g.name: g.stats() for g in SCORE_GRAPHS},
             "execq": execq,
             "execq_all": execq_all,
             "active_gates": active_gates,
@@ -9871,6 +10077,19 @@ function renderLeft(d){
     h+=`<div class="card"><div class="ch">Skip Reasons · 15m</div>`+
       sk.map(s=>`<div class="skrow"><span class="skr">${s.reason}</span><span class="skc">${s.count}</span></div>`).join('')+`</div>`;
   }
+  const sc=d.score_cache;
+  if(sc){
+    h+=`<div class="card"><div class="ch">Score Cache</div>`+
+      `<div class="skrow"><span class="skr">hit rate</span><span class="skc">${(sc.hit_rate*100).toFixed(1)}%</span></div>`+
+      `<div class="skrow"><span class="skr">hits / misses</span><span class="skc">${sc.hits} / ${sc.misses}</span></div>`+
+      `<div class="skrow"><span class="skr">size · evicted</span><span class="skc">${sc.size} · ${sc.evictions}</span></div></div>`;
+  }
+  const gg=d.gate_graph||{};
+  for(const [g,nodes] of Object.entries(gg)){
+    if(!nodes.some(n=>n.calls))continue;
+    h+=`<div class="card"><div class="ch">Score Graph · ${g}</div>`+
+      nodes.map(n=>`<div class="skrow"><span class="skr">${n.name}${n.gate?'':' (feature)'}</span><span class="skc">${n.gate?(n.hit_rate*100).toFixed(1)+'% · ':''}${n.us_avg}µs</span></div>`).join('')+`</div>`;
+  }
   document.getElementById('lpanel').innerHTML=h;
 }
 
@@ -9982,6 +10201,13 @@ setInterval(pollMid,2000);
                 headers=_NO_CACHE_HEADERS,
             )
 
+        async def handle_metrics(request):
+            return web.Response(
+                text=self._skip_counts.prometheus() + self._lanes.prometheus(),
+                content_type="text/plain",
+                headers=_NO_CACHE_HEADERS,
+            )
+
         async def handle_reload_buckets(request):
             try:
                 self._bucket_stats.rows.clear()
@@ -10243,6 +10469,7 @@ setInterval(pollMid,2000);
         app.router.add_get("/dur-stats", handle_dur_stats)
         app.router.add_get("/corr", handle_corr)
         app.router.add_get("/reload-buckets", handle_reload_buckets)
+        app.router.add_get("/metrics", handle_metrics)
         runner = web.AppRunner(app)
         await runner.setup()
         site = web.TCPSite(runner, "0.0.0.0", port)
@@ -10263,6 +10490,7 @@ setInterval(pollMid,2000);
 ╚══════════════════════════════════════════════════════════════╝{RS}
         """)
         self._startup_self_check()
+        self._install_executors()
         while True:
             try:
                 self.init_clob()
@@ -10298,6 +10526,7 @@ setInterval(pollMid,2000);
             _guard("_redeem_loop",          self._redeem_loop),
             _guard("_heartbeat_loop",       self._heartbeat_loop),
             _guard("_user_events_loop",     self._user_events_loop),
+            _guard("_stream_clob_user",     self._stream_clob_user),
             _guard("_force_redeem_backfill_loop", self._force_redeem_backfill_loop),
             _guard("chainlink_loop",        self.chainlink_loop),
             _guard("chainlink_ws_loop",     self.chainlink_ws_loop),
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import importlib
 
+from clawbot_v2.execution.presign import fok_ladder
+from clawbot_v2.execution.splitter import BankrollReservation, execute_split, plan_fok_children
+
 _LOADED = False
 
 def _ensure_globals() -> None:
@@ -66,7 +69,7 @@ async def _execute_trade(self, sig: dict):
         self._round_side_attempt_ts[round_side_key] = now_attempt
         self._cid_side_attempt_ts[cid_side_key] = now_attempt
         self._executing_cids.add(cid)
-        self._reserved_bankroll += float(sig.get("size", 0.0) or 0.0)  # H-4: pre-reserve
+        reservation = BankrollReservation(self, float(sig.get("size", 0.0) or 0.0))  # H-4: pre-reserve
     score       = sig["score"]
     score_stars = f"{G}★★★{RS}" if score >= 12 else (f"{G}★★{RS}" if score >= 9 else "★")
     agree_str   = "" if sig["cl_agree"] else f" {Y}[CL!]{RS}"
@@ -199,6 +202,7 @@ async def _execute_trade(self, sig: dict):
             hc15_mode=sig.get("hc15_mode", False),
             hc15_fallback_cap=HC15_FALLBACK_MAX_ENTRY,
             core_position=(not is_booster),
+            reservation=reservation,
         )
         self._perf_update("order_ms", (_time.perf_counter() - t_ord) * 1000.0)
         order_id = (exec_result or {}).get("order_id", "")
@@ -358,7 +362,7 @@ async def _execute_trade(self, sig: dict):
     finally:
         async with self._exec_lock:
             self._executing_cids.discard(cid)
-            self._reserved_bankroll = max(0.0, self._reserved_bankroll - float(sig.get("size", 0.0) or 0.0))  # H-4: release
+            reservation.release()  # H-4: release what the order did not spend
 
 async def evaluate(self, m: dict):
     _ensure_globals()
@@ -369,7 +373,51 @@ async def evaluate(self, m: dict):
     if sig and sig["score"] >= MIN_SCORE_GATE:
         await self._execute_trade(sig)
 
-async def _place_order(self, token_id, side, price, size_usdc, asset, duration, mins_left, true_prob=0.5, cl_agree=True, min_edge_req=None, force_taker=False, score=0, pm_book_data=None, use_limit=False, max_entry_allowed=None, hc15_mode=False, hc15_fallback_cap=0.36, core_position=True):
+async def _presign_fok(self, sig: dict) -> None:
+    _ensure_globals()
+    """Sign FOK BUY templates for ``sig`` at a ladder around its best ask.
+
+    Runs while the signal waits for a better entry, so ``_post_limit_fok`` can
+    post a ready order instead of signing on the fire path. Size and price
+    keys match ``_post_limit_fok`` exactly; anything else is a cache miss.
+    """
+    try:
+        token_id = str(sig.get("token_id", "") or "")
+        amount_usdc = float(round(max(0.0, float(sig.get("size", 0.0) or 0.0)), 2))
+        if not token_id or amount_usdc < max(float(MIN_EXEC_NOTIONAL_USDC), 1.0):
+            return
+        book = sig.get("pm_book_data")
+        if isinstance(book, dict):
+            best_ask = float(book.get("best_ask", 0.0) or 0.0)
+            tick = float(book.get("tick", 0.01) or 0.01)
+        elif isinstance(book, (tuple, list)) and len(book) >= 3:
+            best_ask, tick = float(book[1]), float(book[2] or 0.01)
+        else:
+            ws_book = self._clob_ws_books.get(token_id)
+            if ws_book is None:
+                return
+            best_ask, tick = float(ws_book.best_ask or 0.0), float(ws_book.tick or 0.01)
+        if best_ask <= 0:
+            return
+        cap = float(sig.get("max_entry_allowed", MAX_ENTRY_PRICE) or 0.99)
+        prices = fok_ladder(best_ask, tick, cap, max(0, PRESIGN_LADDER_TICKS))
+        loop = asyncio.get_running_loop()
+        for px in self._presign.missing(token_id, amount_usdc, prices, _time.time()):
+            order_args = MarketOrderArgs(
+                token_id=token_id,
+                amount=amount_usdc,
+                side="BUY",
+                price=float(px),
+                order_type=OrderType.FOK,
+            )
+            t_sign0 = _time.perf_counter()
+            signed = await loop.run_in_executor(self._lanes.presign, lambda a=order_args: self.clob.create_market_order(a))
+            self._order_lat["sign"].observe((_time.perf_counter() - t_sign0) * 1000.0)
+            self._presign.put(token_id, amount_usdc, px, signed, _time.time())
+    except Exception as e:
+        self._errors.tick("presign", print, err=e, every=20)
+
+async def _place_order(self, token_id, side, price, size_usdc, asset, duration, mins_left, true_prob=0.5, cl_agree=True, min_edge_req=None, force_taker=False, score=0, pm_book_data=None, use_limit=False, max_entry_allowed=None, hc15_mode=False, hc15_fallback_cap=0.36, core_position=True, reservation=None):
     _ensure_globals()
     """Maker-first order strategy:
     1. Post bid at mid-price (best_bid+best_ask)/2 — collect the spread
@@ -431,25 +479,33 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                         continue
                 return float(depth)
 
-            async def _post_limit_fok(exec_price: float) -> tuple[dict, float]:
+            async def _post_limit_fok(exec_price: float, amount: float | None = None) -> tuple[dict, float]:
                 # Strict instant execution with price cap to keep slippage near zero.
                 px = round(max(0.001, min(exec_price, 0.97)), 4)
                 px_order = round(px, 2)
-                amount_usdc = _normalize_buy_amount(size_usdc)
-                order_args = MarketOrderArgs(
-                    token_id=token_id,
-                    amount=float(amount_usdc),
-                    side="BUY",
-                    price=float(px_order),
-                    order_type=OrderType.FOK,
-                )
-                t_sign0 = _time.perf_counter()
-                signed = await loop.run_in_executor(None, lambda: self.clob.create_market_order(order_args))
-                t_sign_ms = (_time.perf_counter() - t_sign0) * 1000.0
+                amount_usdc = _normalize_buy_amount(size_usdc if amount is None else amount)
+                # Armed signals may already hold a signed template for this exact order.
+                signed = self._presign.take(token_id, amount_usdc, px_order, _time.time())
+                if signed is None:
+                    order_args = MarketOrderArgs(
+                        token_id=token_id,
+                        amount=float(amount_usdc),
+                        side="BUY",
+                        price=float(px_order),
+                        order_type=OrderType.FOK,
+                    )
+                    t_sign0 = _time.perf_counter()
+                    signed = await loop.run_in_executor(self._lanes.order, lambda: self.clob.create_market_order(order_args))
+                    t_sign_ms = (_time.perf_counter() - t_sign0) * 1000.0
+                    self._order_lat["sign"].observe(t_sign_ms)
+                    sign_txt = f"{t_sign_ms:.0f}ms"
+                else:
+                    sign_txt = "presigned"
                 try:
                     t_post0 = _time.perf_counter()
-                    resp = await loop.run_in_executor(None, lambda: self.clob.post_order(signed, OrderType.FOK))
+                    resp = await self._clob_call("post_order", signed, OrderType.FOK)
                     t_post_ms = (_time.perf_counter() - t_post0) * 1000.0
+                    self._order_lat["post"].observe(t_post_ms)
                 except Exception as e:
                     # FOK semantics: if not fully matched immediately, exchange returns a kill error.
                     # Treat this as unfilled (not a hard order failure).
@@ -464,10 +520,56 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                 if ORDER_LATENCY_LOG_ENABLED:
                     print(
                         f"{B}[ORDER-LAT]{RS} {asset} {side} {duration}m "
-                        f"fok sign={t_sign_ms:.0f}ms post={t_post_ms:.0f}ms"
+                        f"fok sign={sign_txt} post={t_post_ms:.0f}ms"
                     )
+                if resp.get("status") in ("matched", "filled"):
+                    self._presign.discard(token_id)
                 return resp, float(px_order)
 
+            async def _post_split_fok(levels, ref_ask: float, cap: float, label: str) -> dict | None:
+                # One FOK at the best ask would be killed for lack of depth: split the order
+                # across ask levels up to the slippage cap and fire the children together.
+                if not SPLIT_FOK_ENABLED:
+                    return None
+                ws_now = self._get_clob_ws_book(token_id, max_age_ms=FAST_PATH_MAX_BOOK_AGE_MS)
+                if ws_now is not None and ws_now.get("asks"):
+                    levels = ws_now["asks"]
+                sweep_cap = min(cap, 0.97, ref_ask * (1.0 + slip_cap_bps / 10000.0))
+                children = plan_fok_children(
+                    levels, _normalize_buy_amount(size_usdc), sweep_cap,
+                    min_child_usdc=hard_min_notional, max_children=SPLIT_FOK_MAX_CHILDREN,
+                )
+                planned = sum(c.usdc for c in children)
+                if planned < size_usdc * SPLIT_FOK_MIN_FILL_RATIO:
+                    return None
+                print(
+                    f"{B}[SPLIT-FOK]{RS} {asset} {side} {label} {len(children)} children "
+                    f"${planned:.2f}/${size_usdc:.2f} sweep<={children[-1].price:.3f}"
+                )
+
+                def _on_child(child, filled_usdc: float) -> None:
+                    # Each fill moves from reserved to spent as it lands; killed children stay
+                    # reserved until _execute_trade releases the remainder.
+                    if reservation is not None:
+                        reservation.spend(filled_usdc)
+                    else:
+                        self.bankroll -= filled_usdc
+
+                res = await execute_split(children, lambda c: _post_limit_fok(c.price, c.usdc), on_child=_on_child)
+                if res.filled_usdc <= 0:
+                    return None
+                print(
+                    f"{G}[SPLIT-FILL]{RS} {side} {asset} {duration}m | ${res.filled_usdc:.2f} "
+                    f"@ avg {res.avg_price:.3f} | {res.filled}/{res.filled + res.killed} children | "
+                    f"Bank ${self.bankroll:.2f}"
+                )
+                return {
+                    "order_id": res.order_ids[0] if res.order_ids else "",
+                    "fill_price": res.avg_price,
+                    "mode": f"fok_split_{label}",
+                    "notional_usdc": res.filled_usdc,
+                }
+
             # Use pre-fetched book from scoring phase (free — ran in parallel with Binance signals)
             # or fetch fresh if not cached (~36ms)
             if pm_book_data is not None:
@@ -627,6 +729,10 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                 slip_now = _slip_bps(taker_price, best_ask)
                 needed_notional = _normalize_buy_amount(size_usdc) * FAST_FOK_MIN_DEPTH_RATIO
                 depth_now = _book_depth_usdc(asks, taker_price)
+                if depth_now < needed_notional and slip_now <= slip_cap_bps:
+                    split = await _post_split_fok(asks, best_ask, max_entry_allowed or 0.99, "fast")
+                    if split is not None:
+                        return split
                 if depth_now < needed_notional:
                     try:
                         ob2 = await self._get_order_book(token_id, force_fresh=True)
@@ -673,6 +779,10 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                     slip_now = _slip_bps(taker_price, best_ask)
                     needed_notional = _normalize_buy_amount(size_usdc) * FAST_FOK_MIN_DEPTH_RATIO
                     depth_now = _book_depth_usdc(asks, taker_price)
+                    if depth_now < needed_notional and slip_now <= slip_cap_bps:
+                        split = await _post_split_fok(asks, best_ask, max_entry_allowed or 0.99, "near_end")
+                        if split is not None:
+                            return split
                     if depth_now < needed_notional:
                         try:
                             ob2 = await self._get_order_book(token_id, force_fresh=True)
@@ -780,11 +890,13 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                 side="BUY",
             )
             t_sign0 = _time.perf_counter()
-            signed  = await loop.run_in_executor(None, lambda: self.clob.create_order(order_args))
+            signed  = await loop.run_in_executor(self._lanes.order, lambda: self.clob.create_order(order_args))
             t_sign_ms = (_time.perf_counter() - t_sign0) * 1000.0
+            self._order_lat["sign"].observe(t_sign_ms)
             t_post0 = _time.perf_counter()
-            resp    = await loop.run_in_executor(None, lambda: self.clob.post_order(signed, OrderType.GTC))
+            resp    = await self._clob_call("post_order", signed, OrderType.GTC)
             t_post_ms = (_time.perf_counter() - t_post0) * 1000.0
+            self._order_lat["post"].observe(t_post_ms)
             if ORDER_LATENCY_LOG_ENABLED:
                 print(
                     f"{B}[ORDER-LAT]{RS} {asset} {side} {duration}m "
@@ -824,7 +936,14 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                   f"waiting up to {polls*poll_interval}s for fill...{RS}")
 
             filled = False
-            for i in range(polls):
+            tracker = self._order_tracker
+            tracker.track(order_id, round(size_tok_m, 2))
+            ws_push = tracker.connected  # read once: a mid-wait disconnect must not add a poll hold
+            if ws_push:
+                # User-WS push: the fill (or cancel) wakes us; no REST calls while waiting.
+                st = await tracker.wait(order_id, polls * poll_interval)
+                filled = st.status == "filled"
+            for i in range(0 if ws_push else polls):
                 await asyncio.sleep(poll_interval)
                 ev = dict(self._order_event_cache.get(order_id) or {})
                 ev_status = str(ev.get("status", "") or "").lower()
@@ -836,7 +955,7 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                 try:
                     # Poll fallback only every other tick when user-events cache is active.
                     if i % 2 == 0:
-                        info = await loop.run_in_executor(None, lambda: self.clob.get_order(order_id))
+                        info = await self._clob_call("get_order", order_id)
                     else:
                         info = None
                     if isinstance(info, dict) and info.get("status") in ("matched", "filled"):
@@ -865,7 +984,9 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                 ev_fill = float(ev.get("filled_size", 0.0) or 0.0)
                 info = None
                 if ev_fill <= 0:
-                    info = await loop.run_in_executor(None, lambda: self.clob.get_order(order_id))
+                    # One REST check even with WS push: a late or missing fill
+                    # event must not send us to cancel + taker with a live fill.
+                    info = await self._clob_call("get_order", order_id)
                 if isinstance(info, dict):
                     filled_sz = float(info.get("filled_size") or info.get("filledSize") or 0.0)
                 else:
@@ -889,7 +1010,7 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
 
             # Cancel maker, fall back to taker with fresh book
             try:
-                await loop.run_in_executor(None, lambda: self.clob.cancel(order_id))
+                await self._clob_call("cancel", order_id)
             except Exception:
                 pass
 
@@ -985,7 +1106,7 @@ async def _place_order(self, token_id, side, price, size_usdc, asset, duration,
                     if ev_status == "filled":
                         info = {"status": "filled"}
                     else:
-                        info = await loop.run_in_executor(None, lambda: self.clob.get_order(order_id))
+                        info = await self._clob_call("get_order", order_id)
                     if isinstance(info, dict) and info.get("status") in ("matched", "filled"):
                         self.bankroll -= size_usdc
                         self._cache_order_event(order_id, "filled", 0.0)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import websockets
+
+from clawbot_v2.data.feed_decoder import FeedDecoder
+
+LIVE = "live"
+PARTIAL = "partial"
+FILLED = "filled"
+CANCELED = "canceled"
+
+
+@dataclass
+class OrderState:
+    order_id: str
+    status: str = LIVE
+    original_size: float = 0.0
+    size_matched: float = 0.0
+    traded: float = 0.0  # sum of distinct trade fills; covers a missed order UPDATE
+    ts: float = field(default_factory=time.time)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def terminal(self) -> bool:
+        return self.status in (FILLED, CANCELED)
+
+
+def _f(v) -> float:
+    try:
+        return float(v or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class OrderTracker:
+    """Order-state machine fed by the authenticated user WebSocket channel.
+
+    Orders move ``live -> partial -> filled`` as matched size grows, or to
+    ``canceled``; ``filled`` and ``canceled`` are terminal and set the
+    order's ``done`` event, so a maker wait is ``await wait(oid, timeout)``.
+    Events for orders not yet tracked are kept too, since a fill can land
+    before ``post_order`` returns the id. ``connected`` tells callers whether
+    the channel has delivered events since it (re)connected or they still
+    need REST polling.
+    """
+
+    def __init__(self, *, owner: str = "", ttl_sec: float = 180.0, max_trades: int = 4096):
+        self.owner = owner
+        self.ttl_sec = float(ttl_sec)
+        self.max_trades = max(64, int(max_trades))
+        self.connected = False
+        self._orders: dict[str, OrderState] = {}
+        self._trades: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self.events = 0
+        self.fills = 0
+
+    def get(self, order_id: str) -> OrderState | None:
+        return self._orders.get(order_id)
+
+    def track(self, order_id: str, original_size: float = 0.0) -> OrderState:
+        st = self._orders.get(order_id)
+        if st is None:
+            st = self._orders[order_id] = OrderState(order_id)
+        if original_size > 0 and st.original_size <= 0:
+            st.original_size = float(original_size)
+            self._settle(st, "")
+        return st
+
+    def apply(
+        self,
+        order_id: str,
+        *,
+        status: str = "",
+        size_matched: float = 0.0,
+        original_size: float = 0.0,
+    ) -> OrderState | None:
+        if not order_id:
+            return None
+        st = self.track(order_id, original_size)
+        st.size_matched = max(st.size_matched, float(size_matched or 0.0), st.traded)
+        st.ts = time.time()
+        self._settle(st, status)
+        return st
+
+    def _settle(self, st: OrderState, status: str) -> None:
+        if st.terminal:
+            return
+        if st.original_size > 0 and st.size_matched >= st.original_size - 1e-9:
+            st.status = FILLED
+            self.fills += 1
+        elif status == CANCELED:
+            st.status = CANCELED
+        elif st.size_matched > 0:
+            st.status = PARTIAL
+        if st.terminal:
+            st.done.set()
+
+    def on_event(self, ev: dict) -> list[OrderState]:
+        """Apply one user-channel event; returns the orders it touched."""
+        self.events += 1
+        kind = str(ev.get("event_type", "") or "").lower()
+        if kind == "order":
+            typ = str(ev.get("type", "") or "").upper()
+            st = self.apply(
+                str(ev.get("id", "") or ""),
+                status=CANCELED if typ == "CANCELLATION" else "",
+                size_matched=_f(ev.get("size_matched")),
+                original_size=_f(ev.get("original_size")),
+            )
+            return [st] if st is not None else []
+        if kind != "trade" or str(ev.get("status", "") or "").upper() == "FAILED":
+            return []
+        trade_id = str(ev.get("id", "") or "")
+        fills = [(str(ev.get("taker_order_id", "") or ""), _f(ev.get("size")), ev.get("owner"))]
+        for mo in ev.get("maker_orders") or []:
+            if isinstance(mo, dict):
+                fills.append((str(mo.get("order_id", "") or ""), _f(mo.get("matched_amount")), mo.get("owner")))
+        out = []
+        for oid, amount, owner in fills:
+            mine = oid in self._orders or (self.owner and owner == self.owner)
+            if not oid or not mine or (trade_id, oid) in self._trades:
+                continue  # counterparty order, or a MINED/CONFIRMED repeat of a seen trade
+            self._trades[(trade_id, oid)] = None
+            while len(self._trades) > self.max_trades:
+                self._trades.popitem(last=False)
+            st = self.track(oid)
+            st.traded += amount
+            out.append(self.apply(oid))
+        return out
+
+    async def wait(self, order_id: str, timeout: float) -> OrderState:
+        """Wait until ``order_id`` is filled or canceled, or ``timeout`` passes."""
+        st = self.track(order_id)
+        if not st.terminal:
+            try:
+                await asyncio.wait_for(st.done.wait(), max(0.0, timeout))
+            except asyncio.TimeoutError:
+                pass
+        return st
+
+    def prune(self, now: float | None = None) -> None:
+        cutoff = (time.time() if now is None else now) - self.ttl_sec
+        for oid in [oid for oid, st in self._orders.items() if st.ts < cutoff]:
+            del self._orders[oid]
+
+    def stats(self) -> dict:
+        return {
+            "connected": self.connected,
+            "orders": len(self._orders),
+            "events": self.events,
+            "fills": self.fills,
+        }
+
+
+async def stream_user_channel(
+    url: str,
+    auth: dict,
+    tracker: OrderTracker,
+    *,
+    on_state: Callable[[OrderState], None] | None = None,
+    ping_sec: float = 10.0,
+) -> None:
+    """One user-channel session: subscribe, then feed every event into ``tracker``.
+
+    Returns or raises when the connection drops; the caller owns reconnects.
+    """
+    def _on_row(ev: dict) -> None:
+        # The channel has no auth ack: it counts as up once the server sends
+        # a real event, never just because the subscribe frame went out.
+        if ev.get("event_type"):
+            tracker.connected = True
+        for st in tracker.on_event(ev):
+            if on_state is not None:
+                on_state(st)
+
+    async with websockets.connect(url, ping_interval=20, ping_timeout=20, compression=None) as ws:
+        await ws.send(json.dumps({"auth": auth, "type": "user"}))
+
+        async def _app_heartbeat():
+            while True:
+                await asyncio.sleep(ping_sec)
+                await ws.send("PING")
+
+        hb_task = asyncio.create_task(_app_heartbeat())
+        feed = FeedDecoder("clob_user").on(None, _on_row)
+        try:
+            while True:
+                try:
+                    await feed.pump(ws, timeout=ping_sec)
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            tracker.connected = False
+            hb_task.cancel()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def fok_ladder(best_ask: float, tick: float, cap: float, steps: int = 1) -> list[float]:
+    """Order prices (2dp) a FOK taker could fire at around ``best_ask``, capped at ``cap``."""
+    out = []
+    for k in range(-steps, steps + 1):
+        px = round(max(0.001, min(best_ask + k * tick, cap, 0.97)), 2)
+        if px > 0 and px not in out:
+            out.append(px)
+    return out
+
+
+class PresignCache:
+    """Signed FOK orders built ahead of the fire path, one per (token, amount, price).
+
+    A template is single-use: ``take`` pops it, since a signed order can only
+    be posted once. Templates older than ``ttl_sec`` are dropped on access,
+    and ``reprice`` drops a token's templates once the best ask has moved
+    more than ``band`` away from their price.
+    """
+
+    def __init__(self, ttl_sec: float = 20.0, band: float = 0.02, max_tokens: int = 16):
+        self.ttl_sec = float(ttl_sec)
+        self.band = float(band)
+        self.max_tokens = max(1, int(max_tokens))
+        self._items: dict[str, dict[tuple[float, float], tuple[float, Any]]] = {}
+        self.built = 0
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._items.values())
+
+    def has(self, token_id: str) -> bool:
+        return token_id in self._items
+
+    def put(self, token_id: str, amount: float, px: float, signed: Any, now: float) -> None:
+        slot = self._items.get(token_id)
+        if slot is None:
+            if len(self._items) >= self.max_tokens:
+                oldest = min(self._items, key=lambda t: min(ts for ts, _ in self._items[t].values()))
+                self.discard(oldest)
+            slot = self._items[token_id] = {}
+        slot[(round(amount, 2), round(px, 2))] = (now, signed)
+        self.built += 1
+
+    def missing(self, token_id: str, amount: float, prices: list[float], now: float) -> list[float]:
+        """Prices in ``prices`` without a live template for this token and amount."""
+        slot = self._items.get(token_id) or {}
+        a = round(amount, 2)
+        return [px for px in prices if (a, px) not in slot or now - slot[(a, px)][0] >= self.ttl_sec]
+
+    def take(self, token_id: str, amount: float, px: float, now: float) -> Any | None:
+        slot = self._items.get(token_id)
+        item = slot.pop((round(amount, 2), round(px, 2)), None) if slot else None
+        if slot is not None and not slot:
+            del self._items[token_id]
+        if item is None or now - item[0] >= self.ttl_sec:
+            self.misses += 1
+            if item is not None:
+                self.discarded += 1
+            return None
+        self.hits += 1
+        return item[1]
+
+    def reprice(self, token_id: str, best_ask: float) -> None:
+        slot = self._items.get(token_id)
+        if not slot or best_ask <= 0:
+            return
+        for k in [k for k in slot if abs(k[1] - best_ask) > self.band + 1e-9]:
+            del slot[k]
+            self.discarded += 1
+        if not slot:
+            del self._items[token_id]
+
+    def discard(self, token_id: str) -> None:
+        slot = self._items.pop(token_id, None)
+        if slot:
+            self.discarded += len(slot)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "tokens": len(self._items),
+            "built": self.built,
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+        }
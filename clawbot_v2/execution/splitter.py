@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+
+class BankrollReservation:
+    """One trade's share of ``owner._reserved_bankroll`` (the H-4 in-flight guard).
+
+    ``spend`` moves a fill from reserved to spent: the bankroll is charged the
+    full fill, but the reservation only drops by what this trade still holds,
+    so an order bumped above its reserved size never eats into other trades'
+    reservations. ``release`` frees whatever is left, once.
+    """
+
+    def __init__(self, owner, amount: float):
+        self.owner = owner
+        self.left = max(0.0, float(amount or 0.0))
+        owner._reserved_bankroll += self.left
+
+    def spend(self, usdc: float) -> None:
+        usdc = max(0.0, float(usdc or 0.0))
+        take = min(usdc, self.left)
+        self.left -= take
+        self.owner._reserved_bankroll = max(0.0, self.owner._reserved_bankroll - take)
+        self.owner.bankroll -= usdc
+
+    def release(self) -> None:
+        self.owner._reserved_bankroll = max(0.0, self.owner._reserved_bankroll - self.left)
+        self.left = 0.0
+
+
+class ChildOrder(NamedTuple):
+    price: float  # FOK limit (the sweep price)
+    usdc: float   # BUY amount
+    level_px: float  # price of the deepest ask level this child was sized against
+
+
+class SplitResult(NamedTuple):
+    filled_usdc: float
+    shares: float
+    order_ids: list[str]
+    filled: int
+    killed: int
+
+    @property
+    def avg_price(self) -> float:
+        return self.filled_usdc / self.shares if self.shares > 0 else 0.0
+
+
+def _level(lv) -> tuple[float, float]:
+    if isinstance(lv, (tuple, list)):
+        return float(lv[0]), float(lv[1])
+    return float(lv.price), float(lv.size)
+
+
+def plan_fok_children(
+    asks,
+    total_usdc: float,
+    price_cap: float,
+    *,
+    min_child_usdc: float = 1.0,
+    max_children: int = 4,
+) -> list[ChildOrder]:
+    """Split a BUY of ``total_usdc`` into child FOKs sized from ask levels up to ``price_cap``.
+
+    Levels are walked cheapest first and grouped until a child reaches
+    ``min_child_usdc``; the last child absorbs what is left once
+    ``max_children`` is reached. Every child is limited at the sweep price
+    (the deepest level used), so children fired together fill in any
+    arrival order as long as the book holds. Returns ``[]`` when depth under
+    the cap cannot fund even one child; the total may be below
+    ``total_usdc`` when the book is thinner than the order.
+    """
+    levels = []
+    for lv in asks or ():
+        try:
+            px, sz = _level(lv)
+        except (TypeError, ValueError, AttributeError, IndexError):
+            continue
+        if px <= 0 or sz <= 0:
+            continue
+        if px > price_cap + 1e-9:
+            break
+        levels.append((px, px * sz))
+    levels.sort()
+    sizes: list[tuple[float, float]] = []  # (usdc, level_px)
+    remaining = round(max(0.0, total_usdc), 2)
+    acc = 0.0
+    for px, depth in levels:
+        if remaining - acc <= 0:
+            break
+        acc += min(depth, remaining - acc)
+        if acc >= min_child_usdc and len(sizes) < max(1, int(max_children)) - 1:
+            sizes.append((round(acc, 2), px))
+            remaining = round(remaining - round(acc, 2), 2)
+            acc = 0.0
+        last_px = px
+    if acc > 0:
+        if acc >= min_child_usdc:
+            sizes.append((round(acc, 2), last_px))
+        elif sizes:
+            usdc, _ = sizes[-1]
+            sizes[-1] = (round(usdc + acc, 2), last_px)
+    if not sizes:
+        return []
+    sweep = round(sizes[-1][1], 2)
+    return [ChildOrder(sweep, usdc, px) for usdc, px in sizes]
+
+
+async def execute_split(
+    children: list[ChildOrder],
+    post: Callable[[ChildOrder], Awaitable[tuple[dict, float]]],
+    *,
+    on_child: Callable[[ChildOrder, float], None] | None = None,
+) -> SplitResult:
+    """Fire every child at once and aggregate fills.
+
+    ``post`` returns ``(response, limit_price)`` like ``_post_limit_fok``.
+    ``on_child(child, filled_usdc)`` runs as each child settles (0.0 when
+    killed or failed), so callers can move its reservation into spent
+    bankroll before the slower children return.
+    """
+    async def _one(child: ChildOrder):
+        try:
+            resp, _ = await post(child)
+        except Exception:
+            resp = {}
+        ok = resp.get("status") in ("matched", "filled")
+        usdc = shares = 0.0
+        if ok:
+            # makingAmount/takingAmount are USDC paid and shares received on a BUY.
+            usdc = float(resp.get("makingAmount") or child.usdc)
+            shares = float(resp.get("takingAmount") or (child.usdc / max(child.level_px, 1e-9)))
+        if on_child is not None:
+            on_child(child, usdc)
+        return ok, usdc, shares, str(resp.get("orderID") or resp.get("id") or "")
+
+    results = await asyncio.gather(*[_one(c) for c in children])
+    filled = [r for r in results if r[0]]
+    return SplitResult(
+        filled_usdc=round(sum(r[1] for r in filled), 6),
+        shares=sum(r[2] for r in filled),
+        order_ids=[r[3] for r in filled if r[3]],
+        filled=len(filled),
+        killed=len(results) - len(filled),
+    )
@@ -1,4 +1,6 @@
 from .log import get_logger
 from .telemetry import RuntimeEventLogger
+from .skip_counters import SkipCounters
+from .latency import LatencyHistogram
 
-__all__ = ["get_logger", "RuntimeEventLogger"]
+__all__ = ["get_logger", "RuntimeEventLogger", "SkipCounters", "LatencyHistogram"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+DEFAULT_BOUNDS_MS = (5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds).
+
+    ``observe`` is one bisect and one increment. Percentiles in ``snapshot``
+    are bucket upper bounds, which is as precise as the dashboard needs;
+    samples past the last bound report that bound.
+    """
+
+    def __init__(self, bounds_ms: Sequence[float] = DEFAULT_BOUNDS_MS):
+        self.bounds = tuple(float(b) for b in bounds_ms)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.n = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.n += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        if self.n <= 0:
+            return 0.0
+        rank = q * self.n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return self.bounds[min(i, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{b:g}" for b in self.bounds] + ["inf"]
+        return {
+            "n": self.n,
+            "avg_ms": round(self.sum_ms / self.n, 2) if self.n else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile(0.50),
+            "p90_ms": self.percentile(0.90),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import math
+import time
+
+
+class SkipCounters:
+    """Per-reason skip counts in fixed time buckets over a rolling horizon.
+
+    ``tick`` bumps one counter in the bucket for the current time slot; slots
+    are reused round-robin, so memory is bounded by the number of buckets
+    times the number of distinct reasons. ``top`` sums only the buckets
+    inside the requested window. ``totals`` are lifetime counts, exported as
+    a Prometheus counter by ``prometheus``.
+    """
+
+    def __init__(self, bucket_sec: float = 10.0, horizon_sec: float = 900.0):
+        self.bucket_sec = max(1e-3, float(bucket_sec))
+        self.n = int(math.ceil(float(horizon_sec) / self.bucket_sec)) + 1
+        self._epochs = [-1] * self.n
+        self._counts: list[dict[str, int]] = [{} for _ in range(self.n)]
+        self.totals: dict[str, int] = {}
+
+    def tick(self, reason: str, now: float | None = None) -> None:
+        e = int((time.time() if now is None else now) // self.bucket_sec)
+        i = e % self.n
+        c = self._counts[i]
+        if self._epochs[i] != e:
+            self._epochs[i] = e
+            c.clear()
+        c[reason] = c.get(reason, 0) + 1
+        self.totals[reason] = self.totals.get(reason, 0) + 1
+
+    def window(self, window_sec: float, now: float | None = None) -> dict[str, int]:
+        """Counts per reason over the last ``window_sec`` (rounded up to whole buckets)."""
+        e_now = int((time.time() if now is None else now) // self.bucket_sec)
+        k = min(self.n, max(1, int(math.ceil(float(window_sec) / self.bucket_sec))))
+        out: dict[str, int] = {}
+        for e in range(e_now - k + 1, e_now + 1):
+            i = e % self.n
+            if self._epochs[i] != e:
+                continue
+            for reason, v in self._counts[i].items():
+                out[reason] = out.get(reason, 0) + v
+        return out
+
+    def top(self, window_sec: float, top_n: int, now: float | None = None) -> tuple[int, list[tuple[str, int]]]:
+        counts = self.window(window_sec, now)
+        top = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[: max(1, int(top_n))]
+        return sum(counts.values()), top
+
+    def prometheus(self, name: str = "clawbot_skip_total") -> str:
+        lines = [
+            f"# HELP {name} Markets skipped by the scorer, by reason.",
+            f"# TYPE {name} counter",
+        ]
+        for reason in sorted(self.totals):
+            label = reason.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            lines.append(f'{name}{{reason="{label}"}} {self.totals[reason]}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+_DROPPED = object()
+
+
+class EvalQueue:
+    """Keyed, bounded runner for per-market evaluations.
+
+    At most one evaluation per key runs at a time and at most ``limit`` run
+    overall. A request for a key that is already running is parked as that
+    key's next run; later requests replace the parked one (latest wins) and
+    every parked caller receives the result of the run that replaced it.
+    New keys beyond ``max_keys`` are refused with the ``DROPPED`` sentinel,
+    which callers must not treat as a real result.
+    """
+
+    DROPPED = _DROPPED
+
+    def __init__(self, limit: int = 8, max_keys: int = 256):
+        self.limit = max(1, int(limit))
+        self.max_keys = max(1, int(max_keys))
+        self._sem: asyncio.Semaphore | None = None
+        self._running: set[Hashable] = set()
+        self._next: dict[Hashable, tuple[Callable[[], Awaitable[Any]], list[asyncio.Future]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.inflight = 0
+        self.peak_inflight = 0
+        self.runs = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if key in self._running:
+            fut = asyncio.get_running_loop().create_future()
+            parked = self._next.get(key)
+            if parked is None:
+                self._next[key] = (fn, [fut])
+            else:
+                self.coalesced += 1
+                self._next[key] = (fn, parked[1] + [fut])
+            return await fut
+        if len(self._running) >= self.max_keys:
+            self.dropped += 1
+            return _DROPPED
+        self._running.add(key)
+        try:
+            return await self._call(fn)
+        finally:
+            self._release(key)
+
+    def _release(self, key: Hashable) -> None:
+        parked = self._next.pop(key, None)
+        if parked is None:
+            self._running.discard(key)
+            return
+        task = asyncio.ensure_future(self._run_parked(key, *parked))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_parked(self, key: Hashable, fn, futs: list[asyncio.Future]) -> None:
+        try:
+            result = await self._call(fn)
+        except Exception as exc:
+            for f in futs:
+                if not f.done():
+                    f.set_exception(exc)
+        else:
+            for f in futs:
+                if not f.done():
+                    f.set_result(result)
+        finally:
+            # Cancelled (or any BaseException): no parked awaiter may hang.
+            for f in futs:
+                if not f.done():
+                    f.cancel()
+            self._release(key)
+
+    async def _call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.limit)
+        async with self._sem:
+            self.inflight += 1
+            self.peak_inflight = max(self.peak_inflight, self.inflight)
+            self.runs += 1
+            try:
+                return await fn()
+            finally:
+                self.inflight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "inflight": self.inflight,
+            "peak_inflight": self.peak_inflight,
+            "keys": len(self._running),
+            "parked": len(self._next),
+            "runs": self.runs,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+
+class EvalScheduler:
+    """Coalesces market-change events into per-market evaluation requests.
+
+    Feed handlers call ``notify`` when something a market's score depends on
+    changed (price move, best ask, Chainlink round, copyflow); ``at`` queues a
+    timed request such as a time-to-close milestone. Requests for the same
+    market collapse into one until the scan loop takes them with ``drain``,
+    most urgent first according to the caller's ``key``. ``wait`` returns as
+    soon as a request is pending (after a short coalescing window) or the
+    timeout runs out, so the loop only wakes when there is work. All calls
+    must come from the loop that owns the scheduler.
+    """
+
+    def __init__(self, *, coalesce_sec: float = 0.05):
+        self.coalesce_sec = max(0.0, float(coalesce_sec))
+        self._pending: dict[str, str] = {}  # cid -> first reason since the last drain
+        self._timers: list[tuple[float, str, str]] = []
+        self._timer_keys: set[tuple[float, str]] = set()
+        self._wake: asyncio.Event | None = None
+        self.events: Counter[str] = Counter()
+        self.coalesced = 0
+        self.drained = 0
+        self.deferred = 0
+        self.wakeups = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def notify(self, cid: str, reason: str) -> None:
+        self.events[reason] += 1
+        if cid in self._pending:
+            self.coalesced += 1
+            return
+        self._pending[cid] = reason
+        if self._wake is not None:
+            self._wake.set()
+
+    def notify_many(self, cids: Iterable[str], reason: str) -> None:
+        for cid in cids:
+            self.notify(cid, reason)
+
+    def at(self, ts: float, cid: str, reason: str) -> None:
+        """Request an evaluation of ``cid`` at wall time ``ts`` (once per cid/ts)."""
+        k = (ts, cid)
+        if k in self._timer_keys:
+            return
+        self._timer_keys.add(k)
+        heapq.heappush(self._timers, (ts, cid, reason))
+
+    def _fire_timers(self, now: float) -> None:
+        timers = self._timers
+        while timers and timers[0][0] <= now:
+            ts, cid, reason = heapq.heappop(timers)
+            self._timer_keys.discard((ts, cid))
+            self.notify(cid, reason)
+
+    async def wait(self, timeout: float) -> None:
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        deadline = time.time() + max(0.0, timeout)
+        while True:
+            now = time.time()
+            self._fire_timers(now)
+            if self._pending:
+                break
+            left = deadline - now
+            if self._timers:
+                left = min(left, self._timers[0][0] - now)
+            if left <= 0:
+                if now >= deadline:
+                    return
+                continue
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), left)
+            except asyncio.TimeoutError:
+                pass
+        self.wakeups += 1
+        if self.coalesce_sec > 0:
+            await asyncio.sleep(self.coalesce_sec)  # let the rest of a burst land
+            self._fire_timers(time.time())
+
+    def drain(self, limit: int = 0, key: Callable[[str], float] | None = None) -> dict[str, str]:
+        """Take pending requests, highest ``key`` first; ``limit`` > 0 leaves the rest queued."""
+        pending = self._pending
+        if limit <= 0 or len(pending) <= limit:
+            self._pending = {}
+            self.drained += len(pending)
+            return pending
+        order = sorted(pending, key=key, reverse=True) if key is not None else list(pending)
+        out = {cid: pending.pop(cid) for cid in order[:limit]}
+        self.drained += len(out)
+        self.deferred += len(pending)
+        return out
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "timers": len(self._timers),
+            "events": dict(self.events),
+            "coalesced": self.coalesced,
+            "drained": self.drained,
+            "deferred": self.deferred,
+            "wakeups": self.wakeups,
+        }
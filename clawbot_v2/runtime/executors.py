@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from clawbot_v2.infra.latency import LatencyHistogram
+
+
+class ExecutorLane(ThreadPoolExecutor):
+    """Bounded thread pool for one latency class of blocking calls.
+
+    Drop-in for ``loop.run_in_executor(lane, fn)``. ``submit`` wraps each call
+    to track queue depth and how long it waited for a free worker, which is
+    the number that shows one class starving another. ``warm`` starts every
+    worker up front so the first call does not pay for thread creation.
+    """
+
+    def __init__(self, name: str, max_workers: int, *, warm: bool = False):
+        super().__init__(max_workers=max(1, int(max_workers)), thread_name_prefix=f"lane-{name}")
+        self.name = name
+        self.wait_ms = LatencyHistogram()
+        self.run_ms = LatencyHistogram()
+        self.queued = 0
+        self.running = 0
+        self.peak_queued = 0
+        self.submitted = 0
+        self._stat_lock = threading.Lock()
+        if warm:
+            self.warm()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        t_sub = time.perf_counter()
+        with self._stat_lock:
+            self.submitted += 1
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+        def _timed():
+            t0 = time.perf_counter()
+            with self._stat_lock:
+                self.queued -= 1
+                self.running += 1
+                self.wait_ms.observe((t0 - t_sub) * 1000.0)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stat_lock:
+                    self.running -= 1
+                    self.run_ms.observe((time.perf_counter() - t0) * 1000.0)
+
+        return super().submit(_timed)
+
+    def warm(self, timeout: float = 2.0) -> None:
+        # Workers only spawn while none is idle, so hold each one at a barrier
+        # until all of them exist.
+        n = self._max_workers
+        barrier = threading.Barrier(n)
+
+        def _hold():
+            try:
+                barrier.wait(timeout)
+            except threading.BrokenBarrierError:
+                pass
+
+        for f in [super(ExecutorLane, self).submit(_hold) for _ in range(n)]:
+            f.result()
+
+    def stats(self) -> dict:
+        with self._stat_lock:
+            return {
+                "workers": self._max_workers,
+                "threads": len(self._threads),
+                "queued": self.queued,
+                "running": self.running,
+                "peak_queued": self.peak_queued,
+                "submitted": self.submitted,
+                "wait": self.wait_ms.snapshot(),
+                "run": self.run_ms.snapshot(),
+            }
+
+
+class ExecutorLanes:
+    """The trader's executors, one per latency class.
+
+    ``order``: sign/post/cancel/get_order and the CLOB heartbeat (warm).
+    ``presign``: speculative FOK template signing, kept off ``order``.
+    ``book``: CLOB order-book fetches. ``chain``: web3 reads on the signal and
+    bankroll path (Chainlink, USDC balance, RPC probes). ``background``:
+    settlement, redeem and slow REST pulls. ``default``: the loop's default
+    executor (getaddrinfo, to_thread, stray run_in_executor(None, ...)), so
+    reconnect DNS lookups never queue behind a redeem burst.
+    """
+
+    def __init__(
+        self, *, order: int = 4, presign: int = 2, book: int = 8, chain: int = 4, background: int = 4, default: int = 4,
+    ):
+        self.order = ExecutorLane("order", order, warm=True)
+        self.presign = ExecutorLane("presign", presign)
+        self.book = ExecutorLane("book", book)
+        self.chain = ExecutorLane("chain", chain)
+        self.background = ExecutorLane("background", background)
+        self.default = ExecutorLane("default", default)
+
+    def lanes(self) -> tuple[ExecutorLane, ...]:
+        return (self.order, self.presign, self.book, self.chain, self.background, self.default)
+
+    def stats(self) -> dict:
+        return {lane.name: lane.stats() for lane in self.lanes()}
+
+    def prometheus(self, prefix: str = "clawbot_executor") -> str:
+        series = (
+            ("queued", "gauge", "Calls waiting for a worker."),
+            ("running", "gauge", "Calls currently running."),
+            ("submitted", "counter", "Calls submitted since start."),
+            ("wait_p99_ms", "gauge", "p99 time spent waiting for a worker (bucket bound)."),
+        )
+        stats = self.stats()
+        lines = []
+        for key, kind, help_ in series:
+            name = f"{prefix}_{key}"
+            lines += [f"# HELP {name} {help_}", f"# TYPE {name} {kind}"]
+            for lane, st in stats.items():
+                v = st["wait"]["p99_ms"] if key == "wait_p99_ms" else st[key]
+                lines.append(f'{name}{{lane="{lane}"}} {v}')
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self, wait: bool = False) -> None:
+        for lane in self.lanes():
+            lane.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+
+
+class IngestWorker:
+    """Runs feed-ingest coroutines on a dedicated OS thread with its own event loop.
+
+    The trading loop keeps its own asyncio loop; a CPU spike there (dashboard
+    payloads, JSON dumps, scoring) no longer delays websocket reads for the
+    feeds handed to this worker. Handlers running here must only publish
+    state through single-writer structures that readers can take lock-free
+    (``SeqlockTable``, ``OfiWindow``).
+    """
+
+    def __init__(self, name: str = "ingest"):
+        self.name = name
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._stopped: asyncio.Event | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, jobs: list[Callable[[], Awaitable[None]]]) -> None:
+        if self.alive:
+            raise RuntimeError(f"ingest worker {self.name} already running")
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._main, args=(list(jobs),), name=self.name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _main(self, jobs: list[Callable[[], Awaitable[None]]]) -> None:
+        try:
+            import uvloop
+
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            loop.run_until_complete(self._run(jobs))
+        finally:
+            self._ready.set()
+            loop.close()
+            self.loop = None
+
+    async def _run(self, jobs: list[Callable[[], Awaitable[None]]]) -> None:
+        self._stopped = asyncio.Event()
+        tasks = [asyncio.create_task(job()) for job in jobs]
+        self._ready.set()
+        await self._stopped.wait()
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        loop, stopped = self.loop, self._stopped
+        if loop is not None and stopped is not None:
+            loop.call_soon_threadsafe(stopped.set)
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -7,6 +7,7 @@ from typing import Awaitable, Callable
 from clawbot_v2.config import Settings
 from clawbot_v2.data.snapshot_store import SnapshotStore
 from clawbot_v2.infra import RuntimeEventLogger
+from clawbot_v2.runtime.ingest_worker import IngestWorker
 
 
 @dataclass
@@ -60,6 +61,7 @@ class ModularEngine:
         "_redeem_loop",
         "_heartbeat_loop",
         "_user_events_loop",
+        "_stream_clob_user",
         "_force_redeem_backfill_loop",
         "chainlink_loop",
         "chainlink_ws_loop",
@@ -74,11 +76,27 @@ class ModularEngine:
         "_dashboard_loop",
     )
 
+    # Feeds that only publish through single-writer state (binance_cache -> SeqlockTable,
+    # _liq_buf deques); with settings.ingest_worker they run on IngestWorker's own loop.
+    # Feeds that may run on the IngestWorker thread. Their handlers only write
+    # SeqlockTable records, OfiWindow (its own seqlock) and swap-in
+    # KlineSeries snapshots. RTDS and the CLOB market/user feeds stay on the
+    # trading loop: they call EvalScheduler.notify (an asyncio.Event owned by
+    # this loop) and update prices, PriceRing, TickFilter and ClobBook levels
+    # that the scorer reads in place.
+    INGEST_LOOP_NAMES = (
+        "_stream_binance_spot",
+        "_stream_binance_futures",
+        "_stream_binance_aggtrade",
+        "_stream_binance_liquidations",
+    )
+
     def __init__(self, settings: Settings, log):
         self.settings = settings
         self.log = log
         self.health = RuntimeHealth()
         self.events = RuntimeEventLogger(settings.data_dir)
+        self.ingest: IngestWorker | None = None
 
     async def _snapshot_loop(self, trader, store: SnapshotStore) -> None:
         while True:
@@ -115,6 +133,7 @@ class ModularEngine:
         self.log.info("bootstrap: self-check")
         self.events.emit("bootstrap.start")
         trader._startup_self_check()
+        trader._install_executors()
 
         while True:
             try:
@@ -151,13 +170,28 @@ class ModularEngine:
 
         await self._bootstrap(trader)
 
+        offload = set(self.INGEST_LOOP_NAMES) if self.settings.ingest_worker else set()
         tasks: list[asyncio.Task] = [asyncio.create_task(self._health_loop(), name="runtime-health")]
+        jobs = []
         for name in self.LOOP_NAMES:
             fn = getattr(trader, name, None)
             if fn is None:
                 self.log.warning("missing-loop name=%s", name)
                 self.events.emit("loop.missing", name=name)
                 continue
+            if name in offload:
+                jobs.append(lambda name=name, fn=fn: self._supervise_loop(name, fn))
+                continue
             tasks.append(asyncio.create_task(self._supervise_loop(name, fn), name=f"loop:{name}"))
 
-        await asyncio.gather(*tasks)
+        if jobs:
+            self.ingest = IngestWorker("clawbot-ingest")
+            self.ingest.start(jobs)
+            self.log.info("ingest worker started loops=%d", len(jobs))
+            self.events.emit("ingest.start", loops=len(jobs))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            if self.ingest is not None:
+                self.ingest.stop()
+            trader._lanes.shutdown()
@@ -126,7 +126,7 @@ async def _redeem_loop(self):
             try:
                 cid_bytes = bytes.fromhex(cid.lstrip("0x").zfill(64))
                 denom = await loop.run_in_executor(
-                    None, lambda b=cid_bytes: ctf.functions.payoutDenominator(b).call()
+                    self._lanes.background, lambda b=cid_bytes: ctf.functions.payoutDenominator(b).call()
                 )
                 if denom == 0:
                     # Throttled wait log so operator sees progress without spam
@@ -145,10 +145,10 @@ async def _redeem_loop(self):
 
                 # On-chain truth only: determine winner from payoutNumerators.
                 n0 = await loop.run_in_executor(
-                    None, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 0).call()
+                    self._lanes.background, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 0).call()
                 )
                 n1 = await loop.run_in_executor(
-                    None, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 1).call()
+                    self._lanes.background, lambda b=cid_bytes: ctf.functions.payoutNumerators(b, 1).call()
                 )
                 winner_source = "ONCHAIN_NUMERATOR"
                 if n0 > 0 and n1 == 0:
@@ -202,7 +202,7 @@ async def _redeem_loop(self):
                     usdc_after = 0.0
                     try:
                         _raw_before = await loop.run_in_executor(
-                            None, lambda: _usdc.functions.balanceOf(_addr_cs).call()
+                            self._lanes.background, lambda: _usdc.functions.balanceOf(_addr_cs).call()
                         )
                         usdc_before = (_raw_before or 0) / 1e6
                     except Exception:
@@ -230,7 +230,7 @@ async def _redeem_loop(self):
                         if tok.isdigit():
                             try:
                                 tok_bal = await loop.run_in_executor(
-                                    None,
+                                    self._lanes.background,
                                     lambda ti=int(tok): ctf.functions.balanceOf(_addr_cs, ti).call(),
                                 )
                             except Exception:
@@ -285,7 +285,7 @@ async def _redeem_loop(self):
                     # Record confirmed win
                     try:
                         _raw = await loop.run_in_executor(
-                            None, lambda: _usdc.functions.balanceOf(_addr_cs).call()
+                            self._lanes.background, lambda: _usdc.functions.balanceOf(_addr_cs).call()
                         )
                         if _raw > 0:
                             usdc_after = _raw / 1e6
@@ -2,5 +2,10 @@ from .prediction_service import PredictionService
 from .gates import pass_core_gates
 from .engine import StrategyConfig, StrategyEngine
 from .core import _score_market
+from .features import AssetFeatures, FeatureSnapshot
+from .numerics import ncdf
+from .graph import GateGraph, GateNode
+from .kernel import ScoringConfig, ScoringInputs, ScoringKernel, ScoringPriors
+from .scoring_pool import ScoringExecutor
 
-__all__ = ["PredictionService", "pass_core_gates", "StrategyConfig", "StrategyEngine", "_score_market"]
+__all__ = ["PredictionService", "pass_core_gates", "StrategyConfig", "StrategyEngine", "_score_market", "AssetFeatures", "FeatureSnapshot", "ncdf", "GateGraph", "GateNode", "ScoringConfig", "ScoringInputs", "ScoringKernel", "ScoringPriors", "ScoringExecutor"]
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
+from dataclasses import replace
+
+from clawbot_v2.strategy.features import FeatureSnapshot
+from clawbot_v2.strategy.graph import GateGraph, GateNode
+from clawbot_v2.strategy.kernel import ScoringPriors
 
 _LOADED = False
 
@@ -15,10 +21,202 @@ def _ensure_globals() -> None:
             g[k] = v
     _LOADED = True
 
-async def _score_market(self, m: dict) -> dict | None:
+
+# ── Score gate graph ─────────────────────────────────────────────────────────
+# Hard rejects that need only market fields, the FeatureSnapshot and the open
+# price. They run cheapest-first before the PM book fetch and the per-window
+# Binance stats, so a rejected market never pays for those. Gates return None
+# to pass, "" to reject silently, or a skip reason counted by _skip_tick.
+# Gates that log or carry their own skip reason are pinned to their declared
+# position, so retuning never changes which of them sees a market. The volume
+# gate runs after the book checks, as it always has, so a market missing both
+# a book and Binance volume is still counted as book_ws_missing/..._required.
+
+def _g_no_quote(ctx):
+    return "" if ctx["current"] <= 0 else None
+
+
+def _g_wait_open(ctx):
+    if ctx["open_price"]:
+        return None
+    self = ctx["self"]
+    if LOG_VERBOSE or self._should_log(f"wait-open:{ctx['cid']}", LOG_OPEN_WAIT_EVERY_SEC):
+        print(f"{Y}[WAIT] {ctx['label']} → waiting for first CL round{RS}")
+    return ""
+
+
+def _g_timing(ctx):
+    return "" if ctx["pct_remaining"] < PCT_REMAINING_MIN else None   # too close to close
+
+
+def _g_oracle_window(ctx):
+    # Oracle latency mode: only enter when Chainlink JUST updated in the final window.
+    # Also allows contrarian tail entries early in the window (cheap tokens, mean-reversion).
+    if not ORACLE_LATENCY_ONLY_MODE:
+        return None
+    open_price, cl_age_s = ctx["open_price"], ctx["cl_age_s"]
+    mins_left, up_price = ctx["mins_left"], ctx["up_price"]
+    move_now = abs(ctx["current"] - open_price) / max(open_price, 1e-9)
+    oracle_window = (
+        cl_age_s is not None
+        and cl_age_s <= ORACLE_FRESH_AGE_S
+        and mins_left <= ORACLE_MAX_MINS_LEFT
+        and move_now >= ORACLE_MIN_MOVE_PCT
+    )
+    tail_window = (
+        CONTRARIAN_TAIL_ENABLED
+        and min(up_price, 1.0 - up_price) <= CONTRARIAN_TAIL_MAX_ENTRY
+        and mins_left >= CONTRARIAN_TAIL_MIN_MINS_LEFT
+        and move_now >= CONTRARIAN_TAIL_MIN_MOVE_PCT
+    )
+    return None if (oracle_window or tail_window) else ""
+
+
+def _g_strict_source(ctx):
+    return "" if STRICT_PM_SOURCE and ctx["open_src"] != "PM" else None
+
+
+def _g_cl_age(ctx):
+    cl_age_s = ctx["cl_age_s"]
+    return "" if cl_age_s is not None and cl_age_s > CL_AGE_MAX_SKIP else None
+
+
+def _g_core_source_age(ctx):
+    # Empirical guard from live outcomes: core 15m trades with missing CL age
+    # are materially worse. Keep block for missing age, allow mildly stale.
+    if ctx["duration"] < 15 or ctx["booster_eval"] or ctx["cl_age_s"] is not None:
+        return None
+    asset, duration = ctx["asset"], ctx["duration"]
+    if ctx["self"]._noisy_log_enabled(f"skip-core-source-age:{asset}:{ctx['cid']}", LOG_SKIP_EVERY_SEC):
+        print(f"{Y}[SKIP] {asset} {duration}m core source-age invalid (cl_age=-1.0s){RS}")
+    return "core_source_age_invalid"
+
+
+def _f_volume_ready(ctx):
+    bnb = ctx["feats"].bnb
+    return bnb.bids_n > 0 and bnb.asks_n > 0 and bnb.klines_n >= CACHE_MIN_KLINES
+
+
+def _g_volume(ctx):
+    if not REQUIRE_VOLUME_SIGNAL or ctx["volume_ready"]:
+        return None
+    asset, duration = ctx["asset"], ctx["duration"]
+    if ctx["self"]._noisy_log_enabled(f"skip-no-vol:{asset}:{ctx['cid']}", LOG_SKIP_EVERY_SEC):
+        print(f"{Y}[SKIP] {asset} {duration}m missing live Binance depth/volume cache{RS}")
+    return "volume_missing"
+
+
+def _g_jump_contra(ctx):
+    # Jump detection: sudden move against our direction = hard abort
+    feats = ctx["feats"]
+    return "" if feats.is_jump and feats.jump_dir is not None and feats.jump_dir != ctx["direction"] else None
+
+
+def _g_ob_hard_block(ctx):
+    dw_ob = ctx["feats"].dw_ob
+    ob_sig = dw_ob if ctx["direction"] == "Up" else -dw_ob
+    return "" if ob_sig < OB_HARD_BLOCK else None   # extreme contra OB — hard block
+
+
+def _f_window_stats(ctx):
+    return ctx["self"]._binance_window_stats(ctx["asset"], ctx["m"]["start_ts"])
+
+
+ENTRY_GATES = GateGraph("entry", [
+    GateNode("no_quote", _g_no_quote, cost=0.1),
+    GateNode("wait_open", _g_wait_open, cost=0.2, pinned=True),
+    GateNode("timing", _g_timing, cost=0.1),
+    GateNode("oracle_window", _g_oracle_window, cost=0.5, inputs=("no_quote", "wait_open")),
+    GateNode("strict_source", _g_strict_source, cost=0.1),
+    GateNode("cl_age", _g_cl_age, cost=0.1),
+    GateNode("core_source_age", _g_core_source_age, cost=0.1, pinned=True),
+], retune_every=20000)
+
+PREBOOK_GATES = GateGraph("prebook", [
+    GateNode("jump_contra", _g_jump_contra, cost=0.2),
+    GateNode("ob_hard_block", _g_ob_hard_block, cost=0.2),
+    GateNode("window_stats", _f_window_stats, cost=15.0, gate=False),
+], retune_every=20000)
+
+POSTBOOK_GATES = GateGraph("postbook", [
+    GateNode("volume_ready", _f_volume_ready, cost=0.3, gate=False),
+    GateNode("volume", _g_volume, cost=0.1, inputs=("volume_ready",), pinned=True),
+])
+
+SCORE_GRAPHS = (ENTRY_GATES, PREBOOK_GATES, POSTBOOK_GATES)
+
+
+def _gates_pass(self, graph: GateGraph, ctx: dict) -> bool:
+    reason = graph.evaluate(ctx)
+    if reason is None:
+        return True
+    if reason:
+        self._skip_tick(reason)
+    return False
+
+
+def _decision_price(snap: FeatureSnapshot, asset: str) -> tuple[float, str, float, float | None]:
+    """(current, source, quote_age_ms, cl_age_s) for ``asset``; current is 0.0 with no quote.
+
+    Uses the freshest reliable source (prefer CL when fresh); source divergence
+    is penalised softly by the kernel instead of hard blocking.
+    """
+    rtds_now = float(snap.prices.get(asset, 0) or 0.0)
+    cl_now = float(snap.cl_prices.get(asset, 0) or 0.0)
+    last_tick_ts = snap.tick_ts.get(asset, 0.0)
+    quote_age_ms = (_time.time() - last_tick_ts) * 1000.0 if last_tick_ts else 9e9
+    cl_updated = snap.cl_updated.get(asset, 0)
+    cl_age_s = (_time.time() - cl_updated) if cl_updated else None
+    if cl_now > 0 and cl_age_s is not None and cl_age_s <= CL_FRESH_PRICE_AGE_SEC:
+        return cl_now, "CL", 0.0, cl_age_s   # CL is the resolution oracle; Binance WS freshness irrelevant
+    if rtds_now > 0 and quote_age_ms <= MAX_QUOTE_STALENESS_MS:
+        return rtds_now, "RTDS", quote_age_ms, cl_age_s
+    if cl_now > 0:
+        return cl_now, "CL-stale", quote_age_ms, cl_age_s
+    if rtds_now > 0:
+        return rtds_now, "RTDS-stale", quote_age_ms, cl_age_s
+    return 0.0, "none", quote_age_ms, cl_age_s
+
+
+def _scoring_priors(self, asset: str, duration: int, up_recent: dict, dn_recent: dict) -> ScoringPriors:
+    return ScoringPriors(
+        bias_up=self._direction_bias(asset, "Up", duration),
+        bias_down=self._direction_bias(asset, "Down", duration),
+        shrink=self._prob_shrink_factor(),
+        up_adj=float(up_recent.get("prob_adj", 0.0) or 0.0),
+        dn_adj=float(dn_recent.get("prob_adj", 0.0) or 0.0),
+    )
+
+
+def _entry_ctx(self, m: dict, snap: FeatureSnapshot, *, booster_eval: bool = False) -> dict:
+    """ENTRY_GATES context for ``m``; ``snap`` must already cover its asset."""
+    cid = m["conditionId"]
+    asset = m["asset"]
+    current, px_src, quote_age_ms, cl_age_s = _decision_price(snap, asset)
+    total_life = m["end_ts"] - m["start_ts"]
+    return {
+        "self": self, "m": m, "cid": cid, "asset": asset, "duration": m["duration"],
+        "label": f"{asset} {m['duration']}m | {m.get('question','')[:45]}",
+        "mins_left": m["mins_left"], "up_price": m["up_price"], "current": current,
+        "px_src": px_src, "quote_age_ms": quote_age_ms,
+        "open_price": self.open_prices.get(cid), "open_src": self.open_prices_source.get(cid, "?"),
+        "cl_age_s": cl_age_s, "pct_remaining": (m["mins_left"] * 60) / total_life if total_life > 0 else 0,
+        "booster_eval": booster_eval, "feats": snap.assets[asset],
+    }
+
+
+async def score_batch(self, markets: list[dict], snap: FeatureSnapshot | None = None) -> list[dict | None]:
+    """Score markets concurrently against one FeatureSnapshot (built here if not given)."""
+    if snap is None:
+        snap = self._feature_snapshot()
+    return list(await asyncio.gather(*[self._score_market(m, snap) for m in markets]))
+
+async def _score_market(self, m: dict, snap: FeatureSnapshot | None = None) -> dict | None:
     _ensure_globals()
     """Score a market opportunity. Returns signal dict or None if hard-blocked.
-    Pure analysis — no side effects, no order placement."""
+    Pure analysis — no side effects, no order placement. Prices and per-asset
+    signals come from ``snap`` (the scan's FeatureSnapshot); a one-asset
+    snapshot is built when called outside a scan pass."""
     score_started = _time.perf_counter()
     cid       = m["conditionId"]
     booster_eval = False
@@ -43,181 +241,51 @@ async def _score_market(self, m: dict) -> dict | None:
     label     = f"{asset} {duration}m | {m.get('question','')[:45]}"
     # Pre-fetch likely token book (cheap-side = token_up iff up_price≤0.50)
     prefetch_token = m.get("token_up", "") if up_price <= PREFETCH_UP_PRICE_MAX else m.get("token_down", "")
-
-    # Decision price selection: use freshest reliable source (prefer CL when fresh),
-    # then apply soft penalties for source divergence instead of hard blocking.
-    rtds_now = float(self.prices.get(asset, 0) or 0.0)
-    cl_now = float(self.cl_prices.get(asset, 0) or 0.0)
-    last_tick_ts = 0.0
-    _ph = self.price_history.get(asset)
-    if _ph:
-        _last = _ph[-1]
-        if isinstance(_last, (tuple, list)):
-            last_tick_ts = float(_last[0] or 0.0) if len(_last) >= 1 else 0.0
-        elif isinstance(_last, (int, float)):
-            # Backward-compat: some persisted caches may store plain timestamps.
-            last_tick_ts = float(_last)
-    quote_age_ms = (_time.time() - last_tick_ts) * 1000.0 if last_tick_ts else 9e9
-    cl_updated = self.cl_updated.get(asset, 0)
-    cl_age_s = (_time.time() - cl_updated) if cl_updated else None
-    if cl_now > 0 and cl_age_s is not None and cl_age_s <= CL_FRESH_PRICE_AGE_SEC:
-        current = cl_now
-        px_src = "CL"
-        quote_age_ms = 0.0   # CL is the resolution oracle; Binance WS freshness irrelevant
-    elif rtds_now > 0 and quote_age_ms <= MAX_QUOTE_STALENESS_MS:
-        current = rtds_now
-        px_src = "RTDS"
-    elif cl_now > 0:
-        current = cl_now
-        px_src = "CL-stale"
-    elif rtds_now > 0:
-        current = rtds_now
-        px_src = "RTDS-stale"
-    else:
+    if snap is None or asset not in snap.assets:
+        snap = self._feature_snapshot((asset,))
+    feats = snap.assets[asset]
+
+    rtds_now = float(snap.prices.get(asset, 0) or 0.0)
+    cl_now = float(snap.cl_prices.get(asset, 0) or 0.0)
+    gctx = _entry_ctx(self, m, snap, booster_eval=booster_eval)
+    current, px_src, quote_age_ms, cl_age_s = gctx["current"], gctx["px_src"], gctx["quote_age_ms"], gctx["cl_age_s"]
+    open_price, open_src = gctx["open_price"], gctx["open_src"]
+    src_tag = f"[{open_src}]"
+    pct_remaining = gctx["pct_remaining"]
+
+    # Cheap hard gates (quote, open price, timing, oracle window, source).
+    if not _gates_pass(self, ENTRY_GATES, gctx):
         return None
 
-    open_price = self.open_prices.get(cid)
-    if not open_price:
-        if LOG_VERBOSE or self._should_log(f"wait-open:{cid}", LOG_OPEN_WAIT_EVERY_SEC):
-            print(f"{Y}[WAIT] {label} → waiting for first CL round{RS}")
-        return None
-
-    src = self.open_prices_source.get(cid, "?")
-    src_tag = f"[{src}]"
-
-    # Timing gate
-    total_life    = m["end_ts"] - m["start_ts"]
-    pct_remaining = (mins_left * 60) / total_life if total_life > 0 else 0
-    if pct_remaining < PCT_REMAINING_MIN:
-        return None   # too close to close
-
-    # Oracle latency mode: only enter when Chainlink JUST updated in the final window.
-    # Also allows contrarian tail entries early in the window (cheap tokens, mean-reversion).
-    if ORACLE_LATENCY_ONLY_MODE:
-        move_now = abs(current - open_price) / max(open_price, 1e-9)
-        oracle_window = (
-            cl_age_s is not None
-            and cl_age_s <= ORACLE_FRESH_AGE_S
-            and mins_left <= ORACLE_MAX_MINS_LEFT
-            and move_now >= ORACLE_MIN_MOVE_PCT
+    # Direction pick and price/momentum score (pure ScoringKernel stage).
+    kin = self._scoring_inputs(
+        m, snap, current=current, open_price=open_price, cl_age_s=cl_age_s, pct_remaining=pct_remaining,
+    )
+    call = self._scoring_kernel.direction(kin)
+    direction = call.direction
+    prev_win_dir, prev_win_move = call.prev_win_dir, call.prev_win_move
+    move_pct = call.move_pct
+    move_str = f"{(current-open_price)/open_price:+.3%}"
+    score, edge = call.score, call.edge
+    px_align_conflict = call.px_align_conflict
+    data_div_pen_applied = call.div_pen > 0
+    tf_up_votes, tf_dn_votes, tf_votes = call.tf_up_votes, call.tf_dn_votes, call.tf_votes
+    very_strong_mom = call.very_strong_mom
+    is_early_continuation = call.is_early_continuation
+    cl_agree = call.cl_agree
+    if px_align_conflict and self._noisy_log_enabled(f"px-align:{asset}:{duration}", LOG_FLOW_EVERY_SEC):
+        print(
+            f"{Y}[PX-ALIGN]{RS} {asset} {duration}m conflict rtds={rtds_now:.4f} "
+            f"cl={cl_now:.4f} open={open_price:.4f} src={px_src} -> dir={direction}"
         )
-        tail_window = (
-            CONTRARIAN_TAIL_ENABLED
-            and min(up_price, 1.0 - up_price) <= CONTRARIAN_TAIL_MAX_ENTRY
-            and mins_left >= CONTRARIAN_TAIL_MIN_MINS_LEFT
-            and move_now >= CONTRARIAN_TAIL_MIN_MOVE_PCT
+    if data_div_pen_applied and self._noisy_log_enabled(f"data-div:{asset}:{duration}", LOG_FLOW_EVERY_SEC):
+        print(
+            f"{Y}[DATA-DIV]{RS} {asset} {duration}m cl={cl_now:.4f} rtds={rtds_now:.4f} "
+            f"open={open_price:.4f} div={call.div*100:.3f}% (-{call.div_pen} score)"
         )
-        if not oracle_window and not tail_window:
-            return None
-
-    # Previous window direction from CL prices (used as one signal among others).
-    prev_open     = self.asset_prev_open.get(asset, 0)
-    prev_win_move = abs((open_price - prev_open) / prev_open) if prev_open > 0 and open_price > 0 else 0.0
-    prev_win_dir  = None
-    if prev_open > 0 and open_price > 0:
-        diff = (open_price - prev_open) / prev_open
-        if   diff >  PREV_WIN_DIR_MOVE_MIN: prev_win_dir = "Up"
-        elif diff < -PREV_WIN_DIR_MOVE_MIN: prev_win_dir = "Down"
-
-    move_pct = abs(current - open_price) / open_price if open_price > 0 else 0
-    move_str = f"{(current-open_price)/open_price:+.3%}"
-
-    # ── Multi-signal Score ────────────────────────────────────────────────
-    # Resolution rule: ANY price above open = Up wins (even $0.001).
-    # Direction from price if moved; from momentum consensus if flat.
-    # Max possible: 2+3+4+1+3+3+2+1 = 19 pts
-    score = 0
-    # Keep initialized for any early quality penalties before final side selection.
-    edge = 0.0
-    px_align_conflict = False
-    data_div_pen_applied = False
-
-    # Compute momentum — EMA-based (O(1) from cache) + Kalman velocity signal
-    mom_5s   = self._momentum_prob(asset, seconds=5)
-    mom_30s  = self._momentum_prob(asset, seconds=30)
-    mom_180s = self._momentum_prob(asset, seconds=180)
-    mom_kal  = self._kalman_vel_prob(asset)
-    th_up, th_dn = MOM_THRESH_UP, MOM_THRESH_DN
-    tf_up_votes = sum([mom_5s > th_up, mom_30s > th_up, mom_180s > th_up, mom_kal > th_up])
-    tf_dn_votes = sum([mom_5s < th_dn, mom_30s < th_dn, mom_180s < th_dn, mom_kal < th_dn])
-
-    # Chainlink current — the resolution oracle
-    cl_move_pct = abs(cl_now - open_price) / open_price if cl_now > 0 and open_price > 0 else 0
-    cl_direction = ("Up" if cl_now > open_price else "Down") if cl_move_pct >= CL_DIRECTION_MOVE_MIN else None
-
-    # Direction: Chainlink is authoritative (it resolves the market)
-    # Use Binance RTDS only when it's clearly moving; fall back to CL then momentum
-    if move_pct >= DIR_MOVE_MIN:
-        direction = "Up" if current > open_price else "Down"
-        # Small move + opposite CL direction: keep trading, but align to oracle and penalize.
-        if cl_direction and cl_direction != direction and move_pct < DIR_CONFLICT_MOVE_MAX:
-            score -= DIR_CONFLICT_SCORE_PEN
-            edge -= DIR_CONFLICT_EDGE_PEN
-            px_align_conflict = True
-            if cl_age_s is not None and cl_age_s <= DIR_CONFLICT_CL_AGE_MAX:
-                direction = cl_direction
-            if self._noisy_log_enabled(f"px-align:{asset}:{duration}", LOG_FLOW_EVERY_SEC):
-                print(
-                    f"{Y}[PX-ALIGN]{RS} {asset} {duration}m conflict rtds={rtds_now:.4f} "
-                    f"cl={cl_now:.4f} open={open_price:.4f} src={px_src} -> dir={direction}"
-                )
-    elif cl_direction:
-        direction = cl_direction   # Binance flat → trust Chainlink direction
-    elif tf_up_votes > tf_dn_votes:
-        direction = "Up"
-    elif tf_dn_votes > tf_up_votes:
-        direction = "Down"
-    else:
-        direction = "Up" if cl_now >= open_price else "Down"  # always bet — binary resolves either way
-
-    is_up    = (direction == "Up")
-    tf_votes = tf_up_votes if is_up else tf_dn_votes
-    very_strong_mom = (tf_votes >= TF_VOTES_STRONG)
-
-    is_early_continuation = (prev_win_dir == direction and pct_remaining > EARLY_CONT_PCT_MIN)
-
-    # Entry timing (0-2 pts) — earlier = AMM hasn't repriced yet = better odds
-    if   pct_remaining >= TIMING_SCORE_PCT_2: score += 2
-    elif pct_remaining >= TIMING_SCORE_PCT_1: score += 1
-
-    # Move size (0-3 pts) — price confirmation bonus; not a gate
-    if   move_pct >= MOVE_SCORE_T3: score += 3
-    elif move_pct >= MOVE_SCORE_T2: score += 2
-    elif move_pct >= MOVE_SCORE_T1: score += 1
-    # flat/tiny move → +0 pts (still tradeable if momentum/taker confirm)
-
-    # Multi-TF momentum + Kalman (0-5 pts; signals: 5s/30s/180s EMA + Kalman velocity)
-    if   tf_votes == TF_VOTES_MAX: score += TF_SCORE_MAX
-    elif tf_votes == TF_VOTES_STRONG: score += TF_SCORE_STRONG
-    elif tf_votes == TF_VOTES_MID: score += TF_SCORE_MID
-
-    # Chainlink direction agreement (+1 agree / −3 disagree)
-    # CL is the resolution oracle — disagreement is a major red flag
-    cl_agree = True
-    if cl_now > 0 and open_price > 0:
-        if (is_up) != (cl_now >= open_price):   # >= matches resolution rule (tie → Up wins)
-            cl_agree = False
-    if cl_agree:  score += CL_AGREE_SCORE_BONUS
-    else:         score -= CL_DISAGREE_SCORE_PEN
-
-    # Soft source-divergence penalty (no hard skip): discourages entries on feed mismatch.
-    if open_price > 0 and cl_now > 0 and rtds_now > 0:
-        div = abs(cl_now - rtds_now) / open_price
-        if div >= DIV_PEN_START:
-            div_pen = min(DIV_PEN_MAX_SCORE, max(1, int(div / DIV_PEN_START)))
-            score -= div_pen
-            edge -= min(DIV_PEN_EDGE_CAP, div * DIV_PEN_EDGE_MULT)
-            data_div_pen_applied = True
-            if self._noisy_log_enabled(f"data-div:{asset}:{duration}", LOG_FLOW_EVERY_SEC):
-                print(
-                    f"{Y}[DATA-DIV]{RS} {asset} {duration}m cl={cl_now:.4f} rtds={rtds_now:.4f} "
-                    f"open={open_price:.4f} div={div*100:.3f}% (-{div_pen} score)"
-                )
 
     # On-chain-first confidence: prefer authoritative open-price source + fresh oracle.
-    open_src = self.open_prices_source.get(cid, "?")
-    if STRICT_PM_SOURCE and open_src != "PM":
-        return None
+    # (STRICT_PM_SOURCE, CL_AGE_MAX_SKIP and the core source-age block are ENTRY_GATES.)
     src_conf = 1.0 if open_src == "PM" else (0.9 if open_src == "CL-exact" else 0.6)
     onchain_adj = 0
     if open_src == "PM":
@@ -226,26 +294,20 @@ async def _score_market(self, m: dict) -> dict | None:
         onchain_adj -= 1
     if cl_age_s is None:
         onchain_adj -= 1
-    elif cl_age_s > CL_AGE_MAX_SKIP:
-        return None
     elif cl_age_s > CL_AGE_WARN:
         onchain_adj -= CL_AGE_WARN_SCORE_PEN
-    # Empirical guard from live outcomes: core 15m trades with missing CL age
-    # are materially worse. Keep block for missing age, allow mildly stale.
-    if duration >= 15 and (not booster_eval):
-        if cl_age_s is None:
-            if self._noisy_log_enabled(f"skip-core-source-age:{asset}:{cid}", LOG_SKIP_EVERY_SEC):
-                a = -1.0 if cl_age_s is None else float(cl_age_s)
-                print(f"{Y}[SKIP] {asset} {duration}m core source-age invalid (cl_age={a:.1f}s){RS}")
-            self._skip_tick("core_source_age_invalid")
-            return None
     score += onchain_adj
 
+    # Direction-dependent hard blocks before the book fetch; window stats only on pass.
+    gctx["direction"] = direction
+    if not _gates_pass(self, PREBOOK_GATES, gctx):
+        return None
+
     # ── Binance signals from WS cache (instant) + PM book fetch (async ~36ms) ─
-    ob_imbalance               = self._binance_imbalance(asset)
-    (taker_ratio, vol_ratio)   = self._binance_taker_flow(asset)
-    (perp_basis, funding_rate) = self._binance_perp_signals(asset)
-    (vwap_dev, vol_mult)       = self._binance_window_stats(asset, m["start_ts"])
+    ob_imbalance               = feats.ob_imbalance
+    (taker_ratio, vol_ratio)   = (feats.taker_ratio, feats.vol_ratio)
+    (perp_basis, funding_rate) = (feats.perp_basis, feats.funding_rate)
+    (vwap_dev, vol_mult)       = gctx["window_stats"]
     ws_strict_age_cap = self._ws_strict_age_cap_ms()
     _pm_book = await self._fetch_pm_book_safe(prefetch_token)
     ws_book_now = self._get_clob_ws_book(prefetch_token, max_age_ms=ws_strict_age_cap)
@@ -328,256 +390,22 @@ async def _score_market(self, m: dict) -> dict | None:
                 )
             self._skip_tick("book_ws_strict_required")
             return None
-
-    # Additional instant signals from Binance cache (zero latency)
-    dw_ob     = self._ob_depth_weighted(asset)
-    autocorr  = self._autocorr_regime(asset)
-    vr_ratio  = self._variance_ratio(asset)
-    is_jump, jump_dir, jump_z = self._jump_detect(asset)
-    btc_lead_p = self._btc_lead_signal(asset)
-    cache_a = self.binance_cache.get(asset, {})
-    volume_ready = bool(cache_a.get("depth_bids")) and bool(cache_a.get("depth_asks")) and (len(cache_a.get("klines", [])) >= CACHE_MIN_KLINES)
-    if REQUIRE_VOLUME_SIGNAL and not volume_ready:
-        if self._noisy_log_enabled(f"skip-no-vol:{asset}:{cid}", LOG_SKIP_EVERY_SEC):
-            print(f"{Y}[SKIP] {asset} {duration}m missing live Binance depth/volume cache{RS}")
-        self._skip_tick("volume_missing")
-        return None
-
-    # Jump detection: sudden move against our direction = hard abort
-    if is_jump and jump_dir is not None and jump_dir != direction:
+    if not _gates_pass(self, POSTBOOK_GATES, gctx):
         return None
-    if is_jump and jump_dir == direction:
-        score += JUMP_CONFIRM_SCORE
-
-    # Order book imbalance — depth-weighted 1/rank (more reliable than flat sum)
-    ob_sig = dw_ob if is_up else -dw_ob    # positive = OB confirms direction
-    if ob_sig < OB_HARD_BLOCK:
-        return None    # extreme contra OB — hard block
-    if   ob_sig > OB_SCORE_T3: score += 3
-    elif ob_sig > OB_SCORE_T2: score += 2
-    elif ob_sig > OB_SCORE_T1: score += 1
-    else:               score -= 1
-    imbalance_confirms = ob_sig > IMBALANCE_CONFIRM_MIN
+    volume_ready = gctx["volume_ready"]
 
-    # Taker buy/sell flow + volume vs 30-min avg (−1 to +5 pts)
-    if   (is_up and taker_ratio > TAKER_T3_UP) or (not is_up and taker_ratio < TAKER_T3_DN): score += 3
-    elif (is_up and taker_ratio > TAKER_T2_UP) or (not is_up and taker_ratio < TAKER_T2_DN): score += 2
-    elif abs(taker_ratio - 0.50) < TAKER_NEUTRAL: score += 1
-    else:                                score -= 1
-    if   vol_ratio > VOL_SCORE_T2: score += 2
-    elif vol_ratio > VOL_SCORE_T1: score += 1
-
-    # Perp futures basis: premium = leveraged longs crowding in = bullish (−1 to +2 pts)
-    perp_confirms = (is_up and perp_basis > PERP_CONFIRM) or (not is_up and perp_basis < -PERP_CONFIRM)
-    perp_strong   = (is_up and perp_basis > PERP_STRONG) or (not is_up and perp_basis < -PERP_STRONG)
-    perp_contra   = (is_up and perp_basis < -PERP_CONFIRM) or (not is_up and perp_basis > PERP_CONFIRM)
-    if   perp_strong:   score += 2
-    elif perp_confirms: score += 1
-    elif perp_contra:   score -= 1
-
-    # Funding rate: extreme = crowded = contrarian (−1 to +1 pts)
-    # High positive funding + Down bet = contrarian confirms shorts
-    # Very high positive funding + Up bet = overcrowded longs = risky
-    if   (not is_up and funding_rate >  FUNDING_POS_STRONG): score += 1
-    elif (is_up     and funding_rate <  FUNDING_NEG_CONFIRM): score += 1
-    elif (is_up     and funding_rate >  FUNDING_POS_EXTREME): score -= 1
-    elif (not is_up and funding_rate <  FUNDING_NEG_STRONG): score -= 1
-
-    # Liquidation signal: opposing-side liq confirms direction (0 to +2 pts)
-    score += self._liq_signal(asset, direction)
-
-    # Open Interest delta: growing OI confirms momentum (−1 to +1 pt)
-    oi_data = self._oi.get(asset, {})
-    if oi_data.get("prev", 0) > 0 and oi_data.get("cur", 0) > 0:
-        oi_delta = (oi_data["cur"] - oi_data["prev"]) / oi_data["prev"]
-        if   (is_up     and oi_delta >  OI_DELTA_UP):  score += 1
-        elif (not is_up and oi_delta <  OI_DELTA_DN):  score += 1
-        elif (is_up     and oi_delta <  OI_DELTA_DN):  score -= 1
-        elif (not is_up and oi_delta >  OI_DELTA_UP):  score -= 1
-
-    # L/S ratio: extreme crowding = contrarian (0 to −1 pt)
-    ls_long = self._ls_ratio.get(asset, 1.0)
-    if   (is_up     and ls_long > LS_LONG_EXT):  score -= 1   # too crowded long → risky Up
-    elif (not is_up and ls_long < LS_SHORT_EXT): score -= 1   # too crowded short → risky Down
-
-    # VWAP: momentum signal (−2 to +2 pts)
-    # Price ABOVE window VWAP in our direction = momentum confirms = good
-    # Price BELOW window VWAP in our direction = momentum weak = bad
-    vwap_net = vwap_dev if is_up else -vwap_dev   # positive = price above VWAP in bet direction
-    if   vwap_net >  VWAP_SCORE_T2: score += 2
-    elif vwap_net >  VWAP_SCORE_T1: score += 1
-    elif vwap_net < -VWAP_SCORE_T2: score -= 2
-    elif vwap_net < -VWAP_SCORE_T1: score -= 1
-
-    # Vol-normalized displacement signal (−2 to +2 pts)
-    sigma_15m = self.vols.get(asset, 0.70) * (15 / (252 * 390)) ** 0.5
-    open_price_disp = open_price
-    if open_price_disp and sigma_15m > 0:
-        net_disp = (current - open_price_disp) / open_price_disp * (1 if is_up else -1)
-        if   net_disp > sigma_15m * DISP_SIGMA_STRONG: score += 2
-        elif net_disp > sigma_15m * DISP_SIGMA_MID: score += 1
-        elif net_disp < -sigma_15m * DISP_SIGMA_STRONG: score -= 2
-        elif net_disp < -sigma_15m * DISP_SIGMA_MID: score -= 1
-
-    # Cross-asset confirmation: bonus for agreement, penalty for disagreement
-    cross_count = self._cross_asset_direction(asset, direction)
-    cross_contra = self._cross_asset_direction(asset, "Down" if direction == "Up" else "Up")
-    if   cross_count == 3: score += 2   # all other assets confirm → strong macro signal
-    elif cross_count >= 2: score += 1   # majority confirm
-    elif cross_contra == 3: score -= 2  # all 3 other assets going opposite → macro headwind
-    elif cross_contra >= 2: score -= 1  # majority going opposite → mild headwind
-
-    # Window-open OFI surge: fresh round + extreme aggTrade burst → strong directional signal
-    # Enter at price ~0.50 (2x payout) with 62-68% win probability when all assets moving together
-    ofi_surge_active = False
-    if (
-        OFI_SURGE_ENABLED
-        and pct_remaining >= OFI_SURGE_PCT_MIN
-        and duration >= 15
-    ):
-        surge_ofi = self._binance_agg_ofi(asset, window_sec=OFI_SURGE_WINDOW_SEC)
-        surge_confirms = (is_up and surge_ofi >= OFI_SURGE_THRESH_UP) or (not is_up and surge_ofi <= OFI_SURGE_THRESH_DN)
-        if surge_confirms:
-            score += OFI_SURGE_SCORE_BONUS
-            ofi_surge_active = True
-
-    # BTC lead signal for non-BTC assets — BTC lagged move predicts altcoins (0–2 pts)
-    if asset != "BTC":
-        if   (is_up and btc_lead_p > BTC_LEAD_T2_UP) or (not is_up and btc_lead_p < BTC_LEAD_T2_DN): score += 2
-        elif (is_up and btc_lead_p > BTC_LEAD_T1_UP) or (not is_up and btc_lead_p < BTC_LEAD_T1_DN): score += 1
-        elif (is_up and btc_lead_p < BTC_LEAD_NEG_UP) or (not is_up and btc_lead_p > BTC_LEAD_NEG_DN): score -= 1
-
-    # Previous-window continuation (data-driven, low weight).
-    # Never use a fixed global continuation prior; require realtime corroboration.
-    if prev_win_dir is not None:
-        if prev_win_dir == direction:
-            conf_hits = 0
-            conf_hits += 1 if tf_votes >= 3 else 0
-            conf_hits += 1 if ((is_up and taker_ratio > CONT_HIT_TAKER_UP) or ((not is_up) and taker_ratio < CONT_HIT_TAKER_DN)) else 0
-            conf_hits += 1 if ((is_up and ob_sig > CONT_HIT_OB) or ((not is_up) and ob_sig < -CONT_HIT_OB)) else 0
-            if conf_hits >= 2:
-                score += 2 if pct_remaining > CONT_BONUS_EARLY_PCT else 1
-        else:
-            score -= 1
-
-    # Autocorr + Variance Ratio regime: trending boosts momentum confidence
-    if vr_ratio > REGIME_VR_TREND and autocorr > REGIME_AC_TREND:
-        score += 1       # trending regime — momentum more reliable
-        regime_mult = REGIME_MULT_TREND
-    elif vr_ratio < REGIME_VR_MR and autocorr < REGIME_AC_MR:
-        score -= 1       # mean-reverting — momentum less reliable
-        regime_mult = REGIME_MULT_MR
-    else:
-        regime_mult = 1.0
-
-    # RSI + Williams %R momentum oscillators (0 to +2 pts, purely additive)
-    # Both confirm strong momentum = +2; one only = +1; neutral or contra = 0
-    _rsi_val = self._rsi(asset)
-    _wr_val  = self._williams_r(asset)
-    if   (is_up  and _rsi_val >= RSI_OB       and _wr_val >= WR_OB):        score += 2
-    elif (not is_up and _rsi_val <= RSI_OS     and _wr_val <= WR_OS):        score += 2
-    elif (is_up  and (_rsi_val >= RSI_OB - 5  or  _wr_val >= WR_OB + 5)):   score += 1
-    elif (not is_up and (_rsi_val <= RSI_OS + 5 or _wr_val <= WR_OS - 5)):  score += 1
-
-    # Log-likelihood true_prob — Bayesian combination of independent signals
-    sigma_15m = self.vols.get(asset, 0.70) * (15 / (252 * 390)) ** 0.5
-    llr = 0.0
-    # 1. Price displacement z-score
-    if open_price > 0 and sigma_15m > 0:
-        llr += (current - open_price) / open_price / sigma_15m * LLR_PRICE_MULT
-    # 2. Short vs long EMA cross
-    ema5  = self.emas.get(asset, {}).get(5, current)
-    ema60 = self.emas.get(asset, {}).get(60, current)
-    if ema60 > 0:
-        llr += (ema5 / ema60 - 1.0) * LLR_EMA_MULT
-    # 3. Kalman velocity
-    k = self.kalman.get(asset, {})
-    if k.get("rdy"):
-        per_sec_vol = max(self.vols.get(asset, 0.7) / math.sqrt(252 * 24 * 3600), 1e-8)
-        llr += k["vel"] / per_sec_vol * LLR_KALMAN_MULT
-    # 4. Depth-weighted OB imbalance
-    llr += dw_ob * LLR_OB_MULT
-    # 5. Taker buy/sell flow
-    llr += (taker_ratio - 0.5) * LLR_TAKER_MULT
-    # 6. Perp basis
-    if abs(perp_basis) > 1e-7:
-        llr += math.copysign(min(abs(perp_basis) * LLR_PERP_MULT, LLR_PERP_CAP), perp_basis)
-    # 7. Chainlink oracle agreement
-    if cl_agree:  llr += LLR_CL_AGREE
-    else:         llr -= LLR_CL_DISAGREE
-    # 8. BTC lead for altcoins (30-60s lag momentum)
-    if asset != "BTC":
-        llr += (btc_lead_p - 0.5) * LLR_BTC_LEAD_MULT
-    # 8b. BTC round-open displacement for alts (established trend this round)
-    if asset != "BTC":
-        _btc_cur = float(self.cl_prices.get("BTC") or self.prices.get("BTC") or 0)
-        _btc_ph  = self.price_history.get("BTC") or []
-        _st      = m["start_ts"]
-        _btc_at_open = next((p for ts, p in _btc_ph if _st - 30 <= ts <= _st + 90), None)
-        if _btc_at_open and _btc_cur > 0 and _btc_at_open > 0:
-            _btc_rnd_ret  = (_btc_cur - _btc_at_open) / _btc_at_open
-            _btc_sigma15  = self.vols.get("BTC", 0.65) * (15 / (252 * 390)) ** 0.5
-            if _btc_sigma15 > 0:
-                _corr = {"ETH": 0.82, "SOL": 0.80, "XRP": 0.78}.get(asset, 0.77)
-                llr += _btc_rnd_ret / _btc_sigma15 * _corr * LLR_BTC_ROUNDDISP_MULT
-    # 9. 20-minute kline trend (macro directional context)
-    _klines = (self.binance_cache.get(asset, {}) or {}).get("klines", [])
-    if len(_klines) >= 4 and sigma_15m > 0:
-        _n = min(20, len(_klines) - 1)
-        _c0 = float(_klines[-_n - 1][4])
-        _c1 = float(_klines[-1][4])
-        if _c0 > 0:
-            _kl_ret = (_c1 - _c0) / _c0
-            llr += _kl_ret / (sigma_15m * (20 / 15) ** 0.5) * LLR_KLINE_TREND_MULT
-    # 10. Regime scale
-    llr *= regime_mult
-    # Sigmoid → prob_up
-    p_up_ll   = 1.0 / (1.0 + math.exp(-max(-LLR_CLAMP, min(LLR_CLAMP, llr))))
-    # Structural tie bias: resolution uses >= so exact CL tie resolves as Up
-    p_up_ll   = min(1.0, p_up_ll + TIE_BIAS_UP)
-    bias_up   = self._direction_bias(asset, "Up", duration)
-    bias_down = self._direction_bias(asset, "Down", duration)
-    # Net bias: bias_up raises P(Up), bias_down lowers P(Up) — normalize so sum=1
-    prob_up   = max(0.05, min(0.95, p_up_ll + bias_up - bias_down))
-    prob_down = 1.0 - prob_up
-
-    # Early continuation prior boost (bounded, realtime-confirmed).
-    if prev_win_dir == direction and pct_remaining > CONT_BONUS_EARLY_PCT:
-        prior_boost = 0.0
-        if tf_votes >= 3:
-            prior_boost += PRIOR_BOOST_TF
-        if ((is_up and taker_ratio > PRIOR_BOOST_TAKER_UP) or ((not is_up) and taker_ratio < PRIOR_BOOST_TAKER_DN)):
-            prior_boost += PRIOR_BOOST_TAKER
-        if ((is_up and ob_sig > PRIOR_BOOST_OB_MIN) or ((not is_up) and ob_sig < -PRIOR_BOOST_OB_MIN)):
-            prior_boost += PRIOR_BOOST_OB
-        if cl_agree:
-            prior_boost += PRIOR_BOOST_CL
-        prior_boost = max(0.0, min(CONTINUATION_PRIOR_MAX_BOOST, prior_boost))
-        if direction == "Up":
-            prob_up = max(prob_up, min(0.95, prob_up + prior_boost))
-            prob_down = 1 - prob_up
-        else:
-            prob_down = max(prob_down, min(0.95, prob_down + prior_boost))
-            prob_up   = 1 - prob_down
-
-    # Online calibration: shrink overconfident probabilities toward 50% when live WR degrades.
-    shrink = self._prob_shrink_factor()
-    prob_up = 0.5 + (prob_up - 0.5) * shrink
-    prob_up = max(0.05, min(0.95, prob_up))
-    prob_down = 1.0 - prob_up
-
-    # Recent on-chain side prior (asset+duration+side), non-blocking directional calibration.
+    # Binance/derivatives signals and the log-likelihood probability model (pure ScoringKernel stage).
+    dw_ob = feats.dw_ob
     up_recent = self._recent_side_profile(asset, duration, "Up")
     dn_recent = self._recent_side_profile(asset, duration, "Down")
-    up_adj = float(up_recent.get("prob_adj", 0.0) or 0.0)
-    dn_adj = float(dn_recent.get("prob_adj", 0.0) or 0.0)
-    if abs(up_adj) > DEFAULT_EPS or abs(dn_adj) > DEFAULT_EPS:
-        pu = max(PROB_REBALANCE_MIN, min(PROB_REBALANCE_MAX, prob_up + up_adj))
-        pd = max(PROB_REBALANCE_MIN, min(PROB_REBALANCE_MAX, prob_down + dn_adj))
-        z = pu + pd
-        if z > 0:
-            prob_up = max(PROB_CLAMP_MIN, min(PROB_CLAMP_MAX, pu / z))
-            prob_down = 1.0 - prob_up
+    kin = replace(kin, priors=_scoring_priors(self, asset, duration, up_recent, dn_recent))
+    ksig = self._scoring_kernel.score(kin, call, vwap_dev)
+    score += ksig.score - call.score   # on-chain source and book fallback adjustments stay on top
+    ob_sig = ksig.ob_sig
+    imbalance_confirms = ksig.imbalance_confirms
+    cross_count = ksig.cross_count
+    ofi_surge_active = ksig.ofi_surge_active
+    prob_up, prob_down = ksig.prob_up, ksig.prob_down
 
     edge_up   = prob_up   - up_price
     edge_down = prob_down - (1 - up_price)
@@ -1072,7 +900,7 @@ async def _score_market(self, m: dict) -> dict | None:
     _T_years   = max(mins_left / 525600.0, 1e-9)   # 365*24*60 = 525600 min/year
     if open_price and open_price > 0 and current > 0 and _sigma_ann > 0:
         _d2  = (math.log(current / open_price) - 0.5 * _sigma_ann ** 2 * _T_years) / (_sigma_ann * math.sqrt(_T_years))
-        bin_c = float(norm.cdf(_d2 if side_up else -_d2))
+        bin_c = ncdf(_d2 if side_up else -_d2)
     else:
         bin_c = 0.5
     analysis_conviction = (
@@ -1189,7 +1017,7 @@ async def _score_market(self, m: dict) -> dict | None:
             }
             pred = self._pred_agent.predict(
                 pred_ctx,
-                list(self._resolved_samples),
+                self._resolved_index,
                 self._bucket_stats.rows,
             )
             p_new = float(pred.get("prob", true_prob) or true_prob)
@@ -2258,8 +2086,8 @@ async def _score_market(self, m: dict) -> dict | None:
         "hc15_mode": hc15,
         "open_price_source": open_src, "chainlink_age_s": cl_age_s,
         "onchain_score_adj": onchain_adj, "source_confidence": src_conf,
-        "oracle_gap_bps": ((self.prices.get(asset, 0) - cl_now) / cl_now * 10000.0)
-                          if self.prices.get(asset, 0) > 0 and cl_now > 0 else 0.0,
+        "oracle_gap_bps": ((rtds_now - cl_now) / cl_now * 10000.0)
+                          if rtds_now > 0 and cl_now > 0 else 0.0,
         "max_entry_allowed": max_entry_allowed,
         "min_entry_allowed": min_entry_allowed,
         "ev_net": ev_net,
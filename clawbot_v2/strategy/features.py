@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+# Fields of the Binance cache record read by the gates and the kernel (see signature()).
+BNB_SCORED_FIELDS = ("bids_n", "asks_n", "klines_n", "trend_ret20")
+
+
+@dataclass(frozen=True, slots=True)
+class AssetFeatures:
+    """Per-asset signals shared by every market of that asset within one scan tick.
+
+    Built by ``LiveTrader._asset_features``; ``_score_market`` only adds the
+    market-specific inputs (open price, window timing, books) on top.
+    Direction-dependent signals are stored for both sides.
+    """
+
+    asset: str
+    ts: float
+    mom_5s: float
+    mom_30s: float
+    mom_60s: float
+    mom_180s: float
+    mom_kal: float
+    ob_imbalance: float
+    dw_ob: float
+    taker_ratio: float
+    vol_ratio: float
+    perp_basis: float
+    funding_rate: float
+    autocorr: float
+    vr_ratio: float
+    rsi: float
+    williams_r: float
+    is_jump: bool
+    jump_dir: str | None
+    jump_z: float
+    btc_lead_p: float
+    surge_ofi: float
+    liq_up: int
+    liq_down: int
+    bnb: Any  # SeqlockTable record of the Binance cache
+
+    def liq(self, direction: str) -> int:
+        return self.liq_up if direction == "Up" else self.liq_down
+
+    def signature(self) -> tuple:
+        """Every field except ``ts``; equal signatures score identically.
+
+        Of the ``bnb`` record only the fields scoring reads are included: its
+        ``ts`` moves on every depth publish and would defeat the score cache.
+        """
+        own = tuple(getattr(self, f) for f in self.__slots__ if f not in ("ts", "bnb"))
+        return own + tuple(getattr(self.bnb, f, None) for f in BNB_SCORED_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureSnapshot:
+    """Immutable view of prices and asset features for one scan iteration.
+
+    Built once per pass by ``LiveTrader._feature_snapshot`` and read by the
+    pre-open analysis, the 15m consensus vote and every ``_score_market``
+    call, so they all see the same prices even across awaits. ``version``
+    increases monotonically with each build; ``asset_versions`` only moves
+    for an asset when an input scoring reads for it changed (see
+    ``scoring_signature``), so it can key caches. ``directions`` maps each asset
+    with a decided move vs its window open to True (Up) / False (Down).
+    """
+
+    version: int
+    ts: float
+    prices: Mapping[str, float]
+    cl_prices: Mapping[str, float]
+    cl_updated: Mapping[str, float]
+    tick_ts: Mapping[str, float]
+    directions: Mapping[str, bool]
+    assets: Mapping[str, AssetFeatures]
+    asset_versions: Mapping[str, int]
+
+    def cross(self, asset: str, direction: str) -> int:
+        """How many other assets are currently moving in ``direction``."""
+        up = direction == "Up"
+        return sum(1 for a, d in self.directions.items() if a != asset and d == up)
+
+
+def scoring_signature(
+    feats: AssetFeatures,
+    *,
+    price: float | None,
+    cl_price: float | None,
+    cl_updated: float,
+    quote_fresh: bool,
+    cl_fresh: bool,
+    directions: tuple,
+    state: tuple,
+) -> tuple:
+    """Exact inputs that scoring reads for one asset, as an ``asset_versions`` signature.
+
+    Prices and features enter unrounded. The tick time only enters as
+    ``quote_fresh``, because that flag is the only thing scoring reads from
+    it. ``state`` holds the trader-side kernel inputs that are not in the
+    snapshot (EMAs, Kalman velocity, vols, OI, long/short ratio, previous
+    open, BTC price).
+    """
+    return (price, cl_price, cl_updated, quote_fresh, cl_fresh, directions, state, feats.signature())
+
+
+def asset_versions(prev: dict[str, tuple[tuple, int]], sigs: Mapping[str, tuple], version: int) -> dict[str, int]:
+    """Content version per asset: kept from ``prev`` while the signature is unchanged.
+
+    ``prev`` maps asset -> (signature, version) and is updated in place;
+    an asset whose signature changed takes ``version``.
+    """
+    out = {}
+    for a, sig in sigs.items():
+        hit = prev.get(a)
+        if hit is None or hit[0] != sig:
+            hit = prev[a] = (sig, version)
+        out[a] = hit[1]
+    return out
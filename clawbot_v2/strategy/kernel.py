@@ -0,0 +1,589 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from clawbot_v2.strategy.features import AssetFeatures
+
+_SIGMA_15M = (15 / (252 * 390)) ** 0.5
+_PER_SEC = math.sqrt(252 * 24 * 3600)
+_BTC_CORR = {"ETH": 0.82, "SOL": 0.80, "XRP": 0.78}
+
+
+@dataclass(frozen=True)
+class ScoringConfig:
+    """Thresholds and weights read by ``ScoringKernel``.
+
+    Field names are the lower-case names of the engine's env-driven constants
+    and default to the same values; ``from_constants`` picks them up from a
+    namespace such as the ``live_trader`` module globals.
+    """
+
+    mom_thresh_up: float = 0.53
+    mom_thresh_dn: float = 0.47
+    prev_win_dir_move_min: float = 0.0002
+    cl_direction_move_min: float = 0.0
+    dir_move_min: float = 0.0
+    dir_conflict_move_max: float = 0.0010
+    dir_conflict_cl_age_max: float = 20.0
+    dir_conflict_score_pen: int = 3
+    dir_conflict_edge_pen: float = 0.020
+    timing_score_pct_2: float = 0.85
+    timing_score_pct_1: float = 0.70
+    move_score_t3: float = 0.0020
+    move_score_t2: float = 0.0012
+    move_score_t1: float = 0.0005
+    cl_agree_score_bonus: int = 1
+    cl_disagree_score_pen: int = 3
+    div_pen_start: float = 0.0008
+    div_pen_max_score: int = 2
+    div_pen_edge_cap: float = 0.03
+    div_pen_edge_mult: float = 3.0
+    early_cont_pct_min: float = 0.85
+    tf_votes_strong: int = 3
+    tf_votes_max: int = 4
+    tf_votes_mid: int = 2
+    tf_score_max: int = 5
+    tf_score_strong: int = 4
+    tf_score_mid: int = 2
+    jump_confirm_score: int = 2
+    ob_score_t3: float = 0.25
+    ob_score_t2: float = 0.10
+    ob_score_t1: float = -0.10
+    imbalance_confirm_min: float = 0.10
+    taker_t3_up: float = 0.62
+    taker_t3_dn: float = 0.38
+    taker_t2_up: float = 0.55
+    taker_t2_dn: float = 0.45
+    taker_neutral: float = 0.05
+    vol_score_t2: float = 2.0
+    vol_score_t1: float = 1.3
+    perp_confirm: float = 0.0002
+    perp_strong: float = 0.0005
+    funding_pos_strong: float = 0.0005
+    funding_neg_confirm: float = -0.0002
+    funding_pos_extreme: float = 0.0010
+    funding_neg_strong: float = -0.0005
+    oi_delta_up: float = 0.003
+    oi_delta_dn: float = -0.003
+    ls_long_ext: float = 0.60
+    ls_short_ext: float = 0.40
+    vwap_score_t2: float = 0.0015
+    vwap_score_t1: float = 0.0008
+    disp_sigma_strong: float = 1.0
+    disp_sigma_mid: float = 0.5
+    ofi_surge_enabled: bool = True
+    ofi_surge_pct_min: float = 0.78
+    ofi_surge_thresh_up: float = 0.72
+    ofi_surge_thresh_dn: float = 0.28
+    ofi_surge_score_bonus: int = 2
+    btc_lead_t2_up: float = 0.60
+    btc_lead_t2_dn: float = 0.40
+    btc_lead_t1_up: float = 0.55
+    btc_lead_t1_dn: float = 0.45
+    btc_lead_neg_up: float = 0.40
+    btc_lead_neg_dn: float = 0.60
+    cont_hit_taker_up: float = 0.53
+    cont_hit_taker_dn: float = 0.47
+    cont_hit_ob: float = 0.08
+    cont_bonus_early_pct: float = 0.80
+    regime_vr_trend: float = 1.05
+    regime_ac_trend: float = 0.05
+    regime_vr_mr: float = 0.95
+    regime_ac_mr: float = -0.05
+    regime_mult_trend: float = 1.15
+    regime_mult_mr: float = 0.85
+    rsi_ob: float = 65.0
+    rsi_os: float = 35.0
+    wr_ob: float = -20.0
+    wr_os: float = -80.0
+    llr_price_mult: float = 1.5
+    llr_ema_mult: float = 300.0
+    llr_kalman_mult: float = 0.4
+    llr_ob_mult: float = 2.5
+    llr_taker_mult: float = 5.0
+    llr_perp_mult: float = 1000.0
+    llr_perp_cap: float = 1.5
+    llr_cl_agree: float = 0.4
+    llr_cl_disagree: float = 1.0
+    llr_btc_lead_mult: float = 3.0
+    llr_btc_rounddisp_mult: float = 2.0
+    llr_kline_trend_mult: float = 0.4
+    llr_clamp: float = 6.0
+    tie_bias_up: float = 0.005
+    prior_boost_tf: float = 0.015
+    prior_boost_taker: float = 0.015
+    prior_boost_ob: float = 0.010
+    prior_boost_cl: float = 0.010
+    prior_boost_taker_up: float = 0.54
+    prior_boost_taker_dn: float = 0.46
+    prior_boost_ob_min: float = 0.10
+    continuation_prior_max_boost: float = 0.06
+    prob_clamp_min: float = 0.05
+    prob_clamp_max: float = 0.95
+    prob_rebalance_min: float = 0.01
+    prob_rebalance_max: float = 0.99
+    default_eps: float = 1e-9
+
+    @classmethod
+    def from_constants(cls, ns: Mapping[str, Any]) -> ScoringConfig:
+        return cls(**{f.name: ns[f.name.upper()] for f in fields(cls) if f.name.upper() in ns})
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringPriors:
+    """Outcome-derived adjustments: direction bias, calibration shrink and recent side priors."""
+
+    bias_up: float = 0.0
+    bias_down: float = 0.0
+    shrink: float = 1.0
+    up_adj: float = 0.0
+    dn_adj: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringInputs:
+    """Everything the kernel reads for one market, captured by value.
+
+    ``vol``/``btc_vol`` are annualised vols, ``kalman_vel`` is the filter
+    velocity per second (None before the first tick), ``btc_at_open`` the
+    first BTC print of the window and ``cross_up``/``cross_down`` how many
+    other assets are moving each way.
+    """
+
+    asset: str
+    duration: int
+    up_price: float
+    pct_remaining: float
+    current: float
+    open_price: float
+    prev_open: float
+    cl_now: float
+    rtds_now: float
+    cl_age_s: float | None
+    feats: AssetFeatures
+    cross_up: int = 0
+    cross_down: int = 0
+    vol: float = 0.70
+    ema5: float = 0.0
+    ema60: float = 0.0
+    kalman_vel: float | None = None
+    oi_prev: float = 0.0
+    oi_cur: float = 0.0
+    ls_long: float = 1.0
+    btc_vol: float = 0.65
+    btc_cur: float = 0.0
+    btc_at_open: float = 0.0
+    priors: ScoringPriors = field(default_factory=ScoringPriors)
+
+
+@dataclass(frozen=True, slots=True)
+class DirectionCall:
+    """Direction pick and the price/momentum part of the score."""
+
+    direction: str
+    cl_direction: str | None
+    move_pct: float
+    prev_win_dir: str | None
+    prev_win_move: float
+    tf_up_votes: int
+    tf_dn_votes: int
+    tf_votes: int
+    very_strong_mom: bool
+    is_early_continuation: bool
+    cl_agree: bool
+    score: int
+    edge: float
+    px_align_conflict: bool
+    div: float
+    div_pen: int
+
+    @property
+    def is_up(self) -> bool:
+        return self.direction == "Up"
+
+
+@dataclass(frozen=True, slots=True)
+class KernelSignal:
+    """Full signal score and calibrated probabilities for one market."""
+
+    call: DirectionCall
+    score: int
+    ob_sig: float
+    imbalance_confirms: bool
+    cross_count: int
+    ofi_surge_active: bool
+    regime_mult: float
+    llr: float
+    prob_up: float
+    prob_down: float
+
+
+class ScoringKernel:
+    """Side-effect-free signal scoring for one market.
+
+    Holds only a ``ScoringConfig``; every market input arrives in a
+    ``ScoringInputs`` captured by value, so the kernel runs without a
+    ``LiveTrader`` (replays, benchmarks, worker processes). ``direction``
+    is cheap and runs before the book fetch so hard gates can use it;
+    ``score`` adds the Binance/derivatives signals and the log-likelihood
+    probability model on top. ``evaluate`` runs both.
+    """
+
+    def __init__(self, cfg: ScoringConfig | None = None):
+        self.cfg = cfg or ScoringConfig()
+
+    def evaluate(self, inp: ScoringInputs, vwap_dev: float = 0.0) -> KernelSignal:
+        return self.score(inp, self.direction(inp), vwap_dev)
+
+    def direction(self, inp: ScoringInputs) -> DirectionCall:
+        c = self.cfg
+        f = inp.feats
+        current, open_price, prev_open = inp.current, inp.open_price, inp.prev_open
+        cl_now, rtds_now, cl_age_s = inp.cl_now, inp.rtds_now, inp.cl_age_s
+        pct_remaining = inp.pct_remaining
+
+        # Previous window direction from CL prices (used as one signal among others).
+        prev_win_move = abs((open_price - prev_open) / prev_open) if prev_open > 0 and open_price > 0 else 0.0
+        prev_win_dir = None
+        if prev_open > 0 and open_price > 0:
+            diff = (open_price - prev_open) / prev_open
+            if diff > c.prev_win_dir_move_min:
+                prev_win_dir = "Up"
+            elif diff < -c.prev_win_dir_move_min:
+                prev_win_dir = "Down"
+
+        move_pct = abs(current - open_price) / open_price if open_price > 0 else 0
+
+        # Resolution rule: ANY price above open = Up wins (even $0.001).
+        # Direction from price if moved; from momentum consensus if flat.
+        score = 0
+        edge = 0.0
+        px_align_conflict = False
+
+        th_up, th_dn = c.mom_thresh_up, c.mom_thresh_dn
+        moms = (f.mom_5s, f.mom_30s, f.mom_180s, f.mom_kal)
+        tf_up_votes = sum(mo > th_up for mo in moms)
+        tf_dn_votes = sum(mo < th_dn for mo in moms)
+
+        # Chainlink current — the resolution oracle
+        cl_move_pct = abs(cl_now - open_price) / open_price if cl_now > 0 and open_price > 0 else 0
+        cl_direction = ("Up" if cl_now > open_price else "Down") if cl_move_pct >= c.cl_direction_move_min else None
+
+        # Chainlink is authoritative (it resolves the market); use Binance RTDS
+        # only when it's clearly moving; fall back to CL then momentum.
+        if move_pct >= c.dir_move_min:
+            direction = "Up" if current > open_price else "Down"
+            # Small move + opposite CL direction: keep trading, but align to oracle and penalize.
+            if cl_direction and cl_direction != direction and move_pct < c.dir_conflict_move_max:
+                score -= c.dir_conflict_score_pen
+                edge -= c.dir_conflict_edge_pen
+                px_align_conflict = True
+                if cl_age_s is not None and cl_age_s <= c.dir_conflict_cl_age_max:
+                    direction = cl_direction
+        elif cl_direction:
+            direction = cl_direction   # Binance flat → trust Chainlink direction
+        elif tf_up_votes > tf_dn_votes:
+            direction = "Up"
+        elif tf_dn_votes > tf_up_votes:
+            direction = "Down"
+        else:
+            direction = "Up" if cl_now >= open_price else "Down"  # always bet — binary resolves either way
+
+        is_up = direction == "Up"
+        tf_votes = tf_up_votes if is_up else tf_dn_votes
+
+        # Entry timing (0-2 pts) — earlier = AMM hasn't repriced yet = better odds
+        if pct_remaining >= c.timing_score_pct_2:
+            score += 2
+        elif pct_remaining >= c.timing_score_pct_1:
+            score += 1
+
+        # Move size (0-3 pts) — price confirmation bonus; not a gate
+        if move_pct >= c.move_score_t3:
+            score += 3
+        elif move_pct >= c.move_score_t2:
+            score += 2
+        elif move_pct >= c.move_score_t1:
+            score += 1
+
+        # Multi-TF momentum + Kalman (0-5 pts)
+        if tf_votes == c.tf_votes_max:
+            score += c.tf_score_max
+        elif tf_votes == c.tf_votes_strong:
+            score += c.tf_score_strong
+        elif tf_votes == c.tf_votes_mid:
+            score += c.tf_score_mid
+
+        # Chainlink direction agreement; >= matches resolution rule (tie → Up wins)
+        cl_agree = not (cl_now > 0 and open_price > 0 and is_up != (cl_now >= open_price))
+        if cl_agree:
+            score += c.cl_agree_score_bonus
+        else:
+            score -= c.cl_disagree_score_pen
+
+        # Soft source-divergence penalty (no hard skip): discourages entries on feed mismatch.
+        div = 0.0
+        div_pen = 0
+        if open_price > 0 and cl_now > 0 and rtds_now > 0:
+            div = abs(cl_now - rtds_now) / open_price
+            if div >= c.div_pen_start:
+                div_pen = min(c.div_pen_max_score, max(1, int(div / c.div_pen_start)))
+                score -= div_pen
+                edge -= min(c.div_pen_edge_cap, div * c.div_pen_edge_mult)
+
+        return DirectionCall(
+            direction=direction,
+            cl_direction=cl_direction,
+            move_pct=move_pct,
+            prev_win_dir=prev_win_dir,
+            prev_win_move=prev_win_move,
+            tf_up_votes=tf_up_votes,
+            tf_dn_votes=tf_dn_votes,
+            tf_votes=tf_votes,
+            very_strong_mom=tf_votes >= c.tf_votes_strong,
+            is_early_continuation=prev_win_dir == direction and pct_remaining > c.early_cont_pct_min,
+            cl_agree=cl_agree,
+            score=score,
+            edge=edge,
+            px_align_conflict=px_align_conflict,
+            div=div,
+            div_pen=div_pen,
+        )
+
+    def score(self, inp: ScoringInputs, call: DirectionCall, vwap_dev: float = 0.0) -> KernelSignal:
+        c = self.cfg
+        f = inp.feats
+        asset = inp.asset
+        current, open_price = inp.current, inp.open_price
+        pct_remaining = inp.pct_remaining
+        direction = call.direction
+        is_up = call.is_up
+        tf_votes = call.tf_votes
+        taker_ratio, vol_ratio = f.taker_ratio, f.vol_ratio
+        perp_basis, funding_rate = f.perp_basis, f.funding_rate
+        dw_ob = f.dw_ob
+        btc_lead_p = f.btc_lead_p
+        score = call.score
+
+        if f.is_jump and f.jump_dir == direction:
+            score += c.jump_confirm_score
+
+        # Order book imbalance — depth-weighted 1/rank (positive = OB confirms direction)
+        ob_sig = dw_ob if is_up else -dw_ob
+        if ob_sig > c.ob_score_t3:
+            score += 3
+        elif ob_sig > c.ob_score_t2:
+            score += 2
+        elif ob_sig > c.ob_score_t1:
+            score += 1
+        else:
+            score -= 1
+
+        # Taker buy/sell flow + volume vs 30-min avg (−1 to +5 pts)
+        if (is_up and taker_ratio > c.taker_t3_up) or (not is_up and taker_ratio < c.taker_t3_dn):
+            score += 3
+        elif (is_up and taker_ratio > c.taker_t2_up) or (not is_up and taker_ratio < c.taker_t2_dn):
+            score += 2
+        elif abs(taker_ratio - 0.50) < c.taker_neutral:
+            score += 1
+        else:
+            score -= 1
+        if vol_ratio > c.vol_score_t2:
+            score += 2
+        elif vol_ratio > c.vol_score_t1:
+            score += 1
+
+        # Perp futures basis: premium = leveraged longs crowding in = bullish (−1 to +2 pts)
+        if (is_up and perp_basis > c.perp_strong) or (not is_up and perp_basis < -c.perp_strong):
+            score += 2
+        elif (is_up and perp_basis > c.perp_confirm) or (not is_up and perp_basis < -c.perp_confirm):
+            score += 1
+        elif (is_up and perp_basis < -c.perp_confirm) or (not is_up and perp_basis > c.perp_confirm):
+            score -= 1
+
+        # Funding rate: extreme = crowded = contrarian (−1 to +1 pts)
+        if not is_up and funding_rate > c.funding_pos_strong:
+            score += 1
+        elif is_up and funding_rate < c.funding_neg_confirm:
+            score += 1
+        elif is_up and funding_rate > c.funding_pos_extreme:
+            score -= 1
+        elif not is_up and funding_rate < c.funding_neg_strong:
+            score -= 1
+
+        # Liquidation signal: opposing-side liq confirms direction (0 to +2 pts)
+        score += f.liq(direction)
+
+        # Open Interest delta: growing OI confirms momentum (−1 to +1 pt)
+        if inp.oi_prev > 0 and inp.oi_cur > 0:
+            oi_delta = (inp.oi_cur - inp.oi_prev) / inp.oi_prev
+            if (is_up and oi_delta > c.oi_delta_up) or (not is_up and oi_delta < c.oi_delta_dn):
+                score += 1
+            elif (is_up and oi_delta < c.oi_delta_dn) or (not is_up and oi_delta > c.oi_delta_up):
+                score -= 1
+
+        # L/S ratio: extreme crowding = contrarian (0 to −1 pt)
+        if (is_up and inp.ls_long > c.ls_long_ext) or (not is_up and inp.ls_long < c.ls_short_ext):
+            score -= 1
+
+        # VWAP: price above window VWAP in our direction = momentum confirms (−2 to +2 pts)
+        vwap_net = vwap_dev if is_up else -vwap_dev
+        if vwap_net > c.vwap_score_t2:
+            score += 2
+        elif vwap_net > c.vwap_score_t1:
+            score += 1
+        elif vwap_net < -c.vwap_score_t2:
+            score -= 2
+        elif vwap_net < -c.vwap_score_t1:
+            score -= 1
+
+        # Vol-normalized displacement signal (−2 to +2 pts)
+        sigma_15m = inp.vol * _SIGMA_15M
+        if open_price and sigma_15m > 0:
+            net_disp = (current - open_price) / open_price * (1 if is_up else -1)
+            if net_disp > sigma_15m * c.disp_sigma_strong:
+                score += 2
+            elif net_disp > sigma_15m * c.disp_sigma_mid:
+                score += 1
+            elif net_disp < -sigma_15m * c.disp_sigma_strong:
+                score -= 2
+            elif net_disp < -sigma_15m * c.disp_sigma_mid:
+                score -= 1
+
+        # Cross-asset confirmation: bonus for agreement, penalty for disagreement
+        cross_count, cross_contra = (inp.cross_up, inp.cross_down) if is_up else (inp.cross_down, inp.cross_up)
+        if cross_count == 3:
+            score += 2
+        elif cross_count >= 2:
+            score += 1
+        elif cross_contra == 3:
+            score -= 2
+        elif cross_contra >= 2:
+            score -= 1
+
+        # Window-open OFI surge: fresh round + extreme aggTrade burst → strong directional signal
+        ofi_surge_active = False
+        if c.ofi_surge_enabled and pct_remaining >= c.ofi_surge_pct_min and inp.duration >= 15:
+            surge_ofi = f.surge_ofi
+            if (is_up and surge_ofi >= c.ofi_surge_thresh_up) or (not is_up and surge_ofi <= c.ofi_surge_thresh_dn):
+                score += c.ofi_surge_score_bonus
+                ofi_surge_active = True
+
+        # BTC lead signal for non-BTC assets — BTC lagged move predicts altcoins (0–2 pts)
+        if asset != "BTC":
+            if (is_up and btc_lead_p > c.btc_lead_t2_up) or (not is_up and btc_lead_p < c.btc_lead_t2_dn):
+                score += 2
+            elif (is_up and btc_lead_p > c.btc_lead_t1_up) or (not is_up and btc_lead_p < c.btc_lead_t1_dn):
+                score += 1
+            elif (is_up and btc_lead_p < c.btc_lead_neg_up) or (not is_up and btc_lead_p > c.btc_lead_neg_dn):
+                score -= 1
+
+        # Previous-window continuation (data-driven, low weight); requires realtime corroboration.
+        prev_win_dir = call.prev_win_dir
+        if prev_win_dir is not None:
+            if prev_win_dir == direction:
+                conf_hits = 1 if tf_votes >= 3 else 0
+                conf_hits += 1 if ((is_up and taker_ratio > c.cont_hit_taker_up) or ((not is_up) and taker_ratio < c.cont_hit_taker_dn)) else 0
+                conf_hits += 1 if ((is_up and ob_sig > c.cont_hit_ob) or ((not is_up) and ob_sig < -c.cont_hit_ob)) else 0
+                if conf_hits >= 2:
+                    score += 2 if pct_remaining > c.cont_bonus_early_pct else 1
+            else:
+                score -= 1
+
+        # Autocorr + Variance Ratio regime: trending boosts momentum confidence
+        if f.vr_ratio > c.regime_vr_trend and f.autocorr > c.regime_ac_trend:
+            score += 1
+            regime_mult = c.regime_mult_trend
+        elif f.vr_ratio < c.regime_vr_mr and f.autocorr < c.regime_ac_mr:
+            score -= 1
+            regime_mult = c.regime_mult_mr
+        else:
+            regime_mult = 1.0
+
+        # RSI + Williams %R momentum oscillators (0 to +2 pts, purely additive)
+        rsi, wr = f.rsi, f.williams_r
+        if (is_up and rsi >= c.rsi_ob and wr >= c.wr_ob) or (not is_up and rsi <= c.rsi_os and wr <= c.wr_os):
+            score += 2
+        elif (is_up and (rsi >= c.rsi_ob - 5 or wr >= c.wr_ob + 5)) or (not is_up and (rsi <= c.rsi_os + 5 or wr <= c.wr_os - 5)):
+            score += 1
+
+        # Log-likelihood true_prob — Bayesian combination of independent signals
+        llr = 0.0
+        if open_price > 0 and sigma_15m > 0:
+            llr += (current - open_price) / open_price / sigma_15m * c.llr_price_mult
+        if inp.ema60 > 0:
+            llr += (inp.ema5 / inp.ema60 - 1.0) * c.llr_ema_mult
+        if inp.kalman_vel is not None:
+            per_sec_vol = max(inp.vol / _PER_SEC, 1e-8)
+            llr += inp.kalman_vel / per_sec_vol * c.llr_kalman_mult
+        llr += dw_ob * c.llr_ob_mult
+        llr += (taker_ratio - 0.5) * c.llr_taker_mult
+        if abs(perp_basis) > 1e-7:
+            llr += math.copysign(min(abs(perp_basis) * c.llr_perp_mult, c.llr_perp_cap), perp_basis)
+        llr += c.llr_cl_agree if call.cl_agree else -c.llr_cl_disagree
+        if asset != "BTC":
+            llr += (btc_lead_p - 0.5) * c.llr_btc_lead_mult
+            # BTC round-open displacement for alts (established trend this round)
+            if inp.btc_at_open > 0 and inp.btc_cur > 0:
+                btc_sigma15 = inp.btc_vol * _SIGMA_15M
+                if btc_sigma15 > 0:
+                    btc_ret = (inp.btc_cur - inp.btc_at_open) / inp.btc_at_open
+                    llr += btc_ret / btc_sigma15 * _BTC_CORR.get(asset, 0.77) * c.llr_btc_rounddisp_mult
+        # 20-minute kline trend (macro directional context)
+        if f.bnb.klines_n >= 4 and sigma_15m > 0:
+            llr += f.bnb.trend_ret20 / (sigma_15m * (20 / 15) ** 0.5) * c.llr_kline_trend_mult
+        llr *= regime_mult
+        p_up_ll = 1.0 / (1.0 + math.exp(-max(-c.llr_clamp, min(c.llr_clamp, llr))))
+        # Structural tie bias: resolution uses >= so exact CL tie resolves as Up
+        p_up_ll = min(1.0, p_up_ll + c.tie_bias_up)
+        pri = inp.priors
+        prob_up = max(0.05, min(0.95, p_up_ll + pri.bias_up - pri.bias_down))
+        prob_down = 1.0 - prob_up
+
+        # Early continuation prior boost (bounded, realtime-confirmed).
+        if prev_win_dir == direction and pct_remaining > c.cont_bonus_early_pct:
+            prior_boost = 0.0
+            if tf_votes >= 3:
+                prior_boost += c.prior_boost_tf
+            if (is_up and taker_ratio > c.prior_boost_taker_up) or ((not is_up) and taker_ratio < c.prior_boost_taker_dn):
+                prior_boost += c.prior_boost_taker
+            if (is_up and ob_sig > c.prior_boost_ob_min) or ((not is_up) and ob_sig < -c.prior_boost_ob_min):
+                prior_boost += c.prior_boost_ob
+            if call.cl_agree:
+                prior_boost += c.prior_boost_cl
+            prior_boost = max(0.0, min(c.continuation_prior_max_boost, prior_boost))
+            if is_up:
+                prob_up = max(prob_up, min(0.95, prob_up + prior_boost))
+                prob_down = 1 - prob_up
+            else:
+                prob_down = max(prob_down, min(0.95, prob_down + prior_boost))
+                prob_up = 1 - prob_down
+
+        # Online calibration: shrink overconfident probabilities toward 50%.
+        prob_up = max(0.05, min(0.95, 0.5 + (prob_up - 0.5) * pri.shrink))
+        prob_down = 1.0 - prob_up
+
+        # Recent on-chain side prior (asset+duration+side), non-blocking directional calibration.
+        if abs(pri.up_adj) > c.default_eps or abs(pri.dn_adj) > c.default_eps:
+            pu = max(c.prob_rebalance_min, min(c.prob_rebalance_max, prob_up + pri.up_adj))
+            pd = max(c.prob_rebalance_min, min(c.prob_rebalance_max, prob_down + pri.dn_adj))
+            z = pu + pd
+            if z > 0:
+                prob_up = max(c.prob_clamp_min, min(c.prob_clamp_max, pu / z))
+                prob_down = 1.0 - prob_up
+
+        return KernelSignal(
+            call=call,
+            score=score,
+            ob_sig=ob_sig,
+            imbalance_confirms=ob_sig > c.imbalance_confirm_min,
+            cross_count=cross_count,
+            ofi_surge_active=ofi_surge_active,
+            regime_mult=regime_mult,
+            llr=llr,
+            prob_up=prob_up,
+            prob_down=prob_down,
+        )
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import math
+
+_NEG_SQRT1_2 = -1.0 / math.sqrt(2.0)
+_erfc = math.erfc
+
+
+def ncdf(x: float) -> float:
+    """Standard normal CDF. ``erfc`` keeps the far tails as accurate as scipy's ``norm.cdf``."""
+    return 0.5 * _erfc(x * _NEG_SQRT1_2)
+
@@ -11,8 +11,8 @@ class PredictionService:
 
         self._agent = PredictionAgent()
 
-    def predict(self, context: dict[str, Any], resolved_samples, bucket_rows: dict):
-        return self._agent.predict(context, resolved_samples, bucket_rows)
+    def predict(self, context: dict[str, Any], resolved_index, bucket_rows: dict):
+        return self._agent.predict(context, resolved_index, bucket_rows)
 
     def ingest_outcome(self, row: dict[str, Any]) -> None:
         self._agent.ingest_outcome(row)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing as mp
+import time
+from collections import namedtuple
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+from clawbot_v2.strategy.kernel import KernelSignal, ScoringConfig, ScoringInputs, ScoringKernel
+
+# (inputs, vwap_dev) — what ScoringKernel.evaluate needs for one market.
+KernelJob = tuple[ScoringInputs, float]
+
+_worker_kernel: ScoringKernel | None = None
+_worker_bnb = None
+
+
+def _init_worker(cfg: ScoringConfig, bnb_fields: Sequence[str]) -> None:
+    global _worker_kernel, _worker_bnb
+    _worker_kernel = ScoringKernel(cfg)
+    _worker_bnb = namedtuple("BnbRecord", bnb_fields) if bnb_fields else None
+
+
+def _pack(job: KernelJob) -> KernelJob:
+    # SeqlockTable records are per-table namedtuple classes that can't be
+    # pickled by reference; ship the values and rebuild them in the worker.
+    inp, vwap_dev = job
+    f = inp.feats
+    return replace(inp, feats=replace(f, bnb=tuple(f.bnb))), vwap_dev
+
+
+def _score_chunk(jobs: list[KernelJob]) -> list[KernelSignal]:
+    kernel = _worker_kernel
+    bnb = _worker_bnb
+    out = []
+    for inp, vwap_dev in jobs:
+        if bnb is not None:
+            inp = replace(inp, feats=replace(inp.feats, bnb=bnb(*inp.feats.bnb)))
+        out.append(kernel.evaluate(inp, vwap_dev))
+    return out
+
+
+class ScoringExecutor:
+    """Runs ``ScoringKernel.evaluate`` for a batch in persistent worker processes.
+
+    Workers are spawned once by ``start`` with the same ``ScoringConfig``, so
+    a pooled result is identical to the inline one. Batches smaller than
+    ``min_batch`` (or any batch before ``start``/after a pool failure) are
+    scored inline on the calling loop; a large batch is split into one chunk
+    per worker and awaited without blocking the event loop.
+
+    Meant for offline batches (replays, backtests) that run the kernel over
+    thousands of inputs. A live scan burst is too small to pay for it:
+    packing and pickling the jobs alone costs the loop more than scoring
+    them inline, so ``LiveTrader`` always scores inline.
+    """
+
+    def __init__(self, cfg: ScoringConfig, *, workers: int = 0, min_batch: int = 8, bnb_fields: Sequence[str] = ()):
+        self.cfg = cfg
+        self.kernel = ScoringKernel(cfg)
+        self.workers = max(0, int(workers))
+        self.min_batch = max(1, int(min_batch))
+        self.bnb_fields = tuple(bnb_fields)
+        self._pool: ProcessPoolExecutor | None = None
+        self.inline_n = 0
+        self.pool_n = 0
+        self.pool_batches = 0
+        self.pool_errors = 0
+        self.last_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    def start(self) -> None:
+        if self._pool is not None or self.workers <= 0:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context("spawn"),  # never fork a process running asyncio + threads
+            initializer=_init_worker,
+            initargs=(self.cfg, self.bnb_fields),
+        )
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def evaluate_many(self, jobs: list[KernelJob]) -> list[KernelSignal]:
+        t0 = time.perf_counter()
+        pool = self._pool
+        if pool is None or len(jobs) < self.min_batch:
+            out = [self.kernel.evaluate(inp, vwap_dev) for inp, vwap_dev in jobs]
+            self.inline_n += len(jobs)
+        else:
+            try:
+                out = await self._evaluate_pool(pool, jobs)
+                self.pool_n += len(jobs)
+                self.pool_batches += 1
+            except Exception:
+                # Broken/killed worker: drop the pool and keep scoring inline.
+                self.pool_errors += 1
+                self.shutdown()
+                out = [self.kernel.evaluate(inp, vwap_dev) for inp, vwap_dev in jobs]
+                self.inline_n += len(jobs)
+        self.last_ms = (time.perf_counter() - t0) * 1000.0
+        return out
+
+    async def _evaluate_pool(self, pool: ProcessPoolExecutor, jobs: list[KernelJob]) -> list[KernelSignal]:
+        loop = asyncio.get_running_loop()
+        packed = [_pack(j) for j in jobs]
+        n = min(self.workers, len(packed))
+        size = -(-len(packed) // n)
+        chunks = [packed[i:i + size] for i in range(0, len(packed), size)]
+        parts = await asyncio.gather(*[loop.run_in_executor(pool, _score_chunk, c) for c in chunks])
+        return [sig for part in parts for sig in part]
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers if self._pool is not None else 0,
+            "inline_n": self.inline_n,
+            "pool_n": self.pool_n,
+            "pool_batches": self.pool_batches,
+            "pool_errors": self.pool_errors,
+            "last_ms": round(self.last_ms, 3),
+        }
@@ -0,0 +1,24 @@
+from clawbot_v2.data.clob_book import ClobBook
+
+
+def test_clob_book_snapshot_then_deltas() -> None:
+    book = ClobBook()
+    book.best_ask_hint = 0.61
+    assert book.best_ask == 0.61
+    assert book.asks_top() == ()
+    book.load(
+        [{"price": "0.55", "size": "10"}, {"price": "0.53", "size": "5"}],
+        [{"price": "0.50", "size": "7"}, {"price": "0.51", "size": "3"}],
+    )
+    assert book.best_ask == 0.53
+    assert book.best_bid == 0.51
+    top = book.asks_top()
+    assert top == ((0.53, 5.0), (0.55, 10.0))
+    assert book.asks_top() is top
+    book.apply(False, 0.54, 2.0)
+    book.apply(False, 0.53, 0.0)
+    book.apply(True, 0.52, 4.0)
+    assert book.best_ask == 0.54
+    assert book.best_bid == 0.52
+    assert book.asks_top() == ((0.54, 2.0), (0.55, 10.0))
+    assert top == ((0.53, 5.0), (0.55, 10.0))
@@ -0,0 +1,80 @@
+import asyncio
+import base64
+import json
+
+from aiohttp import web
+
+from clawbot_v2.data import AsyncClobClient, HttpService
+from clawbot_v2.data.clob_rest import l2_signature
+
+SECRET = base64.urlsafe_b64encode(b"0123456789abcdef0123456789abcdef").decode()
+
+
+def _http():
+    return HttpService(
+        conn_limit=4, conn_per_host=4, dns_ttl_sec=0, keepalive_sec=5, min_gap_ms=0,
+        retries_429=0, retries_5xx=0, default_cache_ttl=0, default_stale_ttl=1,
+        should_log=lambda *a: False, error_tick=lambda *a, **k: None, log_warn=print,
+    )
+
+
+async def _with_server(routes, fn):
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    http = _http()
+    client = AsyncClobClient(
+        http, host=f"http://127.0.0.1:{port}", address="0xabc",
+        api_key="key", api_secret=SECRET, api_passphrase="pass",
+    )
+    try:
+        return await fn(client)
+    finally:
+        await http.close()
+        await runner.cleanup()
+
+
+def test_post_order_signs_the_exact_body():
+    seen = {}
+
+    async def post_order(request):
+        body = await request.text()
+        h = request.headers
+        seen["ok"] = h["POLY_SIGNATURE"] == l2_signature(SECRET, int(h["POLY_TIMESTAMP"]), "POST", "/order", body)
+        seen["payload"] = json.loads(body)
+        return web.json_response({"orderID": "0x1", "status": "matched"})
+
+    async def run(client):
+        return await client.post_order({"salt": 1, "side": "BUY"}, "FOK")
+
+    resp = asyncio.run(_with_server([web.post("/order", post_order)], run))
+    assert resp["status"] == "matched" and seen["ok"]
+    assert seen["payload"] == {"order": {"salt": 1, "side": "BUY"}, "owner": "key", "orderType": "FOK"}
+
+
+def test_order_book_shape_and_error_body():
+    async def book(request):
+        return web.json_response({
+            "asset_id": request.query["token_id"], "tick_size": "0.01",
+            "bids": [{"price": "0.40", "size": "10"}], "asks": [{"price": "0.42", "size": "5"}],
+        })
+
+    async def get_order(request):
+        return web.Response(status=400, text='{"error":"order couldn\'t be fully filled"}')
+
+    async def run(client):
+        b = await client.get_order_book("tok")
+        try:
+            await client.get_order("0x1")
+        except RuntimeError as e:
+            return b, str(e)
+        return b, ""
+
+    b, err = asyncio.run(_with_server([web.get("/book", book), web.get("/data/order/{oid}", get_order)], run))
+    assert b.asset_id == "tok" and b.tick_size == "0.01"
+    assert float(b.asks[0].price) == 0.42 and float(b.bids[0].size) == 10.0
+    assert "fully filled" in err
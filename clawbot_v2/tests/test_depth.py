@@ -0,0 +1,14 @@
+from clawbot_v2.data.depth import DepthSide, depth_imbalance
+
+
+def test_depth_side_precomputed_sums() -> None:
+    rows = [[str(100 - i), str(1 + i)] for i in range(12)]
+    side = DepthSide(20)
+    side.load(rows)
+    assert len(side) == 12
+    assert side.top10_qty == sum(1 + i for i in range(10))
+    assert abs(side.rank_w_qty - sum((1 + i) / (i + 1) for i in range(12))) < 1e-12
+    side.load([])
+    assert len(side) == 0
+    assert depth_imbalance(side.top10_qty, 0.0) == 0.0
+    assert depth_imbalance(3.0, 1.0) == 0.5
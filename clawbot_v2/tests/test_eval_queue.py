@@ -0,0 +1,85 @@
+import asyncio
+
+from clawbot_v2.runtime.eval_queue import EvalQueue
+
+
+def test_eval_queue_one_run_per_key_latest_wins() -> None:
+    async def run() -> tuple[list, list, dict]:
+        q = EvalQueue(limit=4)
+        gate = asyncio.Event()
+        calls = []
+
+        def job(tag):
+            async def fn():
+                calls.append(tag)
+                if tag == "first":
+                    await gate.wait()
+                return tag
+            return fn
+
+        t1 = asyncio.create_task(q.run("a", job("first")))
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(q.run("a", job("stale")))
+        t3 = asyncio.create_task(q.run("a", job("latest")))
+        await asyncio.sleep(0)
+        gate.set()
+        out = await asyncio.gather(t1, t2, t3)
+        return calls, out, q.stats()
+
+    calls, out, st = asyncio.run(run())
+    assert calls == ["first", "latest"]  # "stale" was replaced before it ran
+    assert out == ["first", "latest", "latest"]
+    assert (st["runs"], st["coalesced"], st["keys"], st["parked"]) == (2, 1, 0, 0)
+
+
+def test_eval_queue_bounds_concurrency_and_keys() -> None:
+    async def run() -> tuple[int, list, dict]:
+        q = EvalQueue(limit=2, max_keys=3)
+        active = peak = 0
+
+        async def fn():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        out = await asyncio.gather(*[q.run(k, fn) for k in "abcd"])
+        return peak, out, q.stats()
+
+    peak, out, st = asyncio.run(run())
+    assert peak == 2 and st["peak_inflight"] == 2
+    assert out == [True, True, True, EvalQueue.DROPPED]
+    assert st["dropped"] == 1
+
+
+def test_eval_queue_cancelled_parked_run_releases_its_awaiters() -> None:
+    async def run() -> tuple[bool, dict]:
+        q = EvalQueue(limit=4)
+        gate = asyncio.Event()
+
+        async def first():
+            await gate.wait()
+            return "first"
+
+        async def parked():
+            await asyncio.sleep(10)
+
+        t1 = asyncio.create_task(q.run("a", first))
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(q.run("a", parked))
+        await asyncio.sleep(0)
+        gate.set()
+        await t1
+        await asyncio.sleep(0)
+        for task in list(q._tasks):
+            task.cancel()
+        try:
+            await asyncio.wait_for(t2, 1.0)
+        except asyncio.CancelledError:
+            return True, q.stats()
+        return False, q.stats()
+
+    cancelled, st = asyncio.run(run())
+    assert cancelled and st["keys"] == 0 and st["parked"] == 0
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from clawbot_v2.runtime.eval_scheduler import EvalScheduler
+
+
+def test_eval_scheduler_coalesces_and_drains_by_priority() -> None:
+    s = EvalScheduler(coalesce_sec=0.0)
+    s.notify("a", "price")
+    s.notify("b", "book")
+    s.notify("a", "book")  # already pending -> coalesced, keeps first reason
+    s.notify("c", "copyflow")
+    prio = {"a": 1.0, "b": 3.0, "c": 2.0}
+    assert s.drain(2, key=prio.get) == {"b": "book", "c": "copyflow"}
+    assert s.drain() == {"a": "price"}
+    st = s.stats()
+    assert (st["coalesced"], st["drained"], st["deferred"], st["pending"]) == (1, 3, 1, 0)
+    assert st["events"] == {"price": 1, "book": 2, "copyflow": 1}
+
+
+def test_eval_scheduler_wait_wakes_on_event_and_timer() -> None:
+    async def run() -> tuple[float, dict, float, dict]:
+        s = EvalScheduler(coalesce_sec=0.0)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, s.notify, "a", "price")
+        t0 = time.perf_counter()
+        await s.wait(5.0)
+        woke_event = time.perf_counter() - t0
+        first = s.drain()
+        s.at(time.time() + 0.05, "b", "close")
+        s.at(time.time() + 0.05, "b", "close")
+        t0 = time.perf_counter()
+        await s.wait(5.0)
+        return woke_event, first, time.perf_counter() - t0, s.drain()
+
+    woke_event, first, woke_timer, second = asyncio.run(run())
+    assert first == {"a": "price"} and woke_event < 1.0
+    assert second == {"b": "close"} and woke_timer < 1.0
+
+
+def test_eval_scheduler_wait_times_out_when_idle() -> None:
+    s = EvalScheduler(coalesce_sec=0.0)
+    t0 = time.perf_counter()
+    asyncio.run(s.wait(0.05))
+    assert 0.04 <= time.perf_counter() - t0 < 1.0
+    assert s.drain() == {}
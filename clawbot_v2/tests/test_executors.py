@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from clawbot_v2.runtime.executors import ExecutorLane, ExecutorLanes
+
+
+def test_warm_lane_starts_all_workers():
+    lane = ExecutorLane("order", 3, warm=True)
+    try:
+        assert lane.stats()["threads"] == 3
+    finally:
+        lane.shutdown()
+
+
+def test_lane_tracks_queue_depth_and_wait():
+    lane = ExecutorLane("chain", 1)
+    gate = threading.Event()
+    try:
+        first = lane.submit(gate.wait, 2.0)
+        second = lane.submit(lambda: 7)
+        st = lane.stats()
+        assert st["queued"] >= 1 and st["submitted"] == 2
+        gate.set()
+        assert first.result(2.0) and second.result(2.0) == 7
+        st = lane.stats()
+        assert st["queued"] == 0 and st["running"] == 0 and st["peak_queued"] >= 1
+        assert st["wait"]["n"] == 2 and st["run"]["n"] == 2
+    finally:
+        lane.shutdown()
+
+
+def test_busy_background_lane_does_not_block_order_lane():
+    lanes = ExecutorLanes(order=1, book=1, chain=1, background=1)
+    gate = threading.Event()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        blocked = loop.run_in_executor(lanes.background, gate.wait, 2.0)
+        loop.set_default_executor(lanes.default)
+        out = await asyncio.wait_for(loop.run_in_executor(lanes.order, lambda: "posted"), 1.0)
+        assert await asyncio.wait_for(asyncio.to_thread(lambda: "resolved"), 1.0) == "resolved"
+        gate.set()
+        await blocked
+        return out
+
+    try:
+        assert asyncio.run(main()) == "posted"
+        assert 'clawbot_executor_submitted{lane="order"}' in lanes.prometheus()
+        assert lanes.default.stats()["submitted"] == 1 and "presign" in lanes.stats()
+    finally:
+        lanes.shutdown()
@@ -0,0 +1,73 @@
+from collections import namedtuple
+from dataclasses import replace
+from types import MappingProxyType
+
+from clawbot_v2.data.score_cache import ScoreCache
+from clawbot_v2.strategy.features import AssetFeatures, FeatureSnapshot, asset_versions, scoring_signature
+
+
+def test_feature_snapshot_cross_counts_other_assets() -> None:
+    snap = FeatureSnapshot(
+        version=1,
+        ts=0.0,
+        prices=MappingProxyType({}),
+        cl_prices=MappingProxyType({}),
+        cl_updated=MappingProxyType({}),
+        tick_ts=MappingProxyType({}),
+        directions=MappingProxyType({"BTC": True, "ETH": True, "SOL": False}),
+        assets=MappingProxyType({}),
+        asset_versions=MappingProxyType({}),
+    )
+    assert snap.cross("BTC", "Up") == 1
+    assert snap.cross("XRP", "Up") == 2
+    assert snap.cross("XRP", "Down") == 1
+    assert snap.cross("SOL", "Down") == 0
+
+
+def test_bnb_publish_time_does_not_bump_asset_version() -> None:
+    Record = namedtuple("Record", "ts bids_n asks_n klines_n trend_ret20 mark")
+    base = AssetFeatures(
+        asset="BTC", ts=0.0, mom_5s=0.1, mom_30s=0.1, mom_60s=0.1, mom_180s=0.1, mom_kal=0.1,
+        ob_imbalance=0.0, dw_ob=0.0, taker_ratio=0.5, vol_ratio=1.0, perp_basis=0.0,
+        funding_rate=0.0, autocorr=0.0, vr_ratio=1.0, rsi=50.0, williams_r=-50.0,
+        is_jump=False, jump_dir=None, jump_z=0.0, btc_lead_p=0.5, surge_ofi=0.0,
+        liq_up=0, liq_down=0, bnb=Record(100.0, 20, 20, 30, 0.001, 60000.0),
+    )
+    later = replace(base, ts=0.1, bnb=Record(100.1, 20, 20, 30, 0.001, 60001.0))
+    moved = replace(base, bnb=Record(100.2, 20, 20, 30, 0.002, 60000.0))
+    prev = {}
+    assert asset_versions(prev, {"BTC": base.signature()}, 1) == {"BTC": 1}
+    assert asset_versions(prev, {"BTC": later.signature()}, 2) == {"BTC": 1}
+    assert asset_versions(prev, {"BTC": moved.signature()}, 3) == {"BTC": 3}
+
+
+
+def test_score_cache_hits_across_snapshots_when_ticks_move_no_scored_input() -> None:
+    Record = namedtuple("Record", "ts bids_n asks_n klines_n trend_ret20")
+    feats = AssetFeatures(
+        asset="ETH", ts=0.0, mom_5s=0.2, mom_30s=0.1, mom_60s=0.1, mom_180s=0.1, mom_kal=0.2,
+        ob_imbalance=0.0, dw_ob=0.0, taker_ratio=0.5, vol_ratio=1.0, perp_basis=0.0,
+        funding_rate=0.0, autocorr=0.0, vr_ratio=1.0, rsi=50.0, williams_r=-50.0,
+        is_jump=False, jump_dir=None, jump_z=0.0, btc_lead_p=0.5, surge_ofi=0.0,
+        liq_up=0, liq_down=0, bnb=Record(10.0, 20, 20, 30, 0.001),
+    )
+    state = (3000.0, 2999.0, 0.01, 0.6, 0.5, 1.0, 1.0, 1.1, 2990.0, 60000.0)
+
+    def sig(f, price=3000.5, state=state):
+        return scoring_signature(
+            f, price=price, cl_price=3000.0, cl_updated=5.0, quote_fresh=True, cl_fresh=True,
+            directions=(("BTC", True),), state=state,
+        )
+
+    prev, cache = {}, ScoreCache(ttl=1.0)
+
+    def key(sig_, version):
+        return ("cid", asset_versions(prev, {"ETH": sig_}, version)["ETH"], 7, 7)
+
+    cache.put(key(sig(feats), 1), {"side": "Up"}, 0.0)
+    # Next pass: same price, newer tick/publish times -> same version, cache hit.
+    later = replace(feats, ts=0.4, bnb=Record(10.4, 20, 20, 30, 0.001))
+    assert cache.get(key(sig(later), 2), 0.4) == {"side": "Up"}
+    # A scored input moving (price, or trader-side EMA state) is a miss.
+    assert cache.get(key(sig(later, price=3000.6), 3), 0.5) is ScoreCache.MISS
+    assert cache.get(key(sig(later, state=(3000.1,) + state[1:]), 4), 0.5) is ScoreCache.MISS
@@ -0,0 +1,25 @@
+import asyncio
+from collections import deque
+
+from clawbot_v2.data.feed_decoder import FeedDecoder
+
+
+class _FakeWs:
+    def __init__(self, frames: list[str]):
+        self.messages = deque(frames)
+
+    async def recv(self) -> str:
+        return self.messages.popleft()
+
+
+def test_feed_decoder_drains_buffer_and_routes() -> None:
+    ws = _FakeWs(['{"t":"a","v":1}', '[{"t":"b","v":2},{"t":"a","v":3}]', "PONG", '{"t":"z"}'])
+    seen: list[tuple[str, int]] = []
+    feed = FeedDecoder("test", lambda ev: ev.get("t"))
+    feed.on("a", lambda ev: seen.append(("a", ev["v"])))
+    feed.on("b", lambda ev: seen.append(("b", ev["v"])))
+    n = asyncio.run(feed.pump(ws))
+    assert n == 4
+    assert seen == [("a", 1), ("b", 2), ("a", 3)]
+    assert feed.stats()["decode_errors"] == 1
+    assert feed.stats()["batches"] == 1
@@ -0,0 +1,81 @@
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+
+from clawbot_v2.strategy.graph import GateGraph, GateNode
+
+
+def test_gate_graph_runs_cheapest_first_and_short_circuits() -> None:
+    ran = []
+
+    def node(name, out):
+        def fn(ctx):
+            ran.append(name)
+            return out(ctx) if callable(out) else out
+        return fn
+
+    g = GateGraph("t", [
+        GateNode("heavy", node("heavy", 7.0), cost=50.0, gate=False),
+        GateNode("uses_heavy", node("uses_heavy", lambda c: None if c["heavy"] == 7.0 else "bad"), cost=0.1, inputs=("heavy",)),
+        GateNode("cheap", node("cheap", lambda c: "cheap_reject" if c["x"] < 0 else None), cost=0.1),
+        GateNode("mid", node("mid", None), cost=1.0),
+    ])
+    assert [n.name for n in g.order] == ["cheap", "mid", "heavy", "uses_heavy"]
+    assert g.evaluate({"x": -1}) == "cheap_reject"
+    assert ran == ["cheap"]
+    ctx = {"x": 1}
+    assert g.evaluate(ctx) is None and ctx["heavy"] == 7.0
+    stats = {s["name"]: s for s in g.stats()}
+    assert stats["cheap"]["calls"] == 2 and stats["cheap"]["hit_rate"] == 0.5
+    assert stats["heavy"]["calls"] == 1
+
+
+def test_gate_graph_retune_orders_by_time_per_reject() -> None:
+    g = GateGraph("t", [
+        GateNode("rarely", lambda c: None, cost=0.1),
+        GateNode("often", lambda c: "r", cost=1.0),
+    ])
+    for n, rejects in (("rarely", 0), ("often", 100)):
+        node = g.nodes[n]
+        node.calls, node.rejects, node.ns = 100, rejects, 100_000
+    g.retune(min_calls=100)
+    assert [n.name for n in g.order] == ["often", "rarely"]
+    with pytest.raises(ValueError):
+        GateGraph("bad", [GateNode("a", lambda c: None, inputs=("missing",))])
+
+
+def test_gate_graph_retune_keeps_pinned_gates_in_place() -> None:
+    g = GateGraph("t", [
+        GateNode("a", lambda c: None, cost=5.0),
+        GateNode("logs", lambda c: "logged", cost=9.0, pinned=True),
+        GateNode("b", lambda c: None, cost=0.1),
+        GateNode("c", lambda c: "r", cost=1.0),
+    ])
+    assert [n.name for n in g.order] == ["a", "logs", "b", "c"]
+    for name, rejects in (("a", 0), ("logs", 100), ("b", 0), ("c", 100)):
+        node = g.nodes[name]
+        node.calls, node.rejects, node.ns = 100, rejects, 100_000
+    g.retune(min_calls=100)
+    # Only the segment after the pin is reordered; "logs" keeps its rank and slot.
+    assert [n.name for n in g.order] == ["a", "logs", "c", "b"]
+    assert g.nodes["logs"].rank == 9.0
+
+
+def test_score_graphs_keep_volume_after_the_book_checks(monkeypatch) -> None:
+    from clawbot_v2.strategy import core
+
+    entry = [n.name for n in core.ENTRY_GATES.order]
+    assert "volume" not in entry and entry.index("core_source_age") == len(entry) - 1
+    assert [n.name for n in core.POSTBOOK_GATES.order] == ["volume_ready", "volume"]
+
+    class _Trader:
+        def _noisy_log_enabled(self, key, every):
+            return False
+
+    Bnb = namedtuple("Bnb", "bids_n asks_n klines_n")
+    monkeypatch.setattr(core, "REQUIRE_VOLUME_SIGNAL", True, raising=False)
+    monkeypatch.setattr(core, "CACHE_MIN_KLINES", 20, raising=False)
+    monkeypatch.setattr(core, "LOG_SKIP_EVERY_SEC", 5.0, raising=False)
+    ctx = {"self": _Trader(), "asset": "BTC", "duration": 15, "cid": "c", "feats": SimpleNamespace(bnb=Bnb(5, 5, 3))}
+    assert core.POSTBOOK_GATES.evaluate(ctx) == "volume_missing" and ctx["volume_ready"] is False
@@ -0,0 +1,21 @@
+import asyncio
+import threading
+
+from clawbot_v2.runtime.ingest_worker import IngestWorker
+
+
+def test_ingest_worker_runs_jobs_on_own_thread() -> None:
+    seen = []
+    done = threading.Event()
+
+    async def job() -> None:
+        seen.append(threading.current_thread().name)
+        done.set()
+        await asyncio.sleep(3600)
+
+    w = IngestWorker("ingest-test")
+    w.start([job])
+    assert done.wait(2.0)
+    assert seen == ["ingest-test"]
+    w.stop()
+    assert not w.alive
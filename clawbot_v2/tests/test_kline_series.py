@@ -0,0 +1,39 @@
+import math
+
+from clawbot_v2.data.kline_series import KlineSeries
+
+
+def _rows(n: int) -> list[list]:
+    out = []
+    for i in range(n):
+        c = 100.0 + 3.0 * math.sin(i / 3.0) + 0.1 * i
+        out.append([i * 60_000, str(c), str(c + 0.5), str(c - 0.5), str(c), str(10 + i), 0, 0, 0, str(4 + i % 3), 0, 0])
+    return out
+
+
+def test_kline_series_rsi_matches_direct() -> None:
+    rows = _rows(33)
+    ks = KlineSeries(maxlen=33, rsi_period=14)
+    ks.load(rows)
+    closes = [float(k[4]) for k in rows[-16:]]
+    diffs = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    ag = sum(max(d, 0.0) for d in diffs) / len(diffs)
+    al = sum(max(-d, 0.0) for d in diffs) / len(diffs)
+    assert abs(ks.rsi - (100.0 - 100.0 / (1.0 + ag / al))) < 1e-9
+    assert ks.version == 1
+
+
+def test_kline_series_live_bar_replace_and_roll() -> None:
+    rows = _rows(34)
+    ks = KlineSeries(maxlen=33)
+    ks.load(rows[:33])
+    live = list(rows[32])
+    live[4] = "150.0"
+    ks.update(live)
+    assert len(ks) == 33
+    assert ks.close[-1] == 150.0
+    ks.update(rows[33])
+    assert len(ks) == 33
+    assert ks.open_ms[0] == 60_000.0
+    assert ks.taker_ratio > 0
+    assert abs(ks.vwap_dev(10**12) - ks.vwap_dev(ks.open_ms[-3])) < 1e-12
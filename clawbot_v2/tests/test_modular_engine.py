@@ -0,0 +1,12 @@
+import re
+from pathlib import Path
+
+from clawbot_v2.runtime.modular_engine import ModularEngine
+
+LIVE_TRADER = Path(__file__).resolve().parents[1] / "engine" / "live_trader.py"
+
+
+def test_modular_engine_starts_every_legacy_guarded_loop():
+    guarded = re.findall(r'_guard\("(\w+)",\s*self\.\1\)', LIVE_TRADER.read_text())
+    assert "_stream_clob_user" in guarded
+    assert sorted(set(guarded) - set(ModularEngine.LOOP_NAMES)) == []
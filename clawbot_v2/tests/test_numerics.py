@@ -0,0 +1,11 @@
+import math
+
+from clawbot_v2.strategy.numerics import ncdf
+
+
+def test_ncdf_reference_values() -> None:
+    assert ncdf(0.0) == 0.5
+    assert abs(ncdf(1.0) - 0.8413447460685429) < 1e-15
+    assert abs(ncdf(-1.959963984540054) - 0.025) < 1e-15
+    assert 0.0 < ncdf(-30.0) < 1e-190
+    assert ncdf(math.inf) == 1.0 and ncdf(-math.inf) == 0.0
@@ -0,0 +1,44 @@
+from clawbot_v2.data.ofi_window import OfiWindow
+
+
+def test_ofi_window_sums_and_coverage() -> None:
+    ofi = OfiWindow(bucket_ms=100, horizon_sec=5)
+    for i in range(100):
+        ofi.add(1000.0 + i * 0.1, i % 4 != 0, 1.0)
+    buy, sell, covered = ofi.window(2.0, 1009.95)
+    assert covered
+    assert buy + sell == 20.0
+    assert sell == 5.0
+    buy, sell, covered = ofi.window(30.0, 1009.95)
+    assert not covered
+    assert buy + sell < 100.0
+
+
+def test_ofi_window_idle_gap_and_stream_start() -> None:
+    ofi = OfiWindow(bucket_ms=100, horizon_sec=60)
+    ofi.add(10.0, True, 2.0)
+    ofi.add(20.0, False, 1.0)
+    assert ofi.window(5.0, 20.0) == (0.0, 1.0, True)
+    assert ofi.window(30.0, 20.0) == (2.0, 1.0, False)
+    assert ofi.window(1.0, 40.0) == (0.0, 0.0, True)
+
+
+
+def test_ofi_window_read_retries_when_a_write_lands_mid_read() -> None:
+    class _Racing(OfiWindow):  # no __slots__, so _window can be patched per instance
+        pass
+
+    ofi = _Racing(bucket_ms=100, horizon_sec=5)
+    ofi.add(10.0, True, 1.0)
+    read = ofi._window
+    calls = []
+
+    def racing_read(window_sec, now):
+        calls.append(now)
+        if len(calls) == 1:
+            ofi.add(10.05, False, 3.0)  # the writer thread gets in mid-read
+        return read(window_sec, now)
+
+    ofi._window = racing_read
+    assert ofi.window(1.0, 10.1)[:2] == (1.0, 3.0)
+    assert len(calls) == 2 and ofi.retries == 1
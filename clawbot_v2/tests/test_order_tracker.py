@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import websockets
+
+from clawbot_v2.execution.order_tracker import OrderTracker, stream_user_channel
+
+
+def test_order_updates_drive_partial_then_filled():
+    t = OrderTracker()
+    t.track("o1", 10.0)
+    t.on_event({"event_type": "order", "id": "o1", "type": "UPDATE", "size_matched": "4", "original_size": "10"})
+    assert t.get("o1").status == "partial"
+    t.on_event({"event_type": "order", "id": "o1", "type": "UPDATE", "size_matched": "10", "original_size": "10"})
+    st = t.get("o1")
+    assert st.status == "filled" and st.done.is_set()
+    t.on_event({"event_type": "order", "id": "o1", "type": "CANCELLATION"})
+    assert t.get("o1").status == "filled"
+
+
+def test_trade_repeats_count_once_and_skip_counterparties():
+    t = OrderTracker(owner="me")
+    t.track("mine", 5.0)
+    ev = {
+        "event_type": "trade", "id": "t1", "status": "MATCHED", "taker_order_id": "theirs",
+        "size": "5", "owner": "other",
+        "maker_orders": [{"order_id": "mine", "matched_amount": "3", "owner": "me"}],
+    }
+    t.on_event(ev)
+    t.on_event(dict(ev, status="CONFIRMED"))
+    assert t.get("mine").size_matched == 3.0 and t.get("mine").status == "partial"
+    assert t.get("theirs") is None
+
+
+def test_wait_times_out_then_cancel_is_terminal():
+    async def main():
+        t = OrderTracker()
+        st = await t.wait("o2", 0.01)
+        assert st.status == "live"
+        asyncio.get_running_loop().call_later(
+            0.01, t.on_event, {"event_type": "order", "id": "o2", "type": "CANCELLATION"}
+        )
+        return await t.wait("o2", 1.0)
+
+    assert asyncio.run(main()).status == "canceled"
+
+
+def test_stream_user_channel_against_local_ws():
+    async def main():
+        t = OrderTracker()
+        seen = []
+
+        async def handler(ws):
+            sub = json.loads(await ws.recv())
+            assert sub["type"] == "user" and sub["auth"]["apiKey"] == "k"
+            await ws.send(json.dumps([
+                {"event_type": "order", "id": "o3", "type": "PLACEMENT", "size_matched": "0", "original_size": "2"},
+                {"event_type": "order", "id": "o3", "type": "UPDATE", "size_matched": "2", "original_size": "2"},
+            ]))
+            await asyncio.sleep(1.0)
+
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            task = asyncio.create_task(stream_user_channel(
+                f"ws://127.0.0.1:{port}", {"apiKey": "k"}, t, on_state=seen.append, ping_sec=0.2,
+            ))
+            st = await t.wait("o3", 2.0)
+            connected = t.connected
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        return st, connected, seen, t.connected
+
+    st, connected, seen, after = asyncio.run(main())
+    assert st.status == "filled" and connected and not after
+    assert [s.status for s in seen][-1] == "filled"
+
+
+def test_stream_user_channel_is_not_connected_until_an_event_arrives():
+    async def main():
+        t = OrderTracker()
+        subscribed = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(ws):
+            await ws.recv()
+            subscribed.set()
+            await release.wait()
+            await ws.send(json.dumps({"event_type": "order", "id": "o4", "type": "PLACEMENT", "original_size": "1"}))
+            await asyncio.sleep(1.0)
+
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            task = asyncio.create_task(stream_user_channel(f"ws://127.0.0.1:{port}", {"apiKey": "k"}, t, ping_sec=0.2))
+            await subscribed.wait()
+            await asyncio.sleep(0.05)
+            before = t.connected
+            release.set()
+            for _ in range(100):
+                if t.connected:
+                    break
+                await asyncio.sleep(0.01)
+            after = t.connected
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        return before, after
+
+    assert asyncio.run(main()) == (False, True)
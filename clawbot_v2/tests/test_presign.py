@@ -0,0 +1,38 @@
+from clawbot_v2.execution.presign import PresignCache, fok_ladder
+from clawbot_v2.infra.latency import LatencyHistogram
+
+
+def test_fok_ladder_caps_and_dedupes():
+    assert fok_ladder(0.62, 0.01, 0.99) == [0.61, 0.62, 0.63]
+    assert fok_ladder(0.62, 0.01, 0.62) == [0.61, 0.62]
+
+
+def test_presign_take_is_single_use_and_expires():
+    c = PresignCache(ttl_sec=10.0)
+    c.put("tok", 5.0, 0.62, "signed-a", now=100.0)
+    c.put("tok", 5.0, 0.63, "signed-b", now=100.0)
+    assert c.missing("tok", 5.0, [0.61, 0.62, 0.63], now=101.0) == [0.61]
+    assert c.take("tok", 5.0, 0.62, now=101.0) == "signed-a"
+    assert c.take("tok", 5.0, 0.62, now=101.0) is None
+    assert c.take("tok", 5.0, 0.63, now=111.0) is None
+    assert c.stats()["hits"] == 1 and c.stats()["misses"] == 2 and len(c) == 0
+
+
+def test_presign_reprice_drops_far_templates():
+    c = PresignCache(ttl_sec=10.0, band=0.01)
+    for px in (0.61, 0.62, 0.63):
+        c.put("tok", 5.0, px, px, now=0.0)
+    c.reprice("tok", 0.64)
+    assert c.missing("tok", 5.0, [0.61, 0.62, 0.63], now=1.0) == [0.61, 0.62]
+    c.reprice("tok", 0.70)
+    assert not c.has("tok")
+
+
+def test_latency_histogram_percentiles():
+    h = LatencyHistogram((10.0, 50.0, 100.0))
+    for ms in (3, 4, 5, 30, 80, 400):
+        h.observe(ms)
+    snap = h.snapshot()
+    assert snap["n"] == 6 and snap["max_ms"] == 400
+    assert snap["p50_ms"] == 10.0 and snap["p99_ms"] == 100.0
+    assert snap["buckets"] == {"le_10": 3, "le_50": 1, "le_100": 1, "inf": 1}
@@ -0,0 +1,29 @@
+from clawbot_v2.data.price_ring import PriceRing
+
+
+def test_price_ring_wraps_and_windows() -> None:
+    ring = PriceRing(maxlen=5)
+    for i in range(8):
+        ring.append(100.0 + i, 10.0 + i)
+    assert len(ring) == 5
+    assert list(ring)[0] == (103.0, 13.0)
+    assert ring[-1] == (107.0, 17.0)
+    assert ring.last_ts() == 107.0
+    assert ring.first_in(104.0, 106.0) == 14.0
+    assert ring.last_in(104.0, 106.0) == 16.0
+    assert ring.last_in(200.0, 300.0) == 0.0
+    a, b = ring.bounds(104.0, 106.0, closed=False)
+    assert b - a == 2
+    assert [p for _, p in ring.since(106.0)] == [16.0, 17.0]
+
+
+def test_price_ring_tick_rms_matches_direct() -> None:
+    ring = PriceRing(maxlen=4)
+    pts = [100.0, 101.0, 99.0, 100.5, 102.0, 101.0]
+    for i, p in enumerate(pts):
+        ring.append(float(i), p)
+    a, b = ring.bounds(3.0, 5.0)
+    rms, n = ring.tick_rms(a, b)
+    moves = [pts[i] / pts[i - 1] - 1 for i in (4, 5)]
+    assert n == 2
+    assert abs(rms - (sum(m * m for m in moves) / 2) ** 0.5) < 1e-12
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from clawbot_v2.data.resolved_index import ResolvedSampleIndex
+
+
+def _brute(rows, match, last_n=None, per_group_n=None, min_ts=None):
+    if last_n is not None:
+        rows = rows[-last_n:]
+    vals = [r for r in rows if match(r[0]) and (min_ts is None or r[1] >= min_ts)]
+    if per_group_n is not None:
+        vals = vals[-per_group_n:]
+    n = len(vals)
+    wins = sum(r[3] for r in vals)
+    pnl = sum(r[2] for r in vals)
+    return n, wins, pnl
+
+
+def test_resolved_index_windows_match_brute_force() -> None:
+    rng = random.Random(7)
+    idx = ResolvedSampleIndex(maxlen=300)
+    idx.add_window("side", (lambda k: k[:3],), last_n=120, max_age_s=500.0)
+    idx.add_window("entry", (lambda k: k, lambda k: k[:4]), last_n=250)
+    rows = []
+    for t in range(900):
+        key = (rng.choice("AB"), rng.choice((5, 15)), rng.choice(("Up", "Down")), rng.choice(("<45c", "65c+")), rng.random() < 0.5)
+        pnl = round(rng.uniform(-3, 3), 2)
+        rows.append((key, float(t), pnl, pnl > 0))
+        idx.add(key, float(t), pnl, pnl > 0)
+        if t == 400:
+            idx.add_window("horizon", (lambda k: k[1],), last_n=40, per_group=True)  # filled from the ring
+    now = 899.0
+    for key in {r[0] for r in rows}:
+        agg = idx.get("side", key[:3], now)
+        n, wins, pnl = _brute(rows, lambda k: k[:3] == key[:3], last_n=120, min_ts=now - 500.0)
+        assert (agg.n, agg.wins) == (n, wins) and agg.pnl == pytest.approx(pnl)
+        for g in (key, key[:4]):
+            agg = idx.get("entry", g)
+            n, wins, pnl = _brute(rows, lambda k: k[:len(g)] == g, last_n=250)
+            assert (agg.n, agg.wins) == (n, wins) and agg.pnl == pytest.approx(pnl)
+    for d in (5, 15):
+        agg = idx.get("horizon", d)
+        n, wins, pnl = _brute(rows, lambda k: k[1] == d, per_group_n=40)
+        assert (agg.n, agg.wins) == (n, wins) and agg.pnl == pytest.approx(pnl)
+
+
+def test_resolved_index_empty_and_profit_factor() -> None:
+    idx = ResolvedSampleIndex(maxlen=4)
+    idx.add_window("all", (lambda k: k[1],), last_n=2)
+    assert idx.get("all", 5).n == 0 and idx.get("all", 5).pf == 1.0
+    idx.add(("A", 5, "Up", "<45c", True), 1.0, -0.1, False)
+    idx.add(("A", 5, "Up", "<45c", True), 2.0, 0.3, True)
+    idx.add(("A", 5, "Up", "<45c", True), 3.0, 0.2, True)  # evicts the only loss
+    agg = idx.get("all", 5)
+    assert (agg.n, agg.wins, agg.gross_loss, agg.pf) == (2, 2, 0.0, 2.0)
+
+
+def test_resolved_index_per_group_drops_quiet_group_on_ring_wrap() -> None:
+    idx = ResolvedSampleIndex(maxlen=10)
+    idx.add_window("horizon", (lambda k: k[1],), last_n=3, per_group=True)
+    rows = []
+    for t in range(3):
+        key = ("A", 15, "Up", "<45c", True)
+        rows.append((key, float(t), -1.0, False))
+        idx.add(key, float(t), -1.0, False)
+    for t in range(3, 25):  # 15m goes quiet while the ring wraps twice
+        key = ("A", 5, "Up", "<45c", True)
+        rows.append((key, float(t), 5.0, True))
+        idx.add(key, float(t), 5.0, True)
+    assert idx.get("horizon", 15).n == 0
+    agg = idx.get("horizon", 5)
+    assert (agg.n, agg.wins, agg.gross_loss) == (3, 3, 0.0) and agg.pnl == pytest.approx(15.0)
+    n, wins, pnl = _brute(rows, lambda k: k[1] == 5, last_n=10, per_group_n=3)
+    assert (agg.n, agg.wins) == (n, wins) and agg.pnl == pytest.approx(pnl)
@@ -0,0 +1,33 @@
+import asyncio
+
+from clawbot_v2.strategy import core
+
+
+class _Trader:
+    def __init__(self):
+        self.snapshots = 0
+        self.calls = []
+
+    def _feature_snapshot(self, assets=None):
+        self.snapshots += 1
+        return f"snap{self.snapshots}"
+
+    async def _score_market(self, m, snap=None):
+        self.calls.append((m["conditionId"], snap))
+        await asyncio.sleep(0)
+        return {"cid": m["conditionId"], "snap": snap}
+
+
+MARKETS = [{"conditionId": "a"}, {"conditionId": "b"}, {"conditionId": "c"}]
+
+
+def test_score_batch_matches_per_market_calls_on_one_snapshot() -> None:
+    trader = _Trader()
+    out = asyncio.run(core.score_batch(trader, MARKETS))
+    assert trader.snapshots == 1
+    assert {snap for _, snap in trader.calls} == {"snap1"}
+
+    ref = _Trader()
+    expected = [asyncio.run(ref._score_market(m, "snap1")) for m in MARKETS]
+    assert out == expected
+
@@ -0,0 +1,14 @@
+from clawbot_v2.data.score_cache import ScoreCache
+
+
+def test_score_cache_lru_ttl_and_counters() -> None:
+    c = ScoreCache(maxsize=2, ttl=1.0)
+    assert c.get(("a", 1), 0.0) is ScoreCache.MISS
+    c.put(("a", 1), None, 0.0)
+    c.put(("b", 1), {"side": "Up"}, 0.0)
+    assert c.get(("a", 1), 0.5) is None  # cached None is a hit
+    c.put(("c", 1), {}, 0.5)  # evicts ("b", 1), the least recently used
+    assert c.get(("b", 1), 0.5) is ScoreCache.MISS
+    assert c.get(("a", 2), 0.5) is ScoreCache.MISS  # bumped version -> new key
+    assert c.get(("a", 1), 1.2) is ScoreCache.MISS  # expired
+    assert c.stats() == {"hits": 1, "misses": 4, "hit_rate": 0.2, "size": 2, "evictions": 1}
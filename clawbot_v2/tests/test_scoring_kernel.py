@@ -0,0 +1,49 @@
+from collections import namedtuple
+from dataclasses import replace
+
+from clawbot_v2.strategy.features import AssetFeatures
+from clawbot_v2.strategy.kernel import ScoringConfig, ScoringInputs, ScoringKernel, ScoringPriors
+
+Bnb = namedtuple("Bnb", "klines_n trend_ret20")
+
+
+def _feats(**kw) -> AssetFeatures:
+    base = dict(
+        asset="ETH", ts=0.0, mom_5s=0.6, mom_30s=0.6, mom_60s=0.6, mom_180s=0.6, mom_kal=0.6,
+        ob_imbalance=0.2, dw_ob=0.3, taker_ratio=0.65, vol_ratio=1.5, perp_basis=0.0006,
+        funding_rate=0.0, autocorr=0.1, vr_ratio=1.1, rsi=70.0, williams_r=-10.0,
+        is_jump=False, jump_dir=None, jump_z=0.0, btc_lead_p=0.65, surge_ofi=0.5,
+        liq_up=1, liq_down=0, bnb=Bnb(klines_n=10, trend_ret20=0.001),
+    )
+    base.update(kw)
+    return AssetFeatures(**base)
+
+
+def _inputs(**kw) -> ScoringInputs:
+    base = dict(
+        asset="ETH", duration=15, up_price=0.5, pct_remaining=0.9, current=2010.0, open_price=2000.0,
+        prev_open=1990.0, cl_now=2010.0, rtds_now=2010.0, cl_age_s=2.0, feats=_feats(),
+        cross_up=3, ema5=2010.0, ema60=2000.0, kalman_vel=0.01,
+    )
+    base.update(kw)
+    return ScoringInputs(**base)
+
+
+def test_kernel_scores_aligned_up_move() -> None:
+    k = ScoringKernel()
+    sig = k.evaluate(_inputs(), vwap_dev=0.002)
+    assert sig.call.direction == "Up" and sig.call.cl_agree and sig.call.tf_votes == 4
+    assert sig.cross_count == 3 and sig.imbalance_confirms
+    assert sig.score > sig.call.score > 0
+    assert 0.5 < sig.prob_up <= 0.95 and abs(sig.prob_up + sig.prob_down - 1.0) < 1e-12
+    assert k.evaluate(_inputs(), vwap_dev=0.002) == sig  # deterministic
+
+
+def test_kernel_flips_on_down_move_and_applies_priors() -> None:
+    k = ScoringKernel(replace(ScoringConfig(), tie_bias_up=0.0))
+    down = _inputs(current=1990.0, cl_now=1990.0, rtds_now=1990.0, feats=_feats(mom_5s=0.4, mom_30s=0.4, mom_180s=0.4, mom_kal=0.4))
+    assert k.direction(down).direction == "Down"
+    flat = k.evaluate(replace(_inputs(), priors=ScoringPriors(shrink=0.0)))
+    assert flat.prob_up == 0.5
+    cfg = ScoringConfig.from_constants({"LLR_CLAMP": 1.0, "UNRELATED": 3})
+    assert cfg.llr_clamp == 1.0 and cfg.llr_price_mult == ScoringConfig().llr_price_mult
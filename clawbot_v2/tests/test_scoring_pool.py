@@ -0,0 +1,46 @@
+import asyncio
+from collections import namedtuple
+from dataclasses import replace
+
+from clawbot_v2.strategy.features import AssetFeatures
+from clawbot_v2.strategy.kernel import ScoringConfig, ScoringInputs
+from clawbot_v2.strategy.scoring_pool import ScoringExecutor
+
+
+def _jobs():
+    Record = namedtuple("Record", "klines_n trend_ret20")  # like SeqlockTable: not picklable by reference
+    feats = AssetFeatures(
+        asset="SOL", ts=0.0, mom_5s=0.6, mom_30s=0.5, mom_60s=0.5, mom_180s=0.4, mom_kal=0.6,
+        ob_imbalance=0.1, dw_ob=0.2, taker_ratio=0.58, vol_ratio=1.4, perp_basis=0.0003,
+        funding_rate=0.0001, autocorr=0.0, vr_ratio=1.0, rsi=60.0, williams_r=-30.0,
+        is_jump=False, jump_dir=None, jump_z=0.0, btc_lead_p=0.57, surge_ofi=0.6,
+        liq_up=0, liq_down=1, bnb=Record(0, 0.0),
+    )
+    out = []
+    for i in range(6):
+        px = 150.0 + (i - 3) * 0.2
+        inp = ScoringInputs(
+            asset="SOL", duration=15, up_price=0.5, pct_remaining=0.8, current=px, open_price=150.0,
+            prev_open=149.5, cl_now=px, rtds_now=px, cl_age_s=3.0,
+            feats=replace(feats, bnb=Record(10, 0.0005 * i)), cross_up=i % 4, ema5=px, ema60=150.0,
+        )
+        out.append((inp, 0.0003 * i))
+    return out
+
+
+def test_scoring_pool_matches_inline_and_falls_back() -> None:
+    jobs = _jobs()
+    cfg = ScoringConfig()
+    inline = ScoringExecutor(cfg)
+    expected = asyncio.run(inline.evaluate_many(jobs))
+    assert inline.inline_n == len(jobs) and not inline.running
+
+    ex = ScoringExecutor(cfg, workers=2, min_batch=4, bnb_fields=("klines_n", "trend_ret20"))
+    ex.start()
+    try:
+        assert asyncio.run(ex.evaluate_many(jobs)) == expected
+        assert ex.pool_n == len(jobs) and ex.pool_batches == 1
+        assert asyncio.run(ex.evaluate_many(jobs[:2])) == expected[:2]  # small batch stays inline
+        assert ex.inline_n == 2
+    finally:
+        ex.shutdown()
@@ -0,0 +1,46 @@
+import threading
+import uuid
+
+from clawbot_v2.data.seqlock import SeqlockTable
+
+
+def test_seqlock_publish_read_and_defaults() -> None:
+    t = SeqlockTable(("ts", "rsi"), ("BTC", "ETH"), defaults={"rsi": 50.0})
+    assert t.read("ETH").rsi == 50.0
+    assert t.read("DOGE") == t.default
+    t.publish("BTC", (1.0, 70.0))
+    assert t.read("BTC") == (1.0, 70.0)
+    assert t.seq % 2 == 0
+
+
+def test_seqlock_reader_never_sees_torn_rows() -> None:
+    t = SeqlockTable(("a", "b", "c"), ("X",))
+    stop = threading.Event()
+
+    def writer() -> None:
+        i = 0.0
+        while not stop.is_set():
+            i += 1.0
+            t.publish("X", (i, i, i))
+
+    th = threading.Thread(target=writer)
+    th.start()
+    try:
+        for _ in range(20000):
+            r = t.read("X")
+            assert r.a == r.b == r.c
+    finally:
+        stop.set()
+        th.join()
+
+
+def test_seqlock_shared_memory_attach() -> None:
+    name = "clawbot_test_" + uuid.uuid4().hex[:8]
+    w = SeqlockTable(("x",), ("A",), shm_name=name)
+    r = SeqlockTable(("x",), ("A",), shm_name=name, create=False)
+    try:
+        w.publish("A", (3.5,))
+        assert r.read("A").x == 3.5
+    finally:
+        r.close()
+        w.close(unlink=True)
@@ -0,0 +1,18 @@
+from clawbot_v2.infra.skip_counters import SkipCounters
+
+
+def test_skip_counters_rolling_top_and_prometheus() -> None:
+    c = SkipCounters(bucket_sec=10, horizon_sec=60)
+    for _ in range(3):
+        c.tick("cl_age", now=100.0)
+    c.tick("volume", now=105.0)
+    c.tick("volume", now=150.0)
+    c.tick("volume", now=155.0)
+    assert c.top(60, 2, now=155.0) == (6, [("cl_age", 3), ("volume", 3)])
+    assert c.top(20, 5, now=155.0) == (2, [("volume", 2)])  # buckets 140-159 only
+    c.tick('say "hi"', now=175.0)  # reuses the slot that held t=100
+    assert c.window(60, now=175.0) == {"volume": 2, 'say "hi"': 1}
+    assert c.totals == {"cl_age": 3, "volume": 3, 'say "hi"': 1}
+    text = c.prometheus()
+    assert "# TYPE clawbot_skip_total counter" in text
+    assert 'clawbot_skip_total{reason="say \\"hi\\""} 1' in text
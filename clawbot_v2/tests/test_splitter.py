@@ -0,0 +1,68 @@
+import asyncio
+
+from clawbot_v2.execution.splitter import BankrollReservation, ChildOrder, execute_split, plan_fok_children
+
+
+def test_plan_groups_levels_under_cap():
+    asks = [(0.50, 4.0), (0.51, 10.0), (0.52, 10.0), (0.60, 100.0)]
+    kids = plan_fok_children(asks, 12.0, 0.55, min_child_usdc=1.0, max_children=4)
+    assert [c.usdc for c in kids] == [2.0, 5.1, 4.9]
+    assert {c.price for c in kids} == {0.52}
+    assert sum(c.usdc for c in kids) == 12.0
+
+
+def test_plan_thin_book_and_child_limit():
+    asks = [(0.50, 1.0), (0.51, 1.0), (0.52, 20.0)]
+    kids = plan_fok_children(asks, 30.0, 0.52, min_child_usdc=1.0, max_children=2)
+    assert len(kids) == 2 and kids[0].usdc == 1.01
+    assert round(sum(c.usdc for c in kids), 2) == round(0.50 + 0.51 + 10.4, 2)
+    assert plan_fok_children(asks, 30.0, 0.49) == []
+
+
+def test_execute_split_aggregates_and_reports_each_child():
+    kids = [ChildOrder(0.52, 2.0, 0.50), ChildOrder(0.52, 5.0, 0.51), ChildOrder(0.52, 3.0, 0.52)]
+    settled = []
+
+    async def post(c):
+        if c.usdc == 5.0:
+            return {"status": "killed"}, c.price
+        if c.usdc == 3.0:
+            return {"status": "matched", "orderID": "b", "makingAmount": "3", "takingAmount": "6"}, c.price
+        return {"status": "matched", "orderID": "a"}, c.price
+
+    res = asyncio.run(execute_split(kids, post, on_child=lambda c, f: settled.append((c.usdc, f))))
+    assert res.filled == 2 and res.killed == 1 and res.filled_usdc == 5.0
+    assert res.shares == 10.0 and res.avg_price == 0.5
+    assert sorted(settled) == [(2.0, 2.0), (3.0, 3.0), (5.0, 0.0)]
+
+
+def test_reservation_tracks_mixed_split_fills():
+    class Trader:
+        bankroll = 100.0
+        _reserved_bankroll = 7.0  # another trade in flight
+
+    t = Trader()
+    res = BankrollReservation(t, 10.0)
+    kids = [ChildOrder(0.52, 4.0, 0.50), ChildOrder(0.52, 6.0, 0.52)]
+
+    async def post(c):
+        return ({"status": "matched"} if c.usdc == 4.0 else {"status": "killed"}), c.price
+
+    out = asyncio.run(execute_split(kids, post, on_child=lambda c, f: res.spend(f)))
+    assert out.filled_usdc == 4.0
+    assert t.bankroll == 96.0 and t._reserved_bankroll == 13.0 and res.left == 6.0
+    res.release()
+    res.release()
+    assert t._reserved_bankroll == 7.0 and t.bankroll == 96.0
+
+
+def test_reservation_never_releases_other_trades_share():
+    class Trader:
+        bankroll = 50.0
+        _reserved_bankroll = 3.0
+
+    t = Trader()
+    res = BankrollReservation(t, 2.0)
+    res.spend(2.5)  # order bumped above its reserved size
+    res.release()
+    assert t._reserved_bankroll == 3.0 and t.bankroll == 47.5
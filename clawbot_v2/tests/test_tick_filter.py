@@ -0,0 +1,28 @@
+import math
+
+from clawbot_v2.data.tick_filter import TickFilter
+
+
+def test_tick_filter_ema_seed_and_decay() -> None:
+    tf = TickFilter(["BTC", "ETH"], half_lives=(5, 60))
+    tf.update(0, 100.0, 1000.0, 0.6)
+    assert tf.ema_of("BTC", 5) == tf.ema_of("BTC", 60) == 100.0
+    assert tf.ema_of("ETH", 5) == 0.0
+    tf.update(0, 110.0, 1005.0, 0.6)
+    assert abs(tf.ema_of("BTC", 5) - (100.0 + (1 - math.exp(-1.0)) * 10.0)) < 1e-9
+    assert tf.ema_of("BTC", 5) > tf.ema_of("BTC", 60) > 100.0
+    assert tf.nearest_half_life(30) == 5
+    assert tf.kalman_state("BTC")[0] > 100.0
+    assert tf.kalman_state("ETH") is None
+
+
+def test_tick_filter_batch_matches_sequential() -> None:
+    ticks = [(1000.0 + i * 0.7, 50.0 + math.sin(i) * 0.3) for i in range(40)]
+    a = TickFilter(["SOL"])
+    b = TickFilter(["SOL"])
+    for ts, px in ticks:
+        a.update(0, px, ts, 1.2)
+    b.update_batch(0, ticks, 1.2)
+    assert list(a.ema) == list(b.ema)
+    assert a.kalman_state("SOL") == b.kalman_state("SOL")
+    assert a.last_ts("SOL") == b.last_ts("SOL") == ticks[-1][0]
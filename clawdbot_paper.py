@@ -16,7 +16,7 @@ import math
 import csv
 import os
 from datetime import datetime, timezone
-from scipy.stats import norm
+from clawbot_v2.strategy.numerics import ncdf
 
 # ── CONFIG ────────────────────────────────────────────────────────────────────
 BANKROLL       = 1000.0
@@ -463,7 +463,7 @@ class PaperTrader:
         # But this ignores remaining time randomness correctly:
         # P(end ≥ open | current, T_left) = N(log(current/open) / (vol*sqrt(T_left)))
         d = math.log(current / open_price) / (vol * math.sqrt(T))
-        return float(norm.cdf(d))
+        return ncdf(d)
 
     # ── STATS ─────────────────────────────────────────────────────────────────
     async def stats_loop(self):
@@ -32,23 +32,11 @@ class PredictionAgent:
         margin = z * math.sqrt((phat * (1 - phat) + z * z / (4 * n)) / n)
         return max(0.0, min(1.0, (center - margin) / den))
 
-    def _sample_prior(self, resolved_samples, asset: str, duration: int, side: str):
-        wins = 0
-        n = 0
-        pnl = 0.0
-        for s in reversed(resolved_samples):
-            if str(s.get("asset", "")) != asset:
-                continue
-            if int(s.get("duration", 0) or 0) != duration:
-                continue
-            if str(s.get("side", "")) != side:
-                continue
-            n += 1
-            if bool(s.get("won", False)):
-                wins += 1
-            pnl += float(s.get("pnl", 0.0) or 0.0)
-            if n >= 200:
-                break
+    def _sample_prior(self, resolved_index, asset: str, duration: int, side: str):
+        # Last 200 settled samples per (asset, duration, side), kept
+        # incrementally by the trader's ResolvedSampleIndex ("pred_side" window).
+        agg = resolved_index.get("pred_side", (asset, duration, side))
+        wins, n, pnl = agg.wins, agg.n, agg.pnl
         if n <= 0:
             return 0.5, 0.5, 0.0, 0
         wr = wins / n
@@ -153,7 +141,7 @@ class PredictionAgent:
             self._last_switch_ts = now
         return self._active_variant, scores
 
-    def predict(self, context: dict, resolved_samples, bucket_rows: dict):
+    def predict(self, context: dict, resolved_index, bucket_rows: dict):
         asset = str(context.get("asset", "") or "")
         duration = int(context.get("duration", 0) or 0)
         side = str(context.get("side", "") or "")
@@ -167,7 +155,7 @@ class PredictionAgent:
         quote_age_ms = float(context.get("quote_age_ms", 9e9) or 9e9)
         analysis_quality = float(context.get("analysis_quality", 0.5) or 0.5)
 
-        wr, wr_lb, exp, n_side = self._sample_prior(resolved_samples, asset, duration, side)
+        wr, wr_lb, exp, n_side = self._sample_prior(resolved_index, asset, duration, side)
         b_wr_lb, b_exp, b_n = self._bucket_prior(bucket_rows, bucket_key)
 
         move_pct = 0.0